@@ -0,0 +1,200 @@
+"""
+Allocation Tracker Module for LinkedIn Future Career Planning Platform
+
+This module wraps tracemalloc so memory behaviour can be measured on a running
+server. Tracing is switched on and off at runtime; while it is off the request
+hooks only read one attribute. While it is on, the tracker records per route:
+- how many memory blocks and bytes each request left allocated
+- the top allocation sites (file:line) across the process
+- the difference between two named snapshots, to find what grows over time
+
+tracemalloc and sys.getallocatedblocks() are process-wide, so per-request
+numbers include whatever other threads allocated at the same time. Averages
+over many requests (or a single-threaded run) are the meaningful figures.
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+import tracemalloc
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Traces from these files describe the tracer itself, not the app
+_IGNORED_TRACES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>')
+)
+
+
+class RouteAllocations:
+    """Running totals of the allocations made by one route's requests"""
+
+    __slots__ = ('requests', 'blocks', 'bytes', 'max_bytes')
+
+    def __init__(self):
+        self.requests = 0
+        self.blocks = 0
+        self.bytes = 0
+        self.max_bytes = 0
+
+    def add(self, blocks: int, size: int) -> None:
+        self.requests += 1
+        self.blocks += blocks
+        self.bytes += size
+        self.max_bytes = max(self.max_bytes, size)
+
+    def to_dict(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'avg_blocks': round(self.blocks / self.requests, 1),
+            'avg_bytes': round(self.bytes / self.requests, 1),
+            'max_bytes': self.max_bytes
+        }
+
+
+class AllocationTracker:
+    """Runtime-toggled tracemalloc instrumentation with per-route totals"""
+
+    def __init__(self, max_snapshots: int = 8):
+        self.max_snapshots = max_snapshots
+        self.routes = {}
+        self.snapshots = OrderedDict()
+        self.enabled_at = None
+        self._snapshot_counter = 0
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def enable(self, frames: int = 1) -> None:
+        """Start tracing with the given traceback depth (restarts if already on)"""
+        if tracemalloc.is_tracing():
+            if tracemalloc.get_traceback_limit() == frames:
+                return
+            tracemalloc.stop()
+        tracemalloc.start(frames)
+        self.enabled_at = time.time()
+        logger.info("tracemalloc enabled with %d frame(s)", frames)
+
+    def disable(self) -> None:
+        """Stop tracing; this frees all traces and the stored snapshots"""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("tracemalloc disabled")
+        self.enabled_at = None
+        with self._lock:
+            self.snapshots.clear()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes.clear()
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+    def begin_request(self):
+        """Return the counters to diff against when the request ends"""
+        return sys.getallocatedblocks(), tracemalloc.get_traced_memory()[0]
+
+    def end_request(self, route: str, start) -> None:
+        start_blocks, start_bytes = start
+        blocks = sys.getallocatedblocks() - start_blocks
+        size = tracemalloc.get_traced_memory()[0] - start_bytes
+        with self._lock:
+            totals = self.routes.get(route)
+            if totals is None:
+                totals = self.routes[route] = RouteAllocations()
+            totals.add(blocks, size)
+
+    def top_sites(self, limit: int = 20, group_by: str = 'lineno') -> List[Dict]:
+        """Largest live allocation sites right now"""
+        if not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+        return [self._stat_to_dict(stat) for stat in snapshot.statistics(group_by)[:limit]]
+
+    def take_snapshot(self, label: Optional[str] = None) -> str:
+        """Store a snapshot for later diffs and return its ID"""
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not enabled")
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+        with self._lock:
+            self._snapshot_counter += 1
+            snapshot_id = label or str(self._snapshot_counter)
+            self.snapshots[snapshot_id] = (time.time(), snapshot)
+            self.snapshots.move_to_end(snapshot_id)
+            while len(self.snapshots) > self.max_snapshots:
+                self.snapshots.popitem(last=False)
+        return snapshot_id
+
+    def diff(self, base_id: str, target_id: Optional[str] = None, limit: int = 20,
+             group_by: str = 'lineno') -> Dict:
+        """Compare two stored snapshots (or one against the current heap)"""
+        with self._lock:
+            if base_id not in self.snapshots or (target_id and target_id not in self.snapshots):
+                raise KeyError(target_id if base_id in self.snapshots else base_id)
+            base_time, base = self.snapshots[base_id]
+            target_time, target = self.snapshots[target_id] if target_id else (None, None)
+
+        if target is None:
+            if not tracemalloc.is_tracing():
+                raise RuntimeError("tracemalloc is not enabled")
+            target_time = time.time()
+            target = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+
+        stats = target.compare_to(base, group_by)
+        return {
+            'base': base_id,
+            'target': target_id or 'current',
+            'elapsed_seconds': round(target_time - base_time, 3),
+            'size_diff_bytes': sum(stat.size_diff for stat in stats),
+            'count_diff': sum(stat.count_diff for stat in stats),
+            'top': [self._stat_to_dict(stat) for stat in stats[:limit]]
+        }
+
+    @staticmethod
+    def _stat_to_dict(stat) -> Dict:
+        frame = stat.traceback[0]
+        entry = {
+            'site': f'{frame.filename}:{frame.lineno}',
+            'size_bytes': stat.size,
+            'count': stat.count
+        }
+        if hasattr(stat, 'size_diff'):
+            entry['size_diff_bytes'] = stat.size_diff
+            entry['count_diff'] = stat.count_diff
+        if len(stat.traceback) > 1:
+            entry['traceback'] = [f'{f.filename}:{f.lineno}' for f in stat.traceback]
+        return entry
+
+    def get_stats(self) -> Dict:
+        current, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            routes = {route: totals.to_dict() for route, totals in sorted(self.routes.items())}
+            snapshots = list(self.snapshots)
+        return {
+            'enabled': tracemalloc.is_tracing(),
+            'frames': tracemalloc.get_traceback_limit() if tracemalloc.is_tracing() else 0,
+            'traced_bytes': current,
+            'traced_peak_bytes': peak,
+            'tracemalloc_overhead_bytes': tracemalloc.get_tracemalloc_memory(),
+            'allocated_blocks': sys.getallocatedblocks(),
+            'routes': routes,
+            'snapshots': snapshots
+        }
+
+
+# Global instance for easy access
+allocation_tracker = AllocationTracker(max_snapshots=int(os.getenv('TRACEMALLOC_MAX_SNAPSHOTS', '8')))
+
+if int(os.getenv('TRACEMALLOC_FRAMES', '0')) > 0:
+    allocation_tracker.enable(int(os.getenv('TRACEMALLOC_FRAMES')))
@@ -1,45 +1,233 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, g, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 import os
+import hmac
+import json
+import math
+import time
 import logging
+from functools import wraps
 from predefined_responses import predefined_manager
 from linkedin_profile_analyzer import linkedin_analyzer
+from request_scheduler import request_scheduler, SchedulerOverloaded
+from degradation_controller import degradation_controller
+from rate_limiter import llm_rate_limiter, RateLimited
+import metrics
+from request_profiler import request_profiler
+from logging_config import setup_logging, current_route
+from allocation_tracker import allocation_tracker
+from warmup import warmup
+from prefetcher import speculative_prefetcher
+from llm_integration import llm_generator
+from response_cache import ResponseCache
+from preferences import normalize_preferences, preferences_key
+from profile_record import ProfileRecord
+from request_schemas import (ChatRequest, ConnectLinkedInRequest, RequestValidationError, create_json_encoder,
+                             decode_json, decode_request)
+from conversation_memory import conversation_memory, refers_back
+from transcript_log import transcript_log
+from traffic_recorder import traffic_recorder, RECORDED_ROUTES
+from heavy_hitters import question_tracker, pinned_answers, promote_top_questions
+
+class AppJSONProvider(DefaultJSONProvider):
+    """Flask JSON through msgspec's compiled encoder; also serializes profile records, wherever they are nested"""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._encoder = create_json_encoder(self.default)
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, ProfileRecord):
+            return o.to_dict()
+        if hasattr(o, '__html__'):
+            return str(o.__html__())
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            # Callers asking for json.dumps options (indent, ...) get the standard library
+            return super().dumps(obj, **kwargs)
+        return self._encoder.encode(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return decode_json(s) if not kwargs else super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        return self._app.response_class(self._encoder.encode(self._prepare_response_obj(args, kwargs)),
+                                        mimetype=self.mimetype)
 
 app = Flask(__name__)
+app.json = AppJSONProvider(app)
 
 # Configure Flask app
 app.config['SECRET_KEY'] = 'linkedin-future-secret-key-2024'
 app.config['TEMPLATES_AUTO_RELOAD'] = True
 
+# Token for the /api/admin/* routes; without it they all answer 403
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN') or None
+
+def require_admin(view):
+    """Reject requests whose X-Admin-Token header does not match ADMIN_TOKEN"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = request.headers.get('X-Admin-Token')
+        if not (ADMIN_TOKEN and token is not None and hmac.compare_digest(token, ADMIN_TOKEN)):
+            return jsonify({'error': 'Admin token required'}), 403
+        return view(*args, **kwargs)
+    return wrapper
+
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+setup_logging()
 logger = logging.getLogger(__name__)
 
+MAX_SESSION_ID_CHARS = 128
+
+def get_session_id():
+    """The client's X-Session-ID header, or None when missing or implausibly long"""
+    session_id = request.headers.get('X-Session-ID')
+    if session_id and len(session_id) <= MAX_SESSION_ID_CHARS:
+        return session_id
+    return None
+
+def get_client_key():
+    """Identify the caller by session ID when the client sends one, else by IP"""
+    session_id = get_session_id()
+    if session_id:
+        return f'session:{session_id}'
+    return f'ip:{request.remote_addr}'
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    # Route pattern tags (and selects the sampling rate for) this request's log lines
+    g.log_route_token = current_route.set(request.url_rule.rule if request.url_rule else 'unmatched')
+
+@app.teardown_request
+def clear_log_route(error=None):
+    token = g.pop('log_route_token', None)
+    if token is not None:
+        current_route.reset(token)
+
+@app.after_request
+def record_request_latency(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        # Use the route pattern, not the raw path, to keep label cardinality bounded
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.http_request_duration.observe(time.perf_counter() - started, route, request.method, str(response.status_code))
+    return response
+
+if request_profiler.enabled:
+    # Hooks are only installed when profiling is configured, so it costs nothing otherwise
+    @app.before_request
+    def start_request_profile():
+        if request_profiler.should_profile(request.headers.get('X-Profile')):
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            g.profile_handle = request_profiler.start(route)
+
+    @app.teardown_request
+    def stop_request_profile(error=None):
+        handle = g.pop('profile_handle', None)
+        if handle is not None:
+            request_profiler.stop(handle)
+
+if traffic_recorder is not None:
+    # Installed only while recording, like the profiling hooks
+    @app.before_request
+    def start_traffic_capture():
+        if request.url_rule is not None and request.url_rule.rule in RECORDED_ROUTES:
+            g.traffic_capture = traffic_recorder.capture(request)
+
+    @app.after_request
+    def finish_traffic_capture(response):
+        capture = g.pop('traffic_capture', None)
+        if capture is not None:
+            traffic_recorder.finish(capture, response.status_code)
+        return response
+
+@app.before_request
+def start_allocation_tracking():
+    if allocation_tracker.active:
+        g.allocation_start = allocation_tracker.begin_request()
+
+@app.after_request
+def record_request_allocations(response):
+    start = g.pop('allocation_start', None)
+    if start is not None and allocation_tracker.active:
+        allocation_tracker.end_request(request.url_rule.rule if request.url_rule else 'unmatched', start)
+    return response
+
 @app.route('/')
 def index():
     """Main route - serves the LinkedIn Future career planning platform"""
     app.logger.info('Main page accessed')
-    return render_template('index.html')
+    with metrics.template_render_duration.time('index.html'):
+        # The default filters' recommendations ride along, so the page needs no follow-up fetch
+        return render_template('index.html', initial_recommendations=get_initial_recommendations_json())
+
+@app.route('/readyz', methods=['GET'])
+def readiness():
+    """Readiness probe - 503 until startup warm-up has finished"""
+    # A server that imported app directly (not wsgi.py) starts warming up on its first probe
+    start_warmup()
+    state = warmup.get_state()
+    state['status'] = 'ready' if state['ready'] else 'warming_up'
+    return jsonify(state), 200 if state['ready'] else 503
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus scrape endpoint"""
+    return Response(metrics.registry.render(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/api/chat', methods=['POST'])
 def chat():
     """API endpoint for chat functionality"""
-    data = request.get_json()
-    user_message = data.get('message', '')
-    
-    app.logger.info(f'Chat request received: {user_message[:50]}...')
-    
-    # Get user preferences from request (default to default preferences)
-    user_preferences = data.get('preferences', {
-        'interests': ['Technology', 'Leadership'],
-        'career_level': 'Entry Level',
-        'goal': 'advancement',
-        'industry': 'All Industries',
-        'location': 'Remote',
-        'experience': '3-5 years'
-    })
+    body = decode_request(request, ChatRequest)
+    user_message = body.message
+    
+    app.logger.info('Chat request received: %.50s...', user_message)
+    
+    # Canonical preferences (default preferences when none were sent), decoded once for every cache below
+    user_preferences = body.user_preferences()
     
-    # Use predefined responses if applicable
-    response = predefined_manager.get_response(user_message, user_preferences)
+    # Optional per-request latency target; the model router avoids tiers expected to miss it
+    latency_target = body.latency_target_ms / 1000.0 if body.latency_target_ms else None
+    
+    # Earlier turns of this chat session, so follow-up questions keep their context; standalone ones stay cacheable
+    session_id = get_session_id()
+    history = None
+    if conversation_memory is not None and refers_back(user_message):
+        history = conversation_memory.context(session_id)
+    
+    # Serve predefined answers immediately; LLM work goes through the bounded pool
+    try:
+        response = request_scheduler.get_response(user_message, user_preferences, client_key=get_client_key(),
+                                                  latency_target=latency_target, history=history)
+    except RateLimited as e:
+        app.logger.warning('Chat request rate limited')
+        limited = jsonify({
+            'error': 'Too many questions in a short time. Please slow down a little.',
+            'status': 'rate_limited'
+        })
+        limited.status_code = 429
+        limited.headers['Retry-After'] = str(math.ceil(e.retry_after))
+        return limited
+    except SchedulerOverloaded as e:
+        app.logger.warning('Chat request rejected: LLM queue is full')
+        overloaded = jsonify({
+            'error': 'The assistant is busy right now. Please try again shortly.',
+            'status': 'overloaded'
+        })
+        overloaded.status_code = 503
+        overloaded.headers['Retry-After'] = str(e.retry_after)
+        return overloaded
+    
+    if conversation_memory is not None:
+        conversation_memory.record(session_id, user_message, response)
+    if transcript_log is not None:
+        transcript_log.append(session_id, user_message, response,
+                              duration_ms=round((time.perf_counter() - g.request_started) * 1000, 1))
     
     app.logger.info('Chat response generated successfully')
     
@@ -56,18 +244,38 @@ def get_recommendations():
     interests = request.args.getlist('interests')
     goal = request.args.get('goal', 'advancement')
     
-    app.logger.info(f'Recommendations requested - Level: {career_level}, Goal: {goal}, Interests: {interests}')
+    app.logger.info('Recommendations requested - Level: %s, Goal: %s, Interests: %s', career_level, goal, interests)
     
-    # Generate recommendations based on filters
-    recommendations = generate_recommendations(career_level, interests, goal)
+    # Look up the prebuilt recommendation set for this goal
+    recommendations = lookup_recommendations(career_level, interests, goal)
     
-    app.logger.info(f'Generated {len(recommendations["courses"])} courses, {len(recommendations["jobs"])} jobs, {len(recommendations["events"])} events, {len(recommendations["workshops"])} workshops')
+    app.logger.info('Generated %d courses, %d jobs, %d events, %d workshops', len(recommendations['courses']),
+                    len(recommendations['jobs']), len(recommendations['events']), len(recommendations['workshops']))
     
     return jsonify({
         'recommendations': recommendations,
         'status': 'success'
     })
 
+@app.route('/api/recommendations/for-question', methods=['GET'])
+def get_recommendations_for_question():
+    """API endpoint for the recommendations that follow a chat question"""
+    question = request.args.get('question', '')
+    career_level = request.args.get('career_level', '')
+    interests = request.args.getlist('interests')
+    goal = request.args.get('goal', 'advancement')
+
+    # A question with no recognised intent keeps the recommendations for the user's own goal
+    intent = classify_question_intent(question)
+    key = (intent, preferences_key({'career_level': career_level, 'interests': interests, 'goal': goal}))
+    body = question_recommendation_cache.get(key)
+    if body is None:
+        recommendations = lookup_recommendations(career_level, interests, QUESTION_INTENT_GOALS.get(intent, goal))
+        body = json.dumps({'recommendations': recommendations, 'intent': intent, 'status': 'success'})
+        question_recommendation_cache.put(key, body)
+
+    return Response(body, mimetype='application/json', headers={'Cache-Control': 'private, max-age=300'})
+
 @app.route('/api/upload-cv', methods=['POST'])
 def upload_cv():
     """API endpoint for CV upload and analysis"""
@@ -80,13 +288,13 @@ def upload_cv():
         app.logger.warning('CV upload attempted with empty filename')
         return jsonify({'error': 'No file selected'}), 400
     
-    app.logger.info(f'CV upload received: {file.filename}')
+    app.logger.info('CV upload received: %s', file.filename)
     
     # In a real app, you would process the CV file here
     # For now, we'll simulate CV analysis
     analysis_result = simulate_cv_analysis(file.filename)
     
-    app.logger.info(f'CV analysis completed for {file.filename}')
+    app.logger.info('CV analysis completed for %s', file.filename)
     
     return jsonify({
         'message': f'CV uploaded successfully: {file.filename}',
@@ -97,14 +305,13 @@ def upload_cv():
 @app.route('/api/connect-linkedin', methods=['POST'])
 def connect_linkedin():
     """API endpoint for LinkedIn profile connection"""
-    data = request.get_json()
-    linkedin_url = data.get('linkedin_url', '')
+    linkedin_url = decode_request(request, ConnectLinkedInRequest).linkedin_url
     
     if not linkedin_url:
         app.logger.warning('LinkedIn connection attempted without URL')
         return jsonify({'error': 'No LinkedIn URL provided'}), 400
     
-    app.logger.info(f'LinkedIn profile connection requested: {linkedin_url}')
+    app.logger.info('LinkedIn profile connection requested: %s', linkedin_url)
     
     try:
         # Analyze the LinkedIn profile
@@ -114,12 +321,15 @@ def connect_linkedin():
             return jsonify({'error': 'Could not analyze LinkedIn profile'}), 400
         
         # Update user preferences based on profile
-        updated_preferences = linkedin_analyzer.update_user_preferences(profile_data)
+        updated_preferences = normalize_preferences(linkedin_analyzer.update_user_preferences(profile_data))
         
         # Get personalized suggestions
         suggestions = linkedin_analyzer.get_personalized_suggestions(profile_data)
         
-        app.logger.info(f'LinkedIn profile connected successfully: {profile_data.get("name", "Unknown")}')
+        # Answer the recommended questions in the background; the next click is usually one of them
+        speculative_prefetcher.submit(suggestions['recommended_questions'], updated_preferences)
+        
+        app.logger.info('LinkedIn profile connected successfully: %s', profile_data.get('name', 'Unknown'))
         
         return jsonify({
             'message': f'LinkedIn profile connected successfully!',
@@ -130,9 +340,130 @@ def connect_linkedin():
         })
         
     except Exception as e:
-        app.logger.error(f'Error connecting LinkedIn profile: {e}')
+        app.logger.error('Error connecting LinkedIn profile: %s', e)
         return jsonify({'error': 'Error connecting LinkedIn profile'}), 500
 
+@app.route('/api/admin/stats', methods=['GET'])
+@require_admin
+def admin_stats():
+    """API endpoint exposing LLM scheduling and degradation state"""
+    return jsonify({
+        'scheduler': request_scheduler.get_stats(),
+        'degradation': degradation_controller.get_state(),
+        'rate_limiter': llm_rate_limiter.get_stats() if llm_rate_limiter else None,
+        'speculative_prefetch': speculative_prefetcher.get_stats(),
+        'model_router': llm_generator.router.get_stats() if llm_generator.router else None,
+        'heavy_hitters': question_tracker.get_stats(),
+        'semantic_cache': llm_generator.semantic_index.get_stats() if llm_generator.semantic_index else None,
+        'conversation_memory': conversation_memory.get_stats() if conversation_memory is not None else None,
+        'transcript_log': transcript_log.get_stats() if transcript_log is not None else None,
+        'traffic_recorder': traffic_recorder.get_stats() if traffic_recorder is not None else None,
+        'status': 'success'
+    })
+
+@app.route('/api/admin/profile', methods=['GET', 'DELETE'])
+@require_admin
+def admin_profile():
+    """Download (GET) or reset (DELETE) the aggregated request profile"""
+    if request.method == 'DELETE':
+        request_profiler.reset()
+        return jsonify({'message': 'Profile data cleared', 'status': 'success'})
+
+    fmt = request.args.get('format', 'collapsed')
+    try:
+        payload = request_profiler.export(fmt)
+    except ValueError:
+        return jsonify({'error': f'Unknown format: {fmt}'}), 400
+
+    filename = {'collapsed': 'profile.collapsed', 'pstats': 'profile.pstats', 'text': 'profile.txt'}[fmt]
+    mimetype = 'application/octet-stream' if fmt == 'pstats' else 'text/plain'
+    return Response(payload, mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename={filename}'})
+
+@app.route('/api/admin/memory', methods=['GET', 'POST', 'DELETE'])
+@require_admin
+def admin_memory():
+    """Allocation stats and top sites (GET), toggle tracing (POST) or reset route totals (DELETE)"""
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        if data.get('enabled', True):
+            frames = data.get('frames', 1)
+            if isinstance(frames, bool) or not isinstance(frames, int) or frames < 1:
+                return jsonify({'error': 'frames must be an integer of at least 1'}), 400
+            allocation_tracker.enable(frames)
+        else:
+            allocation_tracker.disable()
+    elif request.method == 'DELETE':
+        allocation_tracker.reset()
+
+    limit = request.args.get('limit', 20, type=int)
+    group_by = request.args.get('group_by', 'lineno')
+    if group_by not in ('lineno', 'filename', 'traceback'):
+        return jsonify({'error': f'Unknown group_by: {group_by}'}), 400
+
+    stats = allocation_tracker.get_stats()
+    stats['top_sites'] = allocation_tracker.top_sites(limit, group_by) if request.method == 'GET' else []
+    stats['status'] = 'success'
+    return jsonify(stats)
+
+@app.route('/api/admin/memory/snapshots', methods=['POST'])
+@require_admin
+def admin_memory_snapshot():
+    """Store a tracemalloc snapshot for later diffs"""
+    data = request.get_json(silent=True) or {}
+    try:
+        snapshot_id = allocation_tracker.take_snapshot(data.get('label'))
+    except RuntimeError as e:
+        return jsonify({'error': str(e)}), 409
+    return jsonify({'snapshot': snapshot_id, 'status': 'success'})
+
+@app.route('/api/admin/memory/diff', methods=['GET'])
+@require_admin
+def admin_memory_diff():
+    """Compare snapshot `base` against snapshot `target` (default: the current heap)"""
+    base = request.args.get('base')
+    if not base:
+        return jsonify({'error': 'base snapshot is required'}), 400
+
+    group_by = request.args.get('group_by', 'lineno')
+    if group_by not in ('lineno', 'filename', 'traceback'):
+        return jsonify({'error': f'Unknown group_by: {group_by}'}), 400
+
+    try:
+        diff = allocation_tracker.diff(base, request.args.get('target'), request.args.get('limit', 20, type=int), group_by)
+    except KeyError as e:
+        return jsonify({'error': f'Unknown snapshot: {e.args[0]}'}), 404
+    except RuntimeError as e:
+        return jsonify({'error': str(e)}), 409
+    diff['status'] = 'success'
+    return jsonify(diff)
+
+@app.route('/api/admin/heavy-hitters', methods=['GET', 'DELETE'])
+@require_admin
+def admin_heavy_hitters():
+    """Most frequent free-form questions and pinned answers (GET) or reset the counts (DELETE)"""
+    if request.method == 'DELETE':
+        question_tracker.reset()
+
+    stats = question_tracker.get_stats()
+    stats['top'] = question_tracker.top(request.args.get('limit', 20, type=int))
+    stats['pinned'] = pinned_answers.entries()
+    stats['status'] = 'success'
+    return jsonify(stats)
+
+@app.route('/api/admin/heavy-hitters/pin', methods=['POST', 'DELETE'])
+@require_admin
+def admin_pin_heavy_hitters():
+    """Pin answers for the top questions (POST) or drop every pinned answer (DELETE)"""
+    if request.method == 'DELETE':
+        pinned_answers.clear()
+        return jsonify({'message': 'Pinned answers cleared', 'status': 'success'})
+
+    data = request.get_json(silent=True) or {}
+    outcome = promote_top_questions(int(data.get('top', 10)), int(data.get('min_count', 5)))
+    outcome['status'] = 'success'
+    return jsonify(outcome)
+
 def generate_chat_response(user_message):
     """Generate chat responses based on user input"""
     lower_message = user_message.lower()
@@ -181,6 +512,77 @@ I've highlighted the most relevant events in your recommendations!"""
     else:
         return f"I understand you're interested in {user_message}. Let me analyze your profile and current filters to provide personalized recommendations. I've updated your suggestions based on your career goals and interests."
 
+# The goals generate_recommendations has a dedicated branch for; every other goal gets the default set
+RECOMMENDATION_GOALS = ('advancement', 'skill', 'job', 'executive')
+recommendation_index = {}
+
+def lookup_recommendations(career_level, interests, goal):
+    """Return the recommendation set for a goal, building the index entry on first use"""
+    # generate_recommendations only varies by goal, and responses are never mutated, so sets are shared
+    key = goal if goal in RECOMMENDATION_GOALS else None
+    recommendations = recommendation_index.get(key)
+    if recommendations is None:
+        recommendations = recommendation_index[key] = generate_recommendations(career_level, interests, goal)
+    return recommendations
+
+# Recommendation set (by goal) shown after a question with each chat intent
+QUESTION_INTENT_GOALS = {
+    'advancement': 'advancement',
+    'director_skills': 'executive',
+    'remote_jobs': 'job',
+    'leadership_workshops': 'skill'
+}
+
+# Keyword fallback when no predefined intent is close; the first intent with a matching keyword wins
+QUESTION_INTENT_KEYWORDS = (
+    ('leadership_workshops', ('workshop', 'leadership', 'skill')),
+    ('remote_jobs', ('job', 'opportunity', 'remote')),
+    ('director_skills', ('director', 'executive')),
+    ('advancement', ('advance', 'lead'))
+)
+
+question_recommendation_cache = ResponseCache('question_recommendations',
+                                              int(os.getenv('QUESTION_RECOMMENDATION_CACHE_SIZE', '1024')), None)
+
+def classify_question_intent(question):
+    """Chat intent of a question, from the predefined matcher first and keywords last"""
+    # A stricter closeness than degraded answers use: a wrong card set is worse than an unchanged one
+    intent = predefined_manager.match_question(question) or predefined_manager.find_closest_question(question, min_score=0.75)
+    if intent in QUESTION_INTENT_GOALS:
+        return intent
+
+    lower_question = question.lower()
+    for intent, keywords in QUESTION_INTENT_KEYWORDS:
+        if any(keyword in lower_question for keyword in keywords):
+            return intent
+    return None
+
+def prime_recommendation_index():
+    """Build the recommendation set of every goal"""
+    for goal in RECOMMENDATION_GOALS + ('other',):
+        lookup_recommendations('', [], goal)
+    return len(recommendation_index)
+
+initial_recommendations_json = None
+
+def get_initial_recommendations_json():
+    """Recommendations for the default filters, serialized once for inlining into the index page"""
+    global initial_recommendations_json
+    if initial_recommendations_json is None:
+        defaults = predefined_manager.default_preferences
+        recommendations = lookup_recommendations(defaults['career_level'], defaults['interests'], defaults['goal'])
+        # Escaping '<' keeps the blob from closing its <script> element
+        initial_recommendations_json = json.dumps(recommendations).replace('<', '\\u003c')
+    return initial_recommendations_json
+
+def warm_templates():
+    """Compile the page templates and render the index page once"""
+    get_initial_recommendations_json()
+    with app.test_request_context('/'):
+        for name in ('index.html', '404.html', '500.html'):
+            render_template(name)
+    return 3
+
 def generate_recommendations(career_level, interests, goal):
     """Generate personalized recommendations based on user filters"""
     recommendations = {
@@ -317,6 +719,48 @@ def generate_recommendations(career_level, interests, goal):
             'link': 'https://www.linkedin.com/learning/courses/linkedin-networking-workshop'
         })
     
+    elif goal == 'executive':
+        # Focus on executive development and strategic training
+        recommendations['courses'].append({
+            'title': 'LinkedIn Learning: Executive Leadership Program',
+            'description': 'Advanced leadership skills for senior professionals',
+            'duration': '16 weeks',
+            'price': 'Free with LinkedIn Premium',
+            'format': 'Online',
+            'type': 'COURSE',
+            'link': 'https://www.linkedin.com/learning/paths/executive-leadership-program'
+        })
+        
+        recommendations['jobs'].append({
+            'title': 'Executive Trainee Program',
+            'description': 'Structured program for mid-level managers transitioning to executive roles',
+            'location': 'Hybrid',
+            'salary': 'Executive Training',
+            'company': 'Fortune 500',
+            'type': 'JOB',
+            'link': 'https://www.linkedin.com/jobs/search/?keywords=executive%20trainee%20program'
+        })
+        
+        recommendations['events'].append({
+            'title': 'Executive Leadership Practice Forum',
+            'description': 'Monthly practice sessions with current executives and board members',
+            'date': 'Monthly',
+            'location': 'Virtual Executive Sessions',
+            'price': 'Premium',
+            'type': 'EVENT',
+            'link': 'https://www.linkedin.com/events/executive-leadership-forum'
+        })
+        
+        recommendations['workshops'].append({
+            'title': 'Strategic Leadership Workshop',
+            'description': 'Intensive workshop for developing strategic thinking and executive presence',
+            'duration': '3 days',
+            'price': 'Executive Coaching',
+            'spots': 'In-Person',
+            'type': 'WORKSHOP',
+            'link': 'https://www.linkedin.com/learning/courses/strategic-leadership-workshop'
+        })
+    
     else:
         # Default recommendations for other goals
         recommendations['courses'].append({
@@ -373,14 +817,34 @@ def simulate_cv_analysis(filename):
 
 @app.errorhandler(404)
 def not_found(error):
-    app.logger.warning(f'404 error: {request.url}')
+    app.logger.warning('404 error: %s', request.url)
     return render_template('404.html'), 404
 
+@app.errorhandler(RequestValidationError)
+def invalid_request(error):
+    app.logger.warning('Rejected request body on %s: %s', request.path, error)
+    return jsonify({'error': str(error), 'status': 'invalid_request'}), 400
+
 @app.errorhandler(500)
 def internal_error(error):
-    app.logger.error(f'500 error: {error}')
+    app.logger.error('500 error: %s', error)
     return render_template('500.html'), 500
 
+warmup.add_step('templates', warm_templates)
+warmup.add_step('recommendation_index', prime_recommendation_index)
+
+def start_warmup(blocking=False):
+    """Run warm-up once, in the background unless blocking; a no-op after the first call
+
+    Not started at import, so scripts and benchmarks that import app stay quiet.
+    """
+    if os.getenv('WARMUP', 'background') == 'off':
+        warmup.skip()
+    elif blocking:
+        warmup.run()
+    else:
+        warmup.run_in_background()
+
 if __name__ == '__main__':
     # Create necessary directories if they don't exist
     os.makedirs('templates', exist_ok=True)
@@ -392,4 +856,7 @@ if __name__ == '__main__':
     app.logger.info("📁 Static files served from /static/")
     app.logger.info("🎨 Templates rendered from /templates/")
     
+    # Finish warm-up before the server starts accepting connections
+    start_warmup(blocking=True)
+    
     app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
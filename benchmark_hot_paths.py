@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the hot paths of the LinkedIn Future platform
+
+Runs offline against a stub LLM, prints per-operation timings and saves them as
+JSON. Pass --baseline with an earlier results file to fail on regressions.
+
+    python benchmark_hot_paths.py --output bench_new.json --baseline bench_old.json
+"""
+
+import os
+
+# Keep the benchmark deterministic: no rate limiting, no SLO-driven degradation, no warm-up thread
+os.environ.setdefault('LLM_RATE_LIMIT_PER_MINUTE', '0')
+os.environ.setdefault('LLM_MAX_DEGRADED_FRACTION', '0')
+os.environ.setdefault('WARMUP', 'off')
+
+import gc
+import sys
+import json
+import time
+import timeit
+import random
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+from typing import Callable, Dict, List, Tuple
+
+from llm_integration import llm_generator
+from model_router import ModelRouter, FakeBackend, FAST, QUALITY
+from predefined_responses import predefined_manager
+from linkedin_profile_analyzer import linkedin_analyzer
+from preferences import normalize_preferences
+from semantic_cache import SemanticIndex
+from request_schemas import ChatRequest, decode_body
+from profile_record import ProfileRecord
+from flask.json.provider import DefaultJSONProvider
+
+SAMPLE_LLM_MARKDOWN = """## Your Path to Data Science
+
+Great question! Moving into **data science** from your current role is very achievable.
+
+### 1. Build the Foundations
+- **Statistics**: probability, hypothesis testing and regression
+- **Python**: pandas, NumPy and scikit-learn
+- *SQL* for working with real datasets
+
+### 2. Use LinkedIn Resources
+• **LinkedIn Learning**: "Becoming a Data Scientist" learning path
+• **LinkedIn Groups**: join *Data Science Central*
+• **LinkedIn Jobs**: search for "Junior Data Scientist Remote"
+
+## Next Steps
+- Finish one portfolio project per month
+- Share your results on LinkedIn to build credibility
+"""
+
+DEFAULT_PREFERENCES = {
+    'interests': ['Technology', 'Leadership'],
+    'career_level': 'Entry Level',
+    'goal': 'advancement',
+    'industry': 'All Industries',
+    'location': 'Remote',
+    'experience': '3-5 years'
+}
+
+MODIFIED_PREFERENCES = {
+    'interests': ['Marketing', 'Leadership'],
+    'career_level': 'Senior',
+    'goal': 'skill',
+    'industry': 'Marketing',
+    'location': 'Hybrid',
+    'experience': '6-10 years'
+}
+
+
+def install_stub_llm() -> None:
+    """Route every LLM call to offline fake backends"""
+    llm_generator.router = ModelRouter({
+        FAST: FakeBackend('stub-fast', SAMPLE_LLM_MARKDOWN),
+        QUALITY: FakeBackend('stub-quality', SAMPLE_LLM_MARKDOWN)
+    })
+    llm_generator.is_available = True
+
+
+def build_benchmarks() -> List[Tuple[str, Callable[[], object]]]:
+    """Return (name, zero-argument callable) pairs for every hot path"""
+    from app import app, generate_recommendations
+
+    profile = linkedin_analyzer.analyze_profile('https://www.linkedin.com/in/chase-thompson012/')
+    linkedin_preferences = linkedin_analyzer.update_user_preferences(profile)
+    profile_args = (profile['name'], profile['title'], profile['company'], profile['skills'],
+                    profile['experience_level'], profile['industry'])
+
+    predefined_question = 'How can I advance from Senior Developer to Tech Lead?'
+    free_question = 'How do I become a data scientist?'
+    client = app.test_client()
+    normalized_modified = normalize_preferences(MODIFIED_PREFERENCES)
+
+    near_duplicate = 'How can I become a data scientist'
+    fetch = lambda key: SAMPLE_LLM_MARKDOWN
+    # A separate index, so clearing the app's caches below does not empty it
+    semantic_index = SemanticIndex()
+    for i in range(200):
+        semantic_index.add(f'{free_question} in {i} months', MODIFIED_PREFERENCES)
+    semantic_index.add(free_question, MODIFIED_PREFERENCES)
+
+    chat_body = json.dumps({'message': predefined_question, 'preferences': linkedin_preferences}, default=dict).encode()
+    connect_payload = {'message': 'LinkedIn profile connected successfully!', 'profile_data': profile,
+                       'updated_preferences': linkedin_preferences, 'status': 'success'}
+    # The standard-library provider, with the app's handling of profile records
+    stdlib_dumps = lambda obj: DefaultJSONProvider.dumps(app.json, obj)
+
+    def decode_chat_stdlib():
+        # get_json() plus what the handlers then did with it: normalize, and turn profile_data into a record
+        data = json.loads(chat_body)
+        preferences = normalize_preferences(data.get('preferences', DEFAULT_PREFERENCES))
+        return data.get('message', ''), preferences, ProfileRecord.coerce(preferences.get('profile_data'))
+
+    def decode_chat_schema():
+        body = decode_body(chat_body, ChatRequest)
+        preferences = body.user_preferences()
+        return body.message, preferences, preferences.get('profile_data')
+
+    def chat_llm_uncached():
+        # Every call must reach the (stub) model, not the exact or semantic response cache
+        llm_generator.response_cache.clear()
+        if llm_generator.semantic_index is not None:
+            llm_generator.semantic_index.clear()
+        return client.post('/api/chat', json={'message': free_question, 'preferences': MODIFIED_PREFERENCES})
+
+    benchmarks = [
+        ('match_question.hit', lambda: predefined_manager.match_question(predefined_question)),
+        ('match_question.miss', lambda: predefined_manager.match_question(free_question)),
+        ('should_use_predefined_response.default', lambda: predefined_manager.should_use_predefined_response(predefined_question, DEFAULT_PREFERENCES)),
+        ('should_use_predefined_response.modified', lambda: predefined_manager.should_use_predefined_response(predefined_question, MODIFIED_PREFERENCES)),
+        ('should_use_predefined_response.miss', lambda: predefined_manager.should_use_predefined_response(free_question, DEFAULT_PREFERENCES)),
+        ('should_use_predefined_response.normalized', lambda: predefined_manager.should_use_predefined_response(predefined_question, normalized_modified)),
+        ('normalize_preferences', lambda: normalize_preferences(MODIFIED_PREFERENCES)),
+
+        ('_get_advancement_response', lambda: predefined_manager._get_advancement_response(True, True, True, '3-5 years')),
+        ('_get_director_skills_response', lambda: predefined_manager._get_director_skills_response(True, True, True)),
+        ('_get_remote_jobs_response', lambda: predefined_manager._get_remote_jobs_response(True, True, '3-5 years')),
+        ('_get_leadership_workshops_response', lambda: predefined_manager._get_leadership_workshops_response(True, True, True)),
+        ('_get_fallback_response', lambda: predefined_manager._get_fallback_response(free_question, DEFAULT_PREFERENCES)),
+        ('_get_linkedin_personalized_response', lambda: predefined_manager._get_linkedin_personalized_response('advancement', linkedin_preferences, profile)),
+        ('_get_linkedin_advancement_response', lambda: predefined_manager._get_linkedin_advancement_response(*profile_args)),
+        ('_get_linkedin_director_response', lambda: predefined_manager._get_linkedin_director_response(*profile_args)),
+        ('_get_linkedin_jobs_response', lambda: predefined_manager._get_linkedin_jobs_response(*profile_args)),
+        ('_get_linkedin_workshops_response', lambda: predefined_manager._get_linkedin_workshops_response(*profile_args)),
+
+        ('_convert_markdown_to_html', lambda: llm_generator._convert_markdown_to_html(SAMPLE_LLM_MARKDOWN)),
+        ('_create_prompt', lambda: llm_generator._create_prompt(free_question, DEFAULT_PREFERENCES)),
+        ('router.route', lambda: llm_generator.router.route(free_question)),
+        ('semantic_index.lookup', lambda: semantic_index.lookup(near_duplicate, MODIFIED_PREFERENCES, fetch)),
+
+        ('generate_recommendations.advancement', lambda: generate_recommendations('Entry Level', ['Technology', 'Leadership'], 'advancement')),
+        ('generate_recommendations.job', lambda: generate_recommendations('Senior', ['Marketing'], 'job')),
+        ('analyze_profile.known', lambda: linkedin_analyzer.analyze_profile('https://www.linkedin.com/in/chase-thompson012/')),
+        ('analyze_profile.unknown', lambda: linkedin_analyzer.analyze_profile('https://www.linkedin.com/in/someone-new/')),
+
+        ('request_body.decode.stdlib', decode_chat_stdlib),
+        ('request_body.decode.schema', decode_chat_schema),
+        ('json_response.encode.stdlib', lambda: stdlib_dumps(connect_payload)),
+        ('json_response.encode.app', lambda: app.json.dumps(connect_payload)),
+
+        ('e2e./api/chat.predefined', lambda: client.post('/api/chat', json={'message': predefined_question, 'preferences': DEFAULT_PREFERENCES})),
+        ('e2e./api/chat.llm', chat_llm_uncached),
+        ('e2e./api/chat.cache_hit', lambda: client.post('/api/chat', json={'message': free_question, 'preferences': MODIFIED_PREFERENCES})),
+        ('e2e./api/recommendations', lambda: client.get('/api/recommendations?career_level=Senior&goal=job&interests=Technology&interests=Leadership')),
+    ]
+    return benchmarks
+
+
+def time_callable(func: Callable[[], object], repeat: int, min_time: float) -> Dict:
+    """Time func with timeit (GC disabled), returning per-call statistics in microseconds"""
+    timer = timeit.Timer(func)
+
+    # Warm up caches and pick a loop count that runs for at least min_time
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2
+
+    runs = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'min_us': round(min(runs), 3),
+        'median_us': round(statistics.median(runs), 3),
+        'stdev_us': round(statistics.stdev(runs), 3) if len(runs) > 1 else 0.0,
+        'number': number,
+        'repeat': repeat
+    }
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run_benchmarks(selected: List[str], repeat: int, min_time: float) -> Dict:
+    install_stub_llm()
+    random.seed(0)
+
+    results = {}
+    for name, func in build_benchmarks():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        gc.collect()
+        results[name] = time_callable(func, repeat, min_time)
+        print(f"{name:<45} median {results[name]['median_us']:>12.2f} us   min {results[name]['min_us']:>12.2f} us")
+
+    return {
+        'meta': {
+            'commit': current_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform()
+        },
+        'results': results
+    }
+
+
+def compare_to_baseline(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Return a line per benchmark whose median regressed by more than threshold"""
+    regressions = []
+    for name, current in report['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if not previous:
+            continue
+        ratio = current['median_us'] / previous['median_us'] if previous['median_us'] else 1.0
+        marker = 'REGRESSION' if ratio > 1.0 + threshold else ''
+        print(f"{name:<45} {previous['median_us']:>12.2f} -> {current['median_us']:>12.2f} us  x{ratio:.2f} {marker}")
+        if marker:
+            regressions.append(f"{name}: x{ratio:.2f}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', default='benchmark_results.json', help='where to save the JSON results')
+    parser.add_argument('--baseline', help='earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed median slowdown before failing (0.25 = 25%%)')
+    parser.add_argument('--repeat', type=int, default=7, help='timing repetitions per benchmark')
+    parser.add_argument('--min-time', type=float, default=0.05, help='minimum seconds per repetition')
+    parser.add_argument('--only', action='append', default=[], help='run benchmarks whose name contains this text')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print("⏱️  Benchmarking hot paths (stub LLM, offline)")
+    print("=" * 80)
+    report = run_benchmarks(args.only, args.repeat, args.min_time)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\n💾 Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\n📊 Comparison with {args.baseline} (commit {baseline.get('meta', {}).get('commit', '?')})")
+        print("-" * 80)
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+        print(f"\n✅ No regressions above {args.threshold:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for analyzed LinkedIn profiles
+
+Builds N synthetic profiles the way they arrive (JSON-decoded dicts) and as
+ProfileRecord objects, and reports retained bytes per profile (tracemalloc)
+and the cost of reading the fields the predefined renderers use.
+
+    python benchmark_profile_memory.py --profiles 200000
+"""
+
+import gc
+import sys
+import json
+import random
+import timeit
+import argparse
+import tracemalloc
+from typing import Callable, Dict, List
+
+from profile_record import ProfileRecord
+
+INDUSTRIES = ['Technology', 'Marketing', 'Finance', 'Healthcare', 'Education', 'Retail']
+LEVELS = ['Entry Level', 'Mid Level', 'Senior', 'Executive']
+LOCATIONS = ['San Francisco, CA', 'New York, NY', 'Austin, TX', 'Remote', 'London, UK']
+SKILLS = ['Python', 'JavaScript', 'React', 'SQL', 'Leadership', 'Digital Marketing', 'SEO', 'Analytics',
+          'Project Management', 'Content Strategy', 'Machine Learning', 'Node.js']
+INTERESTS = ['Technology', 'Leadership', 'Marketing', 'Data Science', 'Management']
+
+
+def synthetic_profiles(count: int, seed: int = 0) -> List[str]:
+    """Serialized profiles, so each decoded dict owns its strings as it would in production"""
+    rng = random.Random(seed)
+    documents = []
+    for i in range(count):
+        documents.append(json.dumps({
+            'name': f'User {i}',
+            'title': f'{rng.choice(LEVELS)} {rng.choice(["Engineer", "Manager", "Analyst"])}',
+            'company': f'Company {rng.randrange(5000)}',
+            'location': rng.choice(LOCATIONS),
+            'skills': rng.sample(SKILLS, 4),
+            'experience_level': rng.choice(LEVELS),
+            'education': "Bachelor's Degree",
+            'interests': rng.sample(INTERESTS, 2),
+            'career_goal': rng.choice(['advancement', 'skill', 'job']),
+            'preferred_location': rng.choice(LOCATIONS),
+            'years_experience': rng.choice(['1-2 years', '3-5 years', '6-10 years']),
+            'industry': rng.choice(INDUSTRIES),
+            'summary': f'Professional number {i} focused on growth.',
+            'profile_id': f'user-{i}',
+            'linkedin_url': f'https://www.linkedin.com/in/user-{i}/'
+        }))
+    return documents
+
+
+def retained_bytes(build: Callable[[], List]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    profiles = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del profiles
+    return current
+
+
+def access_us(profiles: List, repeat: int = 5) -> float:
+    """Microseconds to read the renderer fields of every profile once"""
+    def read_all():
+        for profile in profiles:
+            (profile.get('name', 'User'), profile.get('title', 'Professional'), profile.get('company', 'Company'),
+             profile.get('skills', []), profile.get('experience_level', 'Entry Level'),
+             profile.get('industry', 'Technology'))
+    return min(timeit.repeat(read_all, number=1, repeat=repeat)) * 1e6
+
+
+def render_fields_us(records: List[ProfileRecord], repeat: int = 5) -> float:
+    def read_all():
+        for record in records:
+            record.render_fields()
+    return min(timeit.repeat(read_all, number=1, repeat=repeat)) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=100000, help='number of synthetic profiles')
+    args = parser.parse_args()
+
+    documents = synthetic_profiles(args.profiles)
+    count = len(documents)
+
+    dict_bytes = retained_bytes(lambda: [json.loads(document) for document in documents])
+    record_bytes = retained_bytes(lambda: [ProfileRecord.from_dict(json.loads(document)) for document in documents])
+
+    dicts = [json.loads(document) for document in documents]
+    records = [ProfileRecord.from_dict(profile) for profile in dicts]
+    results: Dict[str, float] = {
+        'dict_bytes_per_profile': dict_bytes / count,
+        'record_bytes_per_profile': record_bytes / count,
+        'dict_access_ns_per_profile': access_us(dicts) * 1000 / count,
+        'record_access_ns_per_profile': access_us(records) * 1000 / count,
+        'record_render_fields_ns_per_profile': render_fields_us(records) * 1000 / count
+    }
+
+    print(f"🧮 {count} profiles")
+    print("=" * 60)
+    for name, value in results.items():
+        print(f"{name:<40} {value:>12.1f}")
+    print(f"\nMemory: records use {record_bytes / dict_bytes:.0%} of the dict footprint")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
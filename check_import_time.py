@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for the LinkedIn Future platform
+
+Imports each entry point in a fresh interpreter with `python -X importtime`,
+takes the best of several runs, and fails when a module goes over its budget
+or pulls in a module it must leave for first use (e.g. the Gemini SDK).
+
+    python check_import_time.py                       # check against import_budget.json
+    python check_import_time.py --module app --top 15  # show the slowest imports under app
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+
+
+def measure(module: str, env: Dict[str, str]) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Import module once; return its milliseconds and {name: (self_us, cumulative_us)} of its import tree"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    # Children are printed before their parent; a top-level line closes a subtree
+    subtree = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        subtree[name] = (int(self_us), int(cumulative_us))
+        if len(indent) <= 1:
+            if name == module:
+                return int(cumulative_us) / 1000.0, subtree
+            subtree = {}
+
+    raise RuntimeError(f"{module} did not show up in the -X importtime output")
+
+
+def best_of(module: str, runs: int, env: Dict[str, str]) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Fastest of several runs, which filters out scheduler and disk noise"""
+    return min((measure(module, env) for _ in range(runs)), key=lambda result: result[0])
+
+
+def slowest(imported: Dict[str, Tuple[int, int]], top: int) -> List[Tuple[str, int, int]]:
+    ranked = sorted(imported.items(), key=lambda item: item[1][0], reverse=True)
+    return [(name, self_us, cumulative_us) for name, (self_us, cumulative_us) in ranked[:top]]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_budget.json'),
+                        help='JSON file with per-module budgets in milliseconds')
+    parser.add_argument('--module', action='append', default=[], help='only check these modules')
+    parser.add_argument('--runs', type=int, default=5, help='imports per module; the fastest counts')
+    parser.add_argument('--top', type=int, default=5, help='slowest imports to list per module')
+    args = parser.parse_args()
+
+    with open(args.budget) as f:
+        budget = json.load(f)
+
+    # Background warm-up would race the import being measured
+    env = dict(os.environ, WARMUP='off')
+    modules = args.module or list(budget['modules'])
+    failures = []
+
+    print(f"⏱️  Import-time budget (best of {args.runs} runs, python {sys.version.split()[0]})")
+    print("=" * 80)
+    for module in modules:
+        limit = budget['modules'].get(module)
+        elapsed, imported = best_of(module, args.runs, env)
+        status = '✅' if limit is None or elapsed <= limit else '❌'
+        print(f"{status} {module:<28} {elapsed:>9.1f} ms   budget {limit if limit is not None else '-':>6} ms")
+        if limit is not None and elapsed > limit:
+            failures.append(f"{module} took {elapsed:.1f} ms (budget {limit} ms)")
+
+        for forbidden in budget.get('deferred', []):
+            if forbidden in imported:
+                print(f"   ❌ imports {forbidden}, which must wait until first use")
+                failures.append(f"{module} imports {forbidden}")
+
+        for name, self_us, cumulative_us in slowest(imported, args.top):
+            print(f"   {name:<50} self {self_us / 1000:>7.1f} ms   cumulative {cumulative_us / 1000:>7.1f} ms")
+
+    if failures:
+        print(f"\n❌ {len(failures)} budget violation(s):")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+
+    print("\n✅ All imports within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
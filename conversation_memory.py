@@ -0,0 +1,226 @@
+"""
+Conversation Memory Module for LinkedIn Future Career Planning Platform
+
+This module keeps a short, bounded history per chat session so follow-up
+questions ("and what about remote ones?") reach the LLM with their context:
+- only questions that refer back to the conversation get the history; a
+  standalone question is answered (and cached) as if it were asked alone
+- each session holds its recent turns in a ring buffer, capped by turn count
+  and by an estimated token budget; answers are stored as plain text, cut
+  to a fixed length
+- turns pushed out of the window are folded into a rolling summary of short
+  gists, itself capped, so the prompt stays bounded however long the
+  conversation runs
+- sessions are kept in LRU order, capped in number and dropped after an idle
+  timeout
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import metrics
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+USER = 'user'
+ASSISTANT = 'assistant'
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+SPACE_PATTERN = re.compile(r'\s+')
+SENTENCE_END = re.compile(r'(?<=[.!?])\s')
+FOLLOW_UP_PATTERN = re.compile(
+    r"^\s*(and|or|but|also|so|then|what about|how about|why not)\b"
+    r"|\b(it|its|they|them|those|these|this one|that one|the same|instead|another one|"
+    r"you said|you mentioned|above|previous|earlier)\b",
+    re.IGNORECASE
+)
+FOLLOW_UP_MAX_WORDS = 3
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token); no tokenizer needed"""
+    return len(text) // 4 + 1
+
+
+def plain_text(html: str) -> str:
+    return SPACE_PATTERN.sub(' ', TAG_PATTERN.sub(' ', html)).strip()
+
+
+def refers_back(user_message: str) -> bool:
+    """Whether a question leans on the conversation: a leading "and"/"what about", a pronoun, or just a few words"""
+    return bool(FOLLOW_UP_PATTERN.search(user_message)) or len(user_message.split()) <= FOLLOW_UP_MAX_WORDS
+
+
+def _gist(role: str, text: str, max_chars: int) -> str:
+    """One short clause per folded turn: the question asked, or the first sentence of the answer"""
+    if role == ASSISTANT:
+        text = SENTENCE_END.split(text, 1)[0]
+    if len(text) > max_chars:
+        text = text[:max_chars - 1].rstrip() + '…'
+    return f'user asked "{text}"' if role == USER else f'assistant said "{text}"'
+
+
+class ConversationContext(NamedTuple):
+    """What a prompt gets to see of the conversation before the current question"""
+
+    summary: str
+    turns: Tuple[Tuple[str, str], ...]
+
+    def __bool__(self) -> bool:
+        return bool(self.summary or self.turns)
+
+
+EMPTY_CONTEXT = ConversationContext('', ())
+
+
+class _Session:
+    __slots__ = ('turns', 'tokens', 'gists', 'summary_chars', 'last_used')
+
+    def __init__(self, max_turns: int):
+        # (role, text, tokens) triples, oldest first
+        self.turns = deque(maxlen=max_turns)
+        self.tokens = 0
+        self.gists = deque()
+        self.summary_chars = 0
+        self.last_used = time.monotonic()
+
+
+class ConversationMemory:
+    """Per-session ring buffers of recent turns plus a rolling summary"""
+
+    def __init__(self, max_sessions: int = 10000, max_turns: int = 12, token_budget: int = 600,
+                 summary_tokens: int = 150, max_turn_chars: int = 600, gist_chars: int = 80,
+                 idle_seconds: float = 1800.0):
+        self.max_sessions = max_sessions
+        self.max_turns = max_turns
+        self.token_budget = token_budget
+        self.summary_chars = summary_tokens * 4
+        self.max_turn_chars = max_turn_chars
+        self.gist_chars = gist_chars
+        self.idle_seconds = idle_seconds
+        self._sessions = OrderedDict()
+        self._evicted = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def context(self, session_id: Optional[str]) -> ConversationContext:
+        """The summary and recent turns for session_id; empty for a new or unknown session"""
+        if not session_id:
+            return EMPTY_CONTEXT
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or time.monotonic() - session.last_used > self.idle_seconds:
+                return EMPTY_CONTEXT
+            return ConversationContext('; '.join(session.gists),
+                                       tuple((role, text) for role, text, _ in session.turns))
+
+    def record(self, session_id: Optional[str], user_message: str, answer: str) -> None:
+        """Append one question and its answer to the session's history"""
+        if not session_id:
+            return
+        now = time.monotonic()
+        turns = [self._turn(USER, user_message), self._turn(ASSISTANT, plain_text(answer))]
+
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or now - session.last_used > self.idle_seconds:
+                session = self._sessions[session_id] = _Session(self.max_turns)
+            self._sessions.move_to_end(session_id)
+            session.last_used = now
+
+            for turn in turns:
+                if len(session.turns) == session.turns.maxlen:
+                    self._fold(session)
+                session.turns.append(turn)
+                session.tokens += turn[2]
+            # Keep the window inside the token budget, but never drop the newest exchange
+            while session.tokens > self.token_budget and len(session.turns) > 2:
+                self._fold(session)
+
+            self._evict(now)
+
+    def _turn(self, role: str, text: str) -> Tuple[str, str, int]:
+        text = text.strip()
+        if len(text) > self.max_turn_chars:
+            text = text[:self.max_turn_chars - 1].rstrip() + '…'
+        return role, text, estimate_tokens(text)
+
+    def _fold(self, session: _Session) -> None:
+        """Move the oldest turn out of the window and into the rolling summary"""
+        role, text, tokens = session.turns.popleft()
+        session.tokens -= tokens
+        gist = _gist(role, text, self.gist_chars)
+        session.gists.append(gist)
+        session.summary_chars += len(gist) + 2
+        while session.summary_chars > self.summary_chars and len(session.gists) > 1:
+            session.summary_chars -= len(session.gists.popleft()) + 2
+
+    def _evict(self, now: float) -> None:
+        # Sessions are in least-recently-used order, so idle ones are at the front
+        while self._sessions:
+            session_id, oldest = next(iter(self._sessions.items()))
+            if len(self._sessions) <= self.max_sessions and now - oldest.last_used <= self.idle_seconds:
+                break
+            del self._sessions[session_id]
+            self._evicted += 1
+
+    def clear(self, session_id: Optional[str] = None) -> None:
+        with self._lock:
+            if session_id is None:
+                self._sessions.clear()
+            else:
+                self._sessions.pop(session_id, None)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            turns = sum(len(session.turns) for session in self._sessions.values())
+            return {
+                'sessions': len(self._sessions),
+                'turns': turns,
+                'evicted_sessions': self._evicted,
+                'max_sessions': self.max_sessions,
+                'max_turns': self.max_turns,
+                'token_budget': self.token_budget,
+                'idle_seconds': self.idle_seconds
+            }
+
+
+def format_context(context: ConversationContext) -> List[str]:
+    """Prompt lines for the conversation so far"""
+    lines = []
+    if context.summary:
+        lines.append(f'Earlier in this conversation: {context.summary}')
+    for role, text in context.turns:
+        lines.append(f'{"User" if role == USER else "Assistant"}: {text}')
+    return lines
+
+
+def _conversation_gauges():
+    yield 'conversation_sessions', 'Chat sessions with conversation memory in this process', {}, len(conversation_memory)
+
+
+def create_conversation_memory() -> Optional[ConversationMemory]:
+    """Build the configured memory, or None when CONVERSATION_MEMORY=off"""
+    if os.getenv('CONVERSATION_MEMORY', 'on').lower() == 'off':
+        return None
+    return ConversationMemory(
+        max_sessions=int(os.getenv('CONVERSATION_MAX_SESSIONS', '10000')),
+        max_turns=int(os.getenv('CONVERSATION_MAX_TURNS', '12')),
+        token_budget=int(os.getenv('CONVERSATION_TOKEN_BUDGET', '600')),
+        summary_tokens=int(os.getenv('CONVERSATION_SUMMARY_TOKENS', '150')),
+        idle_seconds=float(os.getenv('CONVERSATION_IDLE_SECONDS', '1800'))
+    )
+
+
+# Global instance for easy access
+conversation_memory = create_conversation_memory()
+if conversation_memory is not None:
+    metrics.registry.register_gauges(_conversation_gauges)
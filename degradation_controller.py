@@ -0,0 +1,131 @@
+"""
+Degradation Controller Module for LinkedIn Future Career Planning Platform
+
+This module tracks a rolling window of Gemini call latencies and, when the p95
+crosses the configured SLO, routes a rising fraction of chat requests away from
+the LLM to fallback or closest-match predefined answers. The fraction is lowered
+gradually again once latency recovers.
+"""
+
+import os
+import time
+import random
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class LatencySLOController:
+    """Adjusts the share of degraded requests from observed LLM latency"""
+
+    def __init__(self, slo_p95: float = 5.0, window_seconds: float = 60.0, window_size: int = 500,
+                 min_samples: int = 10, step_up: float = 0.2, step_down: float = 0.05,
+                 recovery_ratio: float = 0.8, adjust_interval: float = 2.0, max_fraction: float = 1.0):
+        self.slo_p95 = slo_p95
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self.step_up = step_up
+        self.step_down = step_down
+        self.recovery_ratio = recovery_ratio
+        self.adjust_interval = adjust_interval
+        self.max_fraction = max_fraction
+
+        self._samples = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+        self._fraction = 0.0
+        self._last_p95 = None
+        self._last_adjust = time.monotonic()
+        self._degraded_requests = 0
+
+    def record_latency(self, seconds: float) -> None:
+        """Record the duration of one generate_content call"""
+        with self._lock:
+            self._samples.append((time.monotonic(), seconds))
+
+    def should_degrade(self) -> bool:
+        """Return True when this request should skip the LLM"""
+        now = time.monotonic()
+        if now - self._last_adjust >= self.adjust_interval:
+            self._adjust(now)
+
+        fraction = self._fraction
+        if fraction <= 0.0 or random.random() >= fraction:
+            return False
+
+        with self._lock:
+            self._degraded_requests += 1
+        return True
+
+    def _adjust(self, now: float) -> None:
+        """Move the degraded fraction one step towards what the current p95 calls for"""
+        with self._lock:
+            if now - self._last_adjust < self.adjust_interval:
+                return
+            self._last_adjust = now
+
+            cutoff = now - self.window_seconds
+            while self._samples and self._samples[0][0] < cutoff:
+                self._samples.popleft()
+
+            previous = self._fraction
+            self._last_p95 = self._percentile([s[1] for s in self._samples], 0.95)
+            if len(self._samples) < self.min_samples:
+                # Too little fresh traffic to judge (or everything is degraded): recover slowly
+                self._fraction = max(0.0, self._fraction - self.step_down)
+            else:
+                if self._last_p95 > self.slo_p95:
+                    self._fraction = min(self.max_fraction, self._fraction + self.step_up)
+                elif self._last_p95 < self.slo_p95 * self.recovery_ratio:
+                    self._fraction = max(0.0, self._fraction - self.step_down)
+
+        if self._fraction != previous:
+            logger.info("LLM degradation fraction %.2f -> %.2f (p95=%s)", previous, self._fraction, self._last_p95)
+
+    @staticmethod
+    def _percentile(values: List[float], q: float) -> Optional[float]:
+        if not values:
+            return None
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+    def get_state(self) -> Dict:
+        """Return the controller state and thresholds"""
+        with self._lock:
+            latencies = [s[1] for s in self._samples]
+            degraded_requests = self._degraded_requests
+        fraction = self._fraction
+
+        if fraction == 0.0:
+            mode = 'normal'
+        elif self._last_p95 is not None and self._last_p95 > self.slo_p95:
+            mode = 'degrading'
+        else:
+            mode = 'recovering'
+
+        return {
+            'mode': mode,
+            'degraded_fraction': round(fraction, 4),
+            'degraded_requests': degraded_requests,
+            'samples': len(latencies),
+            'p50_seconds': self._percentile(latencies, 0.50),
+            'p95_seconds': self._percentile(latencies, 0.95),
+            'slo_p95_seconds': self.slo_p95,
+            'recovery_threshold_seconds': self.slo_p95 * self.recovery_ratio,
+            'window_seconds': self.window_seconds,
+            'step_up': self.step_up,
+            'step_down': self.step_down,
+            'max_fraction': self.max_fraction
+        }
+
+
+# Global instance for easy access
+degradation_controller = LatencySLOController(
+    slo_p95=float(os.getenv('LLM_SLO_P95_SECONDS', '5.0')),
+    window_seconds=float(os.getenv('LLM_SLO_WINDOW_SECONDS', '60')),
+    max_fraction=float(os.getenv('LLM_MAX_DEGRADED_FRACTION', '1.0'))
+)
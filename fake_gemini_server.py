@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Local fake Gemini server for load testing
+
+Answers the REST `generateContent` call with canned markdown after a sampled
+delay, and fails a configurable share of calls. Point the app at it with
+GEMINI_API_ENDPOINT:
+
+    python fake_gemini_server.py --port 8089 --latency lognormal --median 1.2 --error-rate 0.02
+    python fake_gemini_server.py --model-median gemini-1.5-pro=4.0   # slower quality tier
+    GEMINI_API_ENDPOINT=http://127.0.0.1:8089 python app.py
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+GENERATE_PATH = re.compile(r'^/v1(?:beta)?/models/(?P<model>[^:/]+):generateContent')
+
+CANNED_MARKDOWN = """## Here's a plan for you
+
+Great question! Based on your interests, here are some **concrete next steps**:
+
+- **LinkedIn Learning**: pick one course in your focus area this week
+- **LinkedIn Events**: register for a virtual meetup in your industry
+- *Networking*: message two people already doing the role you want
+
+### Next Steps
+• Update your LinkedIn headline to reflect your goal
+• Set a job alert for matching remote positions
+"""
+
+
+def make_latency_sampler(distribution: str, median: float, sigma: float, low: float, high: float) -> Callable[[], float]:
+    """Return a function producing one simulated model latency in seconds"""
+    if distribution == 'fixed':
+        return lambda: median
+    if distribution == 'uniform':
+        return lambda: random.uniform(low, high)
+    if distribution == 'exponential':
+        return lambda: random.expovariate(1.0 / median)
+    if distribution == 'lognormal':
+        import math
+        mu = math.log(median)
+        return lambda: random.lognormvariate(mu, sigma)
+    raise ValueError(f"Unknown latency distribution: {distribution}")
+
+
+class FakeGeminiServer(ThreadingHTTPServer):
+    """HTTP server holding the latency and error configuration"""
+
+    daemon_threads = True
+
+    def __init__(self, address, sample_latency: Callable[[], float], error_rate: float = 0.0,
+                 error_status: int = 503, response_text: str = CANNED_MARKDOWN,
+                 model_latency: Optional[Dict[str, Callable[[], float]]] = None):
+        super().__init__(address, FakeGeminiHandler)
+        self.sample_latency = sample_latency
+        self.model_latency = model_latency or {}
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.response_text = response_text
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'errors': 0}
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    """Implements the subset of the Generative Language REST API the SDK uses"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
+        match = GENERATE_PATH.match(self.path)
+        if not match:
+            self._send_json(404, {'error': {'code': 404, 'message': f'Unknown path {self.path}', 'status': 'NOT_FOUND'}})
+            return
+
+        self.server.count('requests')
+        sample_latency = self.server.model_latency.get(match.group('model'), self.server.sample_latency)
+        time.sleep(max(0.0, sample_latency()))
+
+        if random.random() < self.server.error_rate:
+            self.server.count('errors')
+            self._send_json(self.server.error_status, {
+                'error': {'code': self.server.error_status, 'message': 'The model is overloaded. Please try again later.',
+                          'status': 'UNAVAILABLE'}
+            })
+            return
+
+        self._send_json(200, {
+            'candidates': [{
+                'content': {'parts': [{'text': self.server.response_text}], 'role': 'model'},
+                'finishReason': 'STOP',
+                'index': 0,
+                'safetyRatings': []
+            }],
+            'promptFeedback': {'safetyRatings': []}
+        })
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send_json(200, dict(self.server.stats))
+        else:
+            self._send_json(404, {'error': {'code': 404, 'message': 'Not found', 'status': 'NOT_FOUND'}})
+
+    def _send_json(self, status: int, payload: Dict) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Local fake Gemini server for load testing')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--latency', default='lognormal', choices=['fixed', 'uniform', 'exponential', 'lognormal'])
+    parser.add_argument('--median', type=float, default=1.0, help='median (or fixed/mean) latency in seconds')
+    parser.add_argument('--sigma', type=float, default=0.5, help='lognormal shape parameter')
+    parser.add_argument('--low', type=float, default=0.2, help='uniform lower bound in seconds')
+    parser.add_argument('--high', type=float, default=2.0, help='uniform upper bound in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of calls answered with an error')
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--model-median', action='append', default=[], metavar='MODEL=SECONDS',
+                        help='per-model median latency, e.g. gemini-1.5-pro=4.0 (same distribution)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    sampler = make_latency_sampler(args.latency, args.median, args.sigma, args.low, args.high)
+    model_latency = {}
+    for entry in args.model_median:
+        model, median = entry.split('=', 1)
+        model_latency[model] = make_latency_sampler(args.latency, float(median), args.sigma, args.low, args.high)
+    server = FakeGeminiServer((args.host, args.port), sampler, args.error_rate, args.error_status,
+                              model_latency=model_latency)
+
+    logger.info("🤖 Fake Gemini listening on http://%s:%s (%s latency, median %ss, error rate %.1f%%)",
+                args.host, args.port, args.latency, args.median, args.error_rate * 100)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+Heavy Hitters Module for LinkedIn Future Career Planning Platform
+
+This module counts which free-form chat questions come up most often, in
+bounded memory, so they can be promoted to precomputed answers:
+- a count-min sketch (conservative update) estimates the frequency of every
+  normalized question and preference bucket seen
+- a top-k table keeps the k most frequent of them, with one example of the
+  preferences that asked
+- a pinned-answer store holds answers promoted from the top-k table;
+  should_use_predefined_response checks it before a question reaches the LLM
+"""
+
+import os
+import time
+import heapq
+import hashlib
+import logging
+import threading
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import metrics
+from response_cache import normalize_message
+from preferences import preferences_key
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+PINNED_PREFIX = 'pinned:'
+
+
+class CountMinSketch:
+    """Approximate counts in depth x width counters; never undercounts"""
+
+    def __init__(self, width: int = 4096, depth: int = 4):
+        if not 1 <= depth <= 16:
+            raise ValueError("depth must be between 1 and 16")
+        self.width = width
+        self.depth = depth
+        self.rows = [array('Q', bytes(8 * width)) for _ in range(depth)]
+
+    def _indexes(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=4 * self.depth).digest()
+        return [int.from_bytes(digest[4 * i:4 * i + 4], 'little') % self.width for i in range(self.depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Add count to key and return its new estimate"""
+        indexes = self._indexes(key)
+        # Conservative update: only raise counters that are below the new estimate
+        estimate = min(row[i] for row, i in zip(self.rows, indexes)) + count
+        for row, i in zip(self.rows, indexes):
+            if row[i] < estimate:
+                row[i] = estimate
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        return min(row[i] for row, i in zip(self.rows, self._indexes(key)))
+
+    def memory_bytes(self) -> int:
+        return sum(row.itemsize * len(row) for row in self.rows)
+
+
+def _heap_entry(count: int, item: Tuple) -> Tuple:
+    # PreferenceKey has no ordering, so ties on count and message are broken by the key's digest
+    message, key = item
+    return count, message, key.digest, item
+
+
+class HeavyHitterTracker:
+    """Count-min sketch plus a top-k table of (question, preference bucket) pairs"""
+
+    def __init__(self, width: int = 4096, depth: int = 4, k: int = 100):
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self.total = 0
+        self._top = {}
+        self._examples = {}
+        self._heap = []
+        self._lock = threading.Lock()
+
+    def record(self, user_message: str, user_preferences: Dict) -> None:
+        message = normalize_message(user_message)
+        if not message:
+            return
+        item = (message, preferences_key(user_preferences))
+
+        with self._lock:
+            self.total += 1
+            count = self.sketch.add(f'{message}\x1f{item[1].digest}')
+            if item in self._top:
+                self._top[item] = count
+                heapq.heappush(self._heap, _heap_entry(count, item))
+            elif len(self._top) < self.k:
+                self._insert(item, count, user_preferences)
+            else:
+                self._drop_stale_heap_entries()
+                if count > self._heap[0][0]:
+                    evicted = heapq.heappop(self._heap)[-1]
+                    del self._top[evicted]
+                    del self._examples[evicted]
+                    self._insert(item, count, user_preferences)
+
+            if len(self._heap) > 4 * self.k:
+                self._heap = [_heap_entry(count, item) for item, count in self._top.items()]
+                heapq.heapify(self._heap)
+
+    def _insert(self, item: Tuple, count: int, user_preferences: Dict) -> None:
+        self._top[item] = count
+        self._examples[item] = {key: value for key, value in user_preferences.items() if key != 'profile_data'}
+        heapq.heappush(self._heap, _heap_entry(count, item))
+
+    def _drop_stale_heap_entries(self) -> None:
+        # Counts only grow, so an entry is stale when the table holds a newer count
+        while self._heap and self._top.get(self._heap[0][-1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def top(self, limit: int = 20) -> List[Dict]:
+        with self._lock:
+            ranked = sorted(self._top.items(), key=lambda entry: entry[1], reverse=True)[:limit]
+            return [
+                {
+                    'message': message,
+                    'bucket': bucket.as_dict(),
+                    'preferences': self._examples[(message, bucket)],
+                    'count': count,
+                    'share': round(count / self.total, 4) if self.total else 0.0
+                }
+                for (message, bucket), count in ranked
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self.sketch = CountMinSketch(self.sketch.width, self.sketch.depth)
+            self.total = 0
+            self._top.clear()
+            self._examples.clear()
+            self._heap = []
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'total_recorded': self.total,
+                'tracked': len(self._top),
+                'k': self.k,
+                'sketch_width': self.sketch.width,
+                'sketch_depth': self.sketch.depth,
+                'sketch_bytes': self.sketch.memory_bytes()
+            }
+
+
+class PinnedAnswerStore:
+    """Precomputed answers for specific questions in specific preference buckets"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._ids = {}
+        self._answers = {}
+        # Answers from the last clear(), for requests that looked one up just before it
+        self._retired = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+    @staticmethod
+    def _answer_id(item: Tuple) -> str:
+        message, key = item
+        return hashlib.blake2b(f'{message}\x1f{key.digest}'.encode('utf-8'), digest_size=6).hexdigest()
+
+    def lookup(self, user_message: str, user_preferences: Dict) -> Optional[str]:
+        """Return the question type to answer with ('pinned:<id>'), or None"""
+        answer_id = self._ids.get((normalize_message(user_message), preferences_key(user_preferences)))
+        return PINNED_PREFIX + answer_id if answer_id else None
+
+    def get(self, question_type: str) -> Optional[str]:
+        answer_id = question_type[len(PINNED_PREFIX):]
+        entry = self._answers.get(answer_id) or self._retired.get(answer_id)
+        return entry['answer'] if entry else None
+
+    def pin(self, message: str, user_preferences: Dict, answer: str, count: int = 0) -> bool:
+        item = (normalize_message(message), preferences_key(user_preferences))
+        answer_id = self._answer_id(item)
+        with self._lock:
+            if answer_id not in self._answers and len(self._answers) >= self.max_entries:
+                return False
+            self._answers[answer_id] = {'message': item[0], 'bucket': item[1].as_dict(),
+                                        'answer': answer, 'count': count, 'pinned_at': time.time()}
+            self._ids[item] = answer_id
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids = {}
+            self._retired = self._answers
+            self._answers = {}
+
+    def entries(self) -> List[Dict]:
+        with self._lock:
+            return [dict(entry, id=answer_id, answer_chars=len(entry['answer']))
+                    for answer_id, entry in self._answers.items()]
+
+
+def promote_top_questions(top_n: int = 10, min_count: int = 5) -> Dict:
+    """Pin answers for the most frequent questions; returns what happened to each candidate"""
+    from llm_integration import llm_generator
+
+    outcome = {'pinned': 0, 'already_pinned': 0, 'below_min_count': 0, 'no_answer': 0, 'store_full': 0}
+    for entry in question_tracker.top(top_n):
+        if entry['count'] < min_count:
+            outcome['below_min_count'] += 1
+            continue
+        if pinned_answers.lookup(entry['message'], entry['preferences']):
+            outcome['already_pinned'] += 1
+            continue
+
+        # Reuse the cached LLM answer when there is one; otherwise generate it now
+        answer = llm_generator.get_cached_response(entry['message'], entry['preferences'])
+        if answer is None and llm_generator.is_available:
+            llm_generator.generate_response(entry['message'], entry['preferences'])
+            answer = llm_generator.get_cached_response(entry['message'], entry['preferences'])
+        if answer is None:
+            outcome['no_answer'] += 1
+            continue
+
+        if pinned_answers.pin(entry['message'], entry['preferences'], answer, entry['count']):
+            outcome['pinned'] += 1
+            metrics.pinned_answer_promotions.inc()
+        else:
+            outcome['store_full'] += 1
+
+    if outcome['pinned']:
+        logger.info("Pinned %d heavy-hitter answers", outcome['pinned'])
+    return outcome
+
+
+def _promotion_loop(interval: float, top_n: int, min_count: int) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            promote_top_questions(top_n, min_count)
+        except Exception as e:
+            logger.error("Heavy-hitter promotion failed: %s", e)
+
+
+def _heavy_hitter_gauges():
+    yield 'heavy_hitter_questions_recorded', 'Free-form chat questions seen by the frequency tracker', {}, question_tracker.total
+    yield 'pinned_answers', 'Precomputed answers promoted from heavy hitters', {}, len(pinned_answers)
+
+
+# Global instances for easy access
+question_tracker = HeavyHitterTracker(
+    width=int(os.getenv('HEAVY_HITTER_SKETCH_WIDTH', '4096')),
+    depth=int(os.getenv('HEAVY_HITTER_SKETCH_DEPTH', '4')),
+    k=int(os.getenv('HEAVY_HITTER_TOP_K', '100'))
+)
+pinned_answers = PinnedAnswerStore(max_entries=int(os.getenv('PINNED_ANSWERS_MAX', '256')))
+metrics.registry.register_gauges(_heavy_hitter_gauges)
+
+if float(os.getenv('HEAVY_HITTER_PROMOTE_INTERVAL', '0')) > 0:
+    # Automatic promotion; off by default, since it can spend LLM calls
+    threading.Thread(target=_promotion_loop, name='heavy-hitter-promotion', daemon=True, args=(
+        float(os.getenv('HEAVY_HITTER_PROMOTE_INTERVAL')),
+        int(os.getenv('HEAVY_HITTER_PROMOTE_TOP', '10')),
+        int(os.getenv('HEAVY_HITTER_PROMOTE_MIN_COUNT', '5'))
+    )).start()
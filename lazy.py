@@ -0,0 +1,51 @@
+"""
+Lazy Singleton Module for LinkedIn Future Career Planning Platform
+
+This module provides LazySingleton, a stand-in for a module-level instance that
+is only built the first time one of its attributes is used. Importing a module
+therefore stays cheap, and code that never touches the instance (CLI tools,
+benchmarks with stubs) never pays for building it.
+"""
+
+import inspect
+import threading
+from typing import Any, Callable
+
+
+class LazySingleton:
+    """Builds the wrapped object on first attribute access and forwards to it"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _get_instance(self) -> Any:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    object.__setattr__(self, '_instance', self._factory())
+                instance = self._instance
+        return instance
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._instance is not None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names not found on the proxy itself
+        value = getattr(self._get_instance(), name)
+        if inspect.ismethod(value):
+            # Keep bound methods on the proxy so later calls skip this hook
+            object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get_instance(), name, value)
+        self.__dict__.pop(name, None)
+
+    def __repr__(self) -> str:
+        if self._instance is None:
+            return f'<LazySingleton of {getattr(self._factory, "__qualname__", self._factory)} (not built)>'
+        return f'<LazySingleton of {self._instance!r}>'
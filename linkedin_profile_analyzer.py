@@ -9,6 +9,8 @@ import re
 import logging
 from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
+from lazy import LazySingleton
+from profile_record import ProfileRecord
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -65,6 +67,26 @@ class LinkedInProfileAnalyzer:
                 "summary": "Marketing professional focused on developing digital marketing skills and leadership capabilities."
             }
         }
+        
+        # Compact records built once; each analysis only stamps its own ID and URL on a template
+        self._profile_templates = {
+            profile_id: ProfileRecord.from_dict(profile) for profile_id, profile in self.sample_profiles.items()
+        }
+        self._default_template = ProfileRecord(
+            name="LinkedIn User",
+            title="Professional",
+            company="Company",
+            location="Location",
+            skills=["Technology", "Leadership"],
+            experience_level="Entry Level",
+            education="Bachelor's Degree",
+            interests=["Technology", "Leadership"],
+            career_goal="advancement",
+            preferred_location="Remote",
+            years_experience="3-5 years",
+            industry="Technology",
+            summary="Professional seeking career advancement opportunities."
+        )
     
     def extract_profile_id(self, linkedin_url: str) -> Optional[str]:
         """Extract profile ID from LinkedIn URL"""
@@ -86,65 +108,48 @@ class LinkedInProfileAnalyzer:
             return None
             
         except Exception as e:
-            logger.error(f"Error extracting profile ID: {e}")
+            logger.error("Error extracting profile ID: %s", e)
             return None
     
-    def analyze_profile(self, linkedin_url: str) -> Optional[Dict]:
+    def analyze_profile(self, linkedin_url: str) -> Optional[ProfileRecord]:
         """Analyze LinkedIn profile and return extracted information"""
         
         profile_id = self.extract_profile_id(linkedin_url)
         if not profile_id:
-            logger.warning(f"Could not extract profile ID from URL: {linkedin_url}")
+            logger.warning("Could not extract profile ID from URL: %s", linkedin_url)
             return None
         
         # For demonstration, use sample data
-        if profile_id in self.sample_profiles:
-            profile_data = self.sample_profiles[profile_id].copy()
-            profile_data['profile_id'] = profile_id
-            profile_data['linkedin_url'] = linkedin_url
-            logger.info(f"Profile analyzed successfully: {profile_id}")
-            return profile_data
+        template = self._profile_templates.get(profile_id)
+        if template is not None:
+            logger.info("Profile analyzed successfully: %s", profile_id)
+            return template.with_identity(profile_id, linkedin_url)
         else:
             # Return default profile for unknown IDs
-            logger.info(f"Using default profile for unknown ID: {profile_id}")
+            logger.info("Using default profile for unknown ID: %s", profile_id)
             return self._get_default_profile(profile_id, linkedin_url)
     
-    def _get_default_profile(self, profile_id: str, linkedin_url: str) -> Dict:
+    def _get_default_profile(self, profile_id: str, linkedin_url: str) -> ProfileRecord:
         """Get default profile data for unknown profile IDs"""
-        return {
-            "name": "LinkedIn User",
-            "title": "Professional",
-            "company": "Company",
-            "location": "Location",
-            "skills": ["Technology", "Leadership"],
-            "experience_level": "Entry Level",
-            "education": "Bachelor's Degree",
-            "interests": ["Technology", "Leadership"],
-            "career_goal": "advancement",
-            "preferred_location": "Remote",
-            "years_experience": "3-5 years",
-            "industry": "Technology",
-            "summary": "Professional seeking career advancement opportunities.",
-            "profile_id": profile_id,
-            "linkedin_url": linkedin_url
-        }
+        return self._default_template.with_identity(profile_id, linkedin_url)
     
     def update_user_preferences(self, profile_data: Dict) -> Dict:
         """Update user preferences based on LinkedIn profile data"""
         
-        # Map profile data to user preferences
+        # Map profile data to user preferences; the record itself is shared, not copied
+        profile = ProfileRecord.coerce(profile_data)
         preferences = {
-            'interests': profile_data.get('interests', ['Technology', 'Leadership']),
-            'career_level': profile_data.get('experience_level', 'Entry Level'),
-            'goal': profile_data.get('career_goal', 'advancement'),
-            'industry': profile_data.get('industry', 'Technology'),
-            'location': profile_data.get('preferred_location', 'Remote'),
-            'experience': profile_data.get('years_experience', '3-5 years'),
+            'interests': list(profile.get('interests', ('Technology', 'Leadership'))),
+            'career_level': profile.get('experience_level', 'Entry Level'),
+            'goal': profile.get('career_goal', 'advancement'),
+            'industry': profile.get('industry', 'Technology'),
+            'location': profile.get('preferred_location', 'Remote'),
+            'experience': profile.get('years_experience', '3-5 years'),
             'linkedin_connected': True,
-            'profile_data': profile_data
+            'profile_data': profile
         }
         
-        logger.info(f"User preferences updated based on LinkedIn profile: {profile_data.get('name', 'Unknown')}")
+        logger.info("User preferences updated based on LinkedIn profile: %s", profile.get('name', 'Unknown'))
         return preferences
     
     def get_personalized_suggestions(self, profile_data: Dict) -> Dict:
@@ -216,4 +221,4 @@ class LinkedInProfileAnalyzer:
         return paths.get(experience_level, "Focus on continuous learning and skill development")
 
 # Global instance for easy access
-linkedin_analyzer = LinkedInProfileAnalyzer()
+linkedin_analyzer = LazySingleton(LinkedInProfileAnalyzer)
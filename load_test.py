@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Load-testing harness for the LinkedIn Future platform
+
+Sends an open-loop stream of requests at a target rate with a realistic mix of
+predefined chat, LLM chat, recommendation and LinkedIn-connect traffic, then
+reports p50/p95/p99 latency, throughput and error rate per endpoint. Latency is
+measured from each request's scheduled send time, so a backed-up server cannot
+hide its queueing delay.
+
+    python load_test.py --url http://127.0.0.1:5000 --rps 500 --duration 30
+    python load_test.py --traffic captured.jsonl --rps 200 --report results.json
+
+A traffic file uses the requests.jsonl layout, one JSON object per line:
+    {"request_id": "r-1", "title": "POST /api/chat", "body": {"message": "..."}}
+`method`/`path` keys are accepted in place of `title`, and `body` may be a JSON string.
+Files written by traffic_recorder.py also carry `headers`, `body_base64` for
+non-JSON bodies (CV uploads) and `offset_ms`, which traffic_replay.py uses to
+keep the recorded pacing.
+"""
+
+import sys
+import json
+import base64
+import time
+import random
+import argparse
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+DEFAULT_PREFERENCES = {
+    'interests': ['Technology', 'Leadership'],
+    'career_level': 'Entry Level',
+    'goal': 'advancement',
+    'industry': 'All Industries',
+    'location': 'Remote',
+    'experience': '3-5 years'
+}
+
+PREDEFINED_QUESTIONS = [
+    'How can I advance from Senior Developer to Tech Lead?',
+    'What skills do I need for a Director position?',
+    'Show me remote job opportunities in tech',
+    'What workshops are available for leadership skills?'
+]
+
+LLM_QUESTIONS = [
+    'How do I become a data scientist?',
+    'What jobs should I enroll in?',
+    'Find useful events for me',
+    'How do I negotiate a higher salary?',
+    'Should I learn Rust or Go next?',
+    'How can I move from marketing into product management?'
+]
+
+PROFILE_URLS = [
+    'https://www.linkedin.com/in/chase-thompson012/',
+    'https://www.linkedin.com/in/john-doe-tech/',
+    'https://www.linkedin.com/in/sarah-marketing/',
+    'https://www.linkedin.com/in/new-visitor-42/'
+]
+
+DEFAULT_MIX = 'predefined=45,llm=15,recommendations=35,connect=5'
+
+
+class TrafficItem:
+    """One request to replay: label, method, path, optional JSON body or raw data, and recorded send offset"""
+
+    __slots__ = ('label', 'method', 'path', 'body', 'data', 'headers', 'offset')
+
+    def __init__(self, label: str, method: str, path: str, body: Optional[Dict] = None,
+                 data: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None,
+                 offset: Optional[float] = None):
+        self.label = label
+        self.method = method
+        self.path = path
+        self.body = body
+        self.data = data
+        self.headers = headers or {}
+        self.offset = offset
+
+
+def synthetic_traffic(mix: Dict[str, float], seed: int) -> Iterator[TrafficItem]:
+    """Endless weighted stream of synthetic requests"""
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[k] for k in kinds]
+
+    while True:
+        kind = rng.choices(kinds, weights)[0]
+        if kind == 'predefined':
+            yield TrafficItem('POST /api/chat [predefined]', 'POST', '/api/chat',
+                              {'message': rng.choice(PREDEFINED_QUESTIONS), 'preferences': DEFAULT_PREFERENCES})
+        elif kind == 'llm':
+            yield TrafficItem('POST /api/chat [llm]', 'POST', '/api/chat',
+                              {'message': rng.choice(LLM_QUESTIONS), 'preferences': DEFAULT_PREFERENCES})
+        elif kind == 'recommendations':
+            query = urllib.parse.urlencode([
+                ('career_level', rng.choice(['Entry Level', 'Mid-Level', 'Senior'])),
+                ('goal', rng.choice(['advancement', 'skill', 'job', 'retirement'])),
+                ('interests', 'Technology'), ('interests', 'Leadership')
+            ])
+            yield TrafficItem('GET /api/recommendations', 'GET', f'/api/recommendations?{query}')
+        elif kind == 'connect':
+            yield TrafficItem('POST /api/connect-linkedin', 'POST', '/api/connect-linkedin',
+                              {'linkedin_url': rng.choice(PROFILE_URLS)})
+        else:
+            raise ValueError(f"Unknown traffic kind: {kind}")
+
+
+def parse_traffic_record(record: Dict) -> TrafficItem:
+    """Turn one requests.jsonl-style record into a TrafficItem"""
+    if 'title' in record and ' ' in str(record['title']):
+        method, path = record['title'].split(' ', 1)
+    else:
+        method, path = record.get('method', 'GET'), record['path']
+
+    body = record.get('body')
+    if isinstance(body, str):
+        body = json.loads(body) if body.strip() else None
+    data = base64.b64decode(record['body_base64']) if 'body_base64' in record else None
+    offset = record['offset_ms'] / 1000.0 if 'offset_ms' in record else None
+
+    return TrafficItem(f"{method.upper()} {path.split('?')[0]}", method.upper(), path, body,
+                       data=data, headers=record.get('headers'), offset=offset)
+
+
+def load_traffic_file(path: str) -> List[TrafficItem]:
+    items = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                items.append(parse_traffic_record(json.loads(line)))
+            except (ValueError, KeyError) as e:
+                print(f"⚠️  Skipping line {line_number} of {path}: {e}")
+    if not items:
+        raise ValueError(f"No usable requests in {path}")
+    return items
+
+
+def replay_forever(items: List[TrafficItem]) -> Iterator[TrafficItem]:
+    while True:
+        for item in items:
+            yield item
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(','):
+        kind, weight = part.split('=')
+        mix[kind.strip()] = float(weight)
+    return mix
+
+
+class Results:
+    """Thread-safe collection of per-endpoint latencies and errors"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.errors = defaultdict(int)
+
+    def add(self, label: str, latency: float, status: int) -> None:
+        with self._lock:
+            self.latencies[label].append(latency)
+            self.statuses[label][status] += 1
+            if status == 0 or status >= 400:
+                self.errors[label] += 1
+
+
+def send(base_url: str, item: TrafficItem, timeout: float) -> int:
+    """Send one request and return the HTTP status (0 on connection failure)"""
+    data = item.data
+    headers = dict(item.headers)
+    if item.body is not None:
+        data = json.dumps(item.body).encode('utf-8')
+        headers['Content-Type'] = 'application/json'
+
+    request = urllib.request.Request(base_url + item.path, data=data, headers=headers, method=item.method)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (urllib.error.URLError, OSError):
+        return 0
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_load(base_url: str, traffic: Iterator[TrafficItem], rps: float, duration: float,
+             concurrency: int, timeout: float, poisson: bool, seed: int) -> Dict:
+    """Issue requests on an open-loop schedule and collect latencies"""
+    results = Results()
+    rng = random.Random(seed)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def worker(item: TrafficItem, scheduled: float) -> None:
+        status = send(base_url, item, timeout)
+        results.add(item.label, time.perf_counter() - scheduled, status)
+
+    start = time.perf_counter()
+    next_send = start
+    sent = 0
+    while next_send - start < duration:
+        now = time.perf_counter()
+        if next_send > now:
+            time.sleep(next_send - now)
+        executor.submit(worker, next(traffic), next_send)
+        sent += 1
+        next_send += rng.expovariate(rps) if poisson else 1.0 / rps
+
+    executor.shutdown(wait=True)
+    elapsed = time.perf_counter() - start
+    return summarize(results, sent, elapsed, rps)
+
+
+def summarize(results: Results, sent: int, elapsed: float, target_rps: float) -> Dict:
+    endpoints = {}
+    all_latencies = []
+    total_errors = 0
+    for label, latencies in sorted(results.latencies.items()):
+        ordered = sorted(latencies)
+        all_latencies.extend(ordered)
+        total_errors += results.errors[label]
+        endpoints[label] = {
+            'requests': len(ordered),
+            'throughput_rps': round(len(ordered) / elapsed, 2),
+            'error_rate': round(results.errors[label] / len(ordered), 4),
+            'p50_ms': round(percentile(ordered, 0.50) * 1000, 2),
+            'p95_ms': round(percentile(ordered, 0.95) * 1000, 2),
+            'p99_ms': round(percentile(ordered, 0.99) * 1000, 2),
+            'max_ms': round(ordered[-1] * 1000, 2),
+            'statuses': {str(k): v for k, v in sorted(results.statuses[label].items())}
+        }
+
+    all_latencies.sort()
+    return {
+        'target_rps': target_rps,
+        'sent': sent,
+        'elapsed_seconds': round(elapsed, 2),
+        'achieved_rps': round(len(all_latencies) / elapsed, 2),
+        'error_rate': round(total_errors / len(all_latencies), 4) if all_latencies else 0.0,
+        'p50_ms': round(percentile(all_latencies, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(all_latencies, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(all_latencies, 0.99) * 1000, 2),
+        'endpoints': endpoints
+    }
+
+
+def print_report(report: Dict) -> None:
+    print(f"\n📊 Sent {report['sent']} requests in {report['elapsed_seconds']}s "
+          f"(target {report['target_rps']} rps, achieved {report['achieved_rps']} rps)")
+    print("-" * 108)
+    print(f"{'endpoint':<40}{'reqs':>8}{'rps':>9}{'err%':>8}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}{'max ms':>11}")
+    for label, stats in report['endpoints'].items():
+        print(f"{label:<40}{stats['requests']:>8}{stats['throughput_rps']:>9}{stats['error_rate'] * 100:>7.2f}%"
+              f"{stats['p50_ms']:>11}{stats['p95_ms']:>11}{stats['p99_ms']:>11}{stats['max_ms']:>11}")
+    print("-" * 108)
+    print(f"{'all':<40}{'':>8}{report['achieved_rps']:>9}{report['error_rate'] * 100:>7.2f}%"
+          f"{report['p50_ms']:>11}{report['p95_ms']:>11}{report['p99_ms']:>11}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Open-loop load generator for the LinkedIn Future API')
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='base URL of the app under test')
+    parser.add_argument('--rps', type=float, default=500.0, help='target requests per second')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds to generate load')
+    parser.add_argument('--concurrency', type=int, default=256, help='maximum requests in flight')
+    parser.add_argument('--timeout', type=float, default=30.0, help='per-request timeout in seconds')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'synthetic traffic weights (default {DEFAULT_MIX})')
+    parser.add_argument('--traffic', help='requests.jsonl-style file to use as the traffic source')
+    parser.add_argument('--poisson', action='store_true', help='exponential inter-arrival times instead of a fixed rate')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--report', help='write the JSON report to this file')
+    args = parser.parse_args()
+
+    if args.traffic:
+        traffic = replay_forever(load_traffic_file(args.traffic))
+        source = args.traffic
+    else:
+        traffic = synthetic_traffic(parse_mix(args.mix), args.seed)
+        source = f'synthetic mix {args.mix}'
+
+    print(f"🚀 Load test against {args.url}: {args.rps} rps for {args.duration}s ({source})")
+    report = run_load(args.url.rstrip('/'), traffic, args.rps, args.duration, args.concurrency,
+                      args.timeout, args.poisson, args.seed)
+    print_report(report)
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to {args.report}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
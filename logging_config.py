@@ -0,0 +1,187 @@
+"""
+Logging Configuration Module for LinkedIn Future Career Planning Platform
+
+This module routes every log record through an in-memory queue so request
+threads never wait on log I/O. A single background listener formats records
+(as JSON lines by default) and writes them out. High-volume INFO lines can be
+sampled per route, while warnings and errors are always kept.
+
+    LOG_LEVEL=INFO LOG_FORMAT=json LOG_INFO_SAMPLE_RATE=1.0 \\
+    LOG_ROUTE_SAMPLE_RATES="/api/chat=0.1,/api/recommendations=0.05" python app.py
+"""
+
+import os
+import sys
+import copy
+import json
+import queue
+import atexit
+import random
+import logging
+import threading
+import contextvars
+import logging.handlers
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import metrics
+
+# Route of the request being handled, attached to every record it logs
+current_route = contextvars.ContextVar('log_route', default=None)
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_STANDARD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_exception_formatter = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload['exc_info'] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class RouteSamplingFilter(logging.Filter):
+    """Tags records with the current route and samples INFO-and-below lines"""
+
+    def __init__(self, default_rate: float = 1.0, route_rates: Optional[Dict[str, float]] = None):
+        super().__init__()
+        self.default_rate = default_rate
+        self.route_rates = route_rates or {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        route = current_route.get()
+        if route is not None and not hasattr(record, 'route'):
+            record.route = route
+
+        if record.levelno > logging.INFO:
+            return True
+
+        rate = self.route_rates.get(route, self.default_rate)
+        if rate >= 1.0:
+            return True
+        if rate > 0 and random.random() < rate:
+            # Lets readers re-weight counts derived from sampled lines
+            record.sample_rate = rate
+            return True
+        return False
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args into the message while they still hold the caller's values;
+        # the (JSON) formatting itself happens on the listener thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_route_rates(text: str) -> Dict[str, float]:
+    rates = {}
+    for part in text.split(','):
+        if '=' in part:
+            route, rate = part.rsplit('=', 1)
+            rates[route.strip()] = float(rate)
+    return rates
+
+
+class LoggingPipeline:
+    """Owns the log queue, its handler and the background listener"""
+
+    def __init__(self):
+        self.handler = None
+        self.listener = None
+        self._lock = threading.Lock()
+
+    def setup(self, level: str = 'INFO', fmt: str = 'json', default_rate: float = 1.0,
+              route_rates: Optional[Dict[str, float]] = None, max_queue: int = 10000) -> None:
+        """Install the queue handler on the root logger (idempotent)"""
+        with self._lock:
+            if self.listener is not None:
+                return
+
+            output = logging.StreamHandler(sys.stderr)
+            if fmt == 'json':
+                output.setFormatter(JsonFormatter())
+            else:
+                output.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s'))
+
+            log_queue = queue.Queue(maxsize=max_queue)
+            self.handler = NonBlockingQueueHandler(log_queue)
+            self.handler.addFilter(RouteSamplingFilter(default_rate, route_rates))
+
+            root = logging.getLogger()
+            for existing in list(root.handlers):
+                root.removeHandler(existing)
+            root.addHandler(self.handler)
+            root.setLevel(level)
+
+            self.listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+            self.listener.start()
+            atexit.register(self.shutdown)
+
+    def shutdown(self) -> None:
+        """Flush queued records and stop the listener"""
+        with self._lock:
+            if self.listener is not None:
+                self.listener.stop()
+                self.listener = None
+
+    @property
+    def dropped(self) -> int:
+        return self.handler.dropped if self.handler else 0
+
+
+# Global instance for easy access
+logging_pipeline = LoggingPipeline()
+
+
+def _logging_gauges():
+    yield 'log_records_dropped', 'Log records dropped because the log queue was full', {}, logging_pipeline.dropped
+    if logging_pipeline.handler is not None:
+        yield 'log_queue_depth', 'Log records waiting for the background writer', {}, logging_pipeline.handler.queue.qsize()
+
+
+metrics.registry.register_gauges(_logging_gauges)
+
+
+def setup_logging() -> None:
+    """Configure logging from LOG_LEVEL, LOG_FORMAT and the sampling variables"""
+    logging_pipeline.setup(
+        level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+        fmt=os.getenv('LOG_FORMAT', 'json'),
+        default_rate=float(os.getenv('LOG_INFO_SAMPLE_RATE', '1.0')),
+        route_rates=parse_route_rates(os.getenv('LOG_ROUTE_SAMPLE_RATES', '')),
+        max_queue=int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+    )
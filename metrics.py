@@ -0,0 +1,361 @@
+"""
+Metrics Module for LinkedIn Future Career Planning Platform
+
+This module records counters, histograms and gauges and renders them in the
+Prometheus text exposition format for the /metrics endpoint.
+
+Recording is an in-memory dictionary update under a per-metric lock, cheap
+enough for every request. When METRICS_MULTIPROC_DIR is set, each worker
+process periodically writes its values to its own file in that directory and
+/metrics merges every file, so counters and histograms add up across workers.
+Gauges are reported per process with a `pid` label in that mode.
+"""
+
+import os
+import json
+import atexit
+import time
+import bisect
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+FAST_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+
+METRIC_PREFIX = 'linkedin_future_'
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    parts = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{name}="{escaped}"')
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonically increasing value per label set"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = METRIC_PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def dump(self) -> List:
+        with self._lock:
+            return [[list(labels), value] for labels, value in self._values.items()]
+
+    @staticmethod
+    def merge(dumps: Iterable[List]) -> Dict[Tuple, float]:
+        merged = {}
+        for dump in dumps:
+            for labels, value in dump:
+                key = tuple(labels)
+                merged[key] = merged.get(key, 0.0) + value
+        return merged
+
+    def render(self, merged: Dict[Tuple, float]) -> List[str]:
+        return [f'{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}'
+                for labels, value in sorted(merged.items())]
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram per label set"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = METRIC_PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                # Per-bucket (non-cumulative) counts plus one overflow slot, then sum
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def time(self, *labels: str) -> '_Timer':
+        """Context manager observing the duration of its block"""
+        return _Timer(self, labels)
+
+    def dump(self) -> List:
+        with self._lock:
+            return [[list(labels), list(counts), total] for labels, (counts, total) in self._values.items()]
+
+    @staticmethod
+    def merge(dumps: Iterable[List]) -> Dict[Tuple, List]:
+        merged = {}
+        for dump in dumps:
+            for labels, counts, total in dump:
+                key = tuple(labels)
+                if key not in merged:
+                    merged[key] = [list(counts), total]
+                else:
+                    merged[key][0] = [a + b for a, b in zip(merged[key][0], counts)]
+                    merged[key][1] += total
+        return merged
+
+    def render(self, merged: Dict[Tuple, List]) -> List[str]:
+        lines = []
+        for labels, (counts, total) in sorted(merged.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}')
+        return lines
+
+
+class _Timer:
+    __slots__ = ('histogram', 'labels', 'started')
+
+    def __init__(self, histogram: Histogram, labels: Tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, *self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """Holds every metric, collects gauges and renders the exposition text"""
+
+    def __init__(self, multiproc_dir: Optional[str] = None, flush_interval: float = 5.0):
+        self.multiproc_dir = multiproc_dir
+        self.flush_interval = flush_interval
+        self._metrics = []
+        self._gauge_callbacks = []
+        self._derived_callbacks = []
+        self._flusher = None
+        self._flusher_lock = threading.Lock()
+
+        if multiproc_dir:
+            self._ensure_flusher()
+            # A forked worker starts from zero and needs its own flusher thread
+            os.register_at_fork(after_in_child=self._after_fork)
+            atexit.register(self.flush)
+
+    def _after_fork(self) -> None:
+        for metric in self._metrics:
+            metric._lock = threading.Lock()
+            metric._values.clear()
+        self._flusher = None
+        self._flusher_lock = threading.Lock()
+        self._ensure_flusher()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_gauges(self, callback: Callable[[], Iterable[Tuple[str, str, Dict[str, str], float]]]) -> None:
+        """Register a callback yielding (name, help, labels, value) tuples at scrape time"""
+        self._gauge_callbacks.append(callback)
+
+    def register_derived(self, callback: Callable[[Dict[str, Dict]], Iterable[Tuple[str, str, Dict[str, str], float]]]) -> None:
+        """Register a callback computing gauges from the merged values of all processes"""
+        self._derived_callbacks.append(callback)
+
+    def _collect_gauges(self) -> List[List]:
+        gauges = []
+        for callback in self._gauge_callbacks:
+            try:
+                for name, documentation, labels, value in callback():
+                    if value is None:
+                        continue
+                    gauges.append([METRIC_PREFIX + name, documentation, labels, float(value)])
+            except Exception as e:
+                logger.error("Gauge callback failed: %s", e)
+        return gauges
+
+    def _snapshot(self) -> Dict:
+        return {
+            'pid': os.getpid(),
+            'metrics': {metric.name: metric.dump() for metric in self._metrics},
+            'gauges': self._collect_gauges()
+        }
+
+    def _ensure_flusher(self) -> None:
+        if not self.multiproc_dir or self._flusher is not None:
+            return
+        with self._flusher_lock:
+            if self._flusher is None:
+                os.makedirs(self.multiproc_dir, exist_ok=True)
+                self._flusher = threading.Thread(target=self._flush_loop, name='metrics-flusher', daemon=True)
+                self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self) -> None:
+        """Write this process's values to its file in the multiprocess directory"""
+        if not self.multiproc_dir:
+            return
+        path = os.path.join(self.multiproc_dir, f'metrics_{os.getpid()}.json')
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._snapshot(), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error("Could not write metrics file %s: %s", path, e)
+
+    def _load_snapshots(self) -> List[Dict]:
+        if not self.multiproc_dir:
+            return [self._snapshot()]
+
+        own = self._snapshot()
+        snapshots = [own]
+        try:
+            names = os.listdir(self.multiproc_dir)
+        except OSError:
+            names = []
+        for filename in names:
+            if not filename.startswith('metrics_') or not filename.endswith('.json'):
+                continue
+            if filename == f'metrics_{own["pid"]}.json':
+                continue
+            try:
+                with open(os.path.join(self.multiproc_dir, filename)) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not _pid_alive(snapshot.get('pid')):
+                # Keep a dead worker's counters, but not its stale gauges
+                snapshot['gauges'] = []
+            snapshots.append(snapshot)
+        return snapshots
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format"""
+        snapshots = self._load_snapshots()
+        lines = []
+        merged_by_name = {}
+
+        for metric in self._metrics:
+            merged = merged_by_name[metric.name] = metric.merge(s['metrics'].get(metric.name, []) for s in snapshots)
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.render(merged))
+
+        gauges = {}
+        for callback in self._derived_callbacks:
+            for name, documentation, labels, value in callback(merged_by_name):
+                gauges.setdefault(METRIC_PREFIX + name, (documentation, []))[1].append((labels, value))
+        for snapshot in snapshots:
+            for name, documentation, labels, value in snapshot['gauges']:
+                if self.multiproc_dir:
+                    labels = dict(labels, pid=str(snapshot['pid']))
+                gauges.setdefault(name, (documentation, []))[1].append((labels, value))
+        for name, (documentation, samples) in sorted(gauges.items()):
+            lines.append(f'# HELP {name} {documentation}')
+            lines.append(f'# TYPE {name} gauge')
+            for labels, value in samples:
+                keys = sorted(labels)
+                lines.append(f'{name}{_format_labels(keys, [labels[k] for k in keys])} {_format_value(value)}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# Global registry and the application's metrics
+registry = MetricsRegistry(multiproc_dir=os.getenv('METRICS_MULTIPROC_DIR'),
+                           flush_interval=float(os.getenv('METRICS_FLUSH_INTERVAL', '5')))
+
+http_request_duration = registry.histogram(
+    'http_request_duration_seconds', 'HTTP request latency by route', ('route', 'method', 'status'))
+predefined_decisions = registry.counter(
+    'predefined_decisions_total', 'Outcome of should_use_predefined_response for chat requests', ('outcome',))
+chat_lane_responses = registry.counter(
+    'chat_responses_total', 'Chat responses by the lane that produced them', ('lane',))
+gemini_request_duration = registry.histogram(
+    'gemini_request_duration_seconds', 'Latency of Gemini generate_content calls', ('model',))
+gemini_errors = registry.counter(
+    'gemini_errors_total', 'Failed Gemini generate_content calls', ('model', 'error'))
+markdown_conversion_duration = registry.histogram(
+    'markdown_conversion_seconds', 'Time spent converting LLM markdown to HTML', buckets=FAST_BUCKETS)
+template_render_duration = registry.histogram(
+    'template_render_seconds', 'Time spent rendering predefined answers and page templates', ('template',),
+    buckets=FAST_BUCKETS)
+cache_lookups = registry.counter(
+    'cache_lookups_total', 'Cache lookups by cache and result', ('cache', 'result'))
+llm_route_decisions = registry.counter(
+    'llm_route_decisions_total', 'Model tier chosen per LLM request, with the deciding signal', ('tier', 'reason'))
+speculative_prefetches = registry.counter(
+    'speculative_prefetches_total', 'Speculative answer prefetches by outcome', ('outcome',))
+pinned_answer_promotions = registry.counter(
+    'pinned_answer_promotions_total', 'Heavy-hitter questions promoted to pinned answers')
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    cache_lookups.inc(cache, 'hit' if hit else 'miss')
+
+
+def _cache_hit_ratios(merged: Dict[str, Dict]):
+    totals = {}
+    for (cache, result), value in merged.get(cache_lookups.name, {}).items():
+        hits, lookups = totals.get(cache, (0.0, 0.0))
+        totals[cache] = (hits + (value if result == 'hit' else 0.0), lookups + value)
+    for cache, (hits, lookups) in sorted(totals.items()):
+        yield 'cache_hit_ratio', 'Share of cache lookups that were hits', {'cache': cache}, hits / lookups if lookups else 0.0
+
+
+registry.register_derived(_cache_hit_ratios)
@@ -0,0 +1,270 @@
+"""
+Model Router Module for LinkedIn Future Career Planning Platform
+
+This module picks an LLM tier for each question from cheap local signals:
+- message length
+- a keyword-based intent (lookup, advice or planning)
+- whether the question is close to one of the predefined intents
+
+Short lookups and near-predefined questions go to the fast tier. Long or
+planning questions go to the quality tier, unless its observed latency (an
+exponentially weighted moving average per tier) would miss the request's
+latency target. A tier skipped for latency still gets one probe request per
+probe interval, so its average can recover.
+
+Backends are pluggable: GeminiBackend talks to the Gemini API, FakeBackend
+returns canned text after a configurable delay for tests and benchmarks.
+RecordingBackend passes calls through and reports each prompt's answer and
+latency; RecordedBackend plays those recordings back for traffic replays.
+"""
+
+import re
+import time
+import hashlib
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+import metrics
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+FAST = 'fast'
+QUALITY = 'quality'
+
+LOOKUP_KEYWORDS = {'show', 'find', 'list', 'search', 'where', 'which', 'available', 'openings',
+                   'jobs', 'events', 'courses', 'workshops', 'remote'}
+PLANNING_KEYWORDS = {'plan', 'strategy', 'transition', 'switch', 'pivot', 'become', 'negotiate',
+                     'compare', 'vs', 'versus', 'roadmap', 'decide', 'should', 'long-term', 'promotion'}
+
+
+class GeminiBackend:
+    """Gemini model; the SDK is imported and configured on first use"""
+
+    def __init__(self, model_name: str, api_key: str, api_endpoint: Optional[str] = None):
+        self.name = model_name
+        self.api_key = api_key
+        self.api_endpoint = api_endpoint
+        self._model = None
+        self._lock = threading.Lock()
+
+    def warm(self) -> None:
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = self._create_model()
+
+    def _create_model(self):
+        import google.generativeai as genai
+
+        if self.api_endpoint:
+            genai.configure(api_key=self.api_key, transport='rest',
+                            client_options={'api_endpoint': self.api_endpoint})
+            logger.info("Gemini API endpoint overridden: %s", self.api_endpoint)
+        else:
+            genai.configure(api_key=self.api_key)
+        logger.info("Gemini model %s configured", self.name)
+        return genai.GenerativeModel(self.name)
+
+    def generate(self, prompt: str) -> str:
+        self.warm()
+        return self._model.generate_content(prompt).text
+
+
+class FakeBackend:
+    """Local stand-in that returns fixed text after a sampled delay"""
+
+    def __init__(self, name: str, text: str, latency: Callable[[], float] = lambda: 0.0,
+                 error: Optional[Exception] = None):
+        self.name = name
+        self.text = text
+        self.latency = latency
+        self.error = error
+        self.calls = 0
+
+    def warm(self) -> None:
+        pass
+
+    def generate(self, prompt: str) -> str:
+        self.calls += 1
+        delay = self.latency()
+        if delay > 0:
+            time.sleep(delay)
+        if self.error is not None:
+            raise self.error
+        return self.text
+
+
+def prompt_key(prompt: str) -> str:
+    """Stable short digest identifying a prompt in LLM recordings"""
+    return hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:20]
+
+
+class RecordingBackend:
+    """Wraps a backend and hands every successful generation to sink"""
+
+    def __init__(self, backend, tier: str, sink: Callable[[Dict], None]):
+        self.backend = backend
+        self.name = backend.name
+        self.tier = tier
+        self.sink = sink
+
+    def warm(self) -> None:
+        self.backend.warm()
+
+    def generate(self, prompt: str) -> str:
+        started = time.perf_counter()
+        text = self.backend.generate(prompt)
+        self.sink({'prompt_key': prompt_key(prompt), 'tier': self.tier, 'model': self.name,
+                   'latency_ms': round((time.perf_counter() - started) * 1000, 1), 'text': text})
+        return text
+
+
+class RecordedBackend:
+    """Answers prompts from recordings, with their recorded latency times latency_scale
+
+    A prompt that was never recorded (say, because the prompt template changed)
+    gets one of this tier's recordings, picked by its digest, and is counted as a miss.
+    """
+
+    def __init__(self, name: str, recordings: Dict[str, Dict], latency_scale: float = 1.0):
+        if not recordings:
+            raise ValueError(f"No recorded LLM responses for {name}")
+        self.name = name
+        self.recordings = recordings
+        self._ordered = [recordings[key] for key in sorted(recordings)]
+        self.latency_scale = latency_scale
+        self.hits = 0
+        self.misses = 0
+
+    def warm(self) -> None:
+        pass
+
+    def generate(self, prompt: str) -> str:
+        key = prompt_key(prompt)
+        recording = self.recordings.get(key)
+        if recording is None:
+            self.misses += 1
+            recording = self._ordered[int(key, 16) % len(self._ordered)]
+        else:
+            self.hits += 1
+        delay = recording['latency_ms'] / 1000.0 * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+        return recording['text']
+
+
+class RouteDecision:
+    """Tier chosen for one request and why"""
+
+    __slots__ = ('tier', 'backend', 'reason')
+
+    def __init__(self, tier: str, backend, reason: str):
+        self.tier = tier
+        self.backend = backend
+        self.reason = reason
+
+
+class ModelRouter:
+    """Chooses a backend tier per request and tracks each tier's latency"""
+
+    def __init__(self, backends: Dict[str, object], latency_target: float = 8.0,
+                 expected_latency: Optional[Dict[str, float]] = None, alpha: float = 0.2,
+                 short_words: int = 6, long_words: int = 25, probe_interval: float = 60.0,
+                 near_match: Optional[Callable[[str], Optional[str]]] = None):
+        if FAST not in backends:
+            raise ValueError("A 'fast' backend is required")
+
+        self.backends = backends
+        self.latency_target = latency_target
+        self.alpha = alpha
+        self.short_words = short_words
+        self.long_words = long_words
+        self.probe_interval = probe_interval
+        self.near_match = near_match
+        # Priors used until a tier has been observed
+        self._latency = {FAST: 2.0, QUALITY: 6.0}
+        self._latency.update(expected_latency or {})
+        self._samples = {tier: 0 for tier in backends}
+        self._last_sample = {tier: time.monotonic() for tier in backends}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def classify(user_message: str) -> str:
+        """Cheap keyword intent: 'lookup', 'planning' or 'advice'"""
+        words = set(re.findall(r"[a-z][a-z'-]*", user_message.lower()))
+        if words & PLANNING_KEYWORDS:
+            return 'planning'
+        if words & LOOKUP_KEYWORDS:
+            return 'lookup'
+        return 'advice'
+
+    def route(self, user_message: str, latency_target: Optional[float] = None) -> RouteDecision:
+        target = self.latency_target if latency_target is None else latency_target
+        word_count = len(user_message.split())
+        intent = self.classify(user_message)
+
+        if word_count <= self.short_words:
+            tier, reason = FAST, 'short'
+        elif intent == 'lookup':
+            tier, reason = FAST, 'lookup'
+        elif self.near_match is not None and self.near_match(user_message):
+            tier, reason = FAST, 'near_predefined'
+        elif intent == 'planning' or word_count >= self.long_words:
+            tier, reason = QUALITY, intent if intent == 'planning' else 'long'
+        else:
+            tier, reason = FAST, 'default'
+
+        if tier == QUALITY:
+            if QUALITY not in self.backends:
+                tier, reason = FAST, 'no_quality_backend'
+            elif self.expected_latency(QUALITY) > target:
+                if self._claim_probe(QUALITY):
+                    # Let one request through now and then so a recovered tier is noticed
+                    reason = 'probe'
+                else:
+                    tier, reason = FAST, 'latency_target'
+
+        metrics.llm_route_decisions.inc(tier, reason)
+        return RouteDecision(tier, self.backends[tier], reason)
+
+    def _claim_probe(self, tier: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sample[tier] < self.probe_interval:
+                return False
+            self._last_sample[tier] = now
+            return True
+
+    def expected_latency(self, tier: str) -> float:
+        with self._lock:
+            return self._latency[tier]
+
+    def record(self, tier: str, elapsed: float) -> None:
+        """Fold an observed call latency into the tier's moving average"""
+        with self._lock:
+            if self._samples.get(tier, 0) == 0:
+                self._latency[tier] = elapsed
+            else:
+                self._latency[tier] += self.alpha * (elapsed - self._latency[tier])
+            self._samples[tier] = self._samples.get(tier, 0) + 1
+            self._last_sample[tier] = time.monotonic()
+
+    def warm(self) -> None:
+        for backend in self.backends.values():
+            backend.warm()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'latency_target_seconds': self.latency_target,
+                'tiers': {
+                    tier: {
+                        'model': backend.name,
+                        'expected_latency_seconds': round(self._latency[tier], 4),
+                        'samples': self._samples[tier]
+                    }
+                    for tier, backend in self.backends.items()
+                }
+            }
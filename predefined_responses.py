@@ -6,22 +6,22 @@ when users have default settings. It provides personalized responses that
 reference user preferences and personality traits.
 """
 
+import os
 import re
 from typing import Dict, List, Optional, Tuple
+import metrics
+from response_cache import ResponseCache
+from preferences import DEFAULT_PREFERENCES, preferences_key
+from profile_record import ProfileRecord
+from heavy_hitters import PINNED_PREFIX, pinned_answers
+from lazy import LazySingleton
 from llm_integration import llm_generator
 
 class PredefinedResponseManager:
     """Manages predefined responses with personality and preference awareness"""
     
     def __init__(self):
-        self.default_preferences = {
-            'interests': ['Technology', 'Leadership'],
-            'career_level': 'Entry Level',
-            'goal': 'advancement',
-            'industry': 'All Industries',
-            'location': 'Remote',
-            'experience': '3-5 years'
-        }
+        self.default_preferences = dict(DEFAULT_PREFERENCES)
         
         # Define the four main questions with their variations
         self.main_questions = {
@@ -68,17 +68,20 @@ class PredefinedResponseManager:
             'networking': 'https://www.linkedin.com/mynetwork/'
         }
 
+        # Word sets of every variation, used for closest-intent matching
+        self._stop_words = {'a', 'an', 'the', 'i', 'me', 'my', 'do', 'for', 'to', 'in', 'of', 'what', 'how', 'can', 'are', 'is', 'show'}
+        self._question_keywords = [
+            (question_type, self._keywords(variation))
+            for question_type, variations in self.main_questions.items()
+            for variation in variations
+        ]
+
+        # Rendered answers keyed by the inputs that shape them; warm-up fills it at startup
+        self.render_cache = ResponseCache('predefined_render', int(os.getenv('PREDEFINED_RENDER_CACHE_SIZE', '1024')), None)
+
     def is_default_preferences(self, user_preferences: Dict) -> bool:
-        """Check if user has default preferences"""
-        for key, value in self.default_preferences.items():
-            if key in user_preferences:
-                if isinstance(value, list):
-                    if set(user_preferences[key]) != set(value):
-                        return False
-                else:
-                    if user_preferences[key] != value:
-                        return False
-        return True
+        """Check if user has default preferences (fields left unset count as default)"""
+        return preferences_key(user_preferences).is_default_or_unset
 
     def match_question(self, user_message: str) -> Optional[str]:
         """Match user message to predefined questions"""
@@ -91,15 +94,64 @@ class PredefinedResponseManager:
         
         return None
 
+    def _keywords(self, text: str) -> set:
+        """Split text into lowercase keywords without stop words"""
+        return set(re.findall(r'[a-z]+', text.lower())) - self._stop_words
+
+    def find_closest_question(self, user_message: str, min_score: float = 0.5) -> Optional[str]:
+        """Return the predefined question type whose wording best overlaps the message"""
+        message_keywords = self._keywords(user_message)
+        if not message_keywords:
+            return None
+
+        best_type, best_score = None, 0.0
+        for question_type, keywords in self._question_keywords:
+            if not keywords:
+                continue
+            score = len(message_keywords & keywords) / len(keywords)
+            if score > best_score:
+                best_type, best_score = question_type, score
+
+        return best_type if best_score >= min_score else None
+
     def get_personality_aware_response(self, question_type: str, user_preferences: Dict) -> str:
         """Generate personality-aware predefined response"""
         
+        if question_type.startswith(PINNED_PREFIX):
+            return pinned_answers.get(question_type)
+
+        with metrics.template_render_duration.time(f'predefined:{question_type}'):
+            key = self._render_key(question_type, user_preferences)
+            response = self.render_cache.get(key)
+            if response is None:
+                response = self._render_personality_aware_response(question_type, user_preferences)
+                self.render_cache.put(key, response)
+            return response
+
+    def _render_key(self, question_type: str, user_preferences: Dict) -> Tuple:
+        """Exactly the inputs _render_personality_aware_response reads, with the same defaults"""
+        profile_data = user_preferences.get('profile_data', {})
+        if user_preferences.get('linkedin_connected', False) and profile_data:
+            return (question_type, 'linkedin') + ProfileRecord.coerce(profile_data).render_fields()
+
+        key = preferences_key(user_preferences)
+        interests = key.get('interests', ('Technology', 'Leadership'))
+        return (
+            question_type, 'default', 'Technology' in interests, 'Leadership' in interests,
+            key.get('location', 'Remote') == 'Remote',
+            key.get('goal', 'advancement') == 'advancement',
+            key.get('experience', '3-5 years')
+        )
+
+    def _render_personality_aware_response(self, question_type: str, user_preferences: Dict) -> str:
+        """Render the predefined answer for a question type"""
+        
         # Extract user preferences for personalization
-        interests = user_preferences.get('interests', ['Technology', 'Leadership'])
-        career_level = user_preferences.get('career_level', 'Entry Level')
-        goal = user_preferences.get('goal', 'advancement')
-        location = user_preferences.get('location', 'Remote')
-        experience = user_preferences.get('experience', '3-5 years')
+        key = preferences_key(user_preferences)
+        interests = key.get('interests', ('Technology', 'Leadership'))
+        goal = key.get('goal', 'advancement')
+        location = key.get('location', 'Remote')
+        experience = key.get('experience', '3-5 years')
         
         # Check if LinkedIn is connected for personalized responses
         linkedin_connected = user_preferences.get('linkedin_connected', False)
@@ -369,42 +421,26 @@ I've updated your "Recommended for You" section with leadership workshops and Li
         # Check if message matches predefined questions exactly
         question_type = self.match_question(user_message)
         if not question_type:
-            return False, None
+            return self._pinned_answer(user_message, user_preferences)
         
-        # For LinkedIn-connected users, always use predefined responses for the four main questions
+        # For LinkedIn-connected users, always use predefined responses for the four main questions.
+        # Only the backend flag counts: the frontend's linkedinConnected comes without profile_data
         linkedin_connected = user_preferences.get('linkedin_connected', False)
         if linkedin_connected:
             return True, question_type
         
-        # For non-LinkedIn users, only use predefined responses if they have default preferences
-        # Check if all key preferences match defaults
-        default_interests = ['Technology', 'Leadership']
-        default_career_level = 'Entry Level'
-        default_goal = 'advancement'
-        default_industry = 'All Industries'
-        default_location = 'Remote'
-        default_experience = '3-5 years'
-        
-        user_interests = user_preferences.get('interests', [])
-        # Handle both career_level and careerLevel (frontend vs backend)
-        user_career_level = user_preferences.get('career_level', user_preferences.get('careerLevel', ''))
-        user_goal = user_preferences.get('goal', '')
-        user_industry = user_preferences.get('industry', '')
-        user_location = user_preferences.get('location', '')
-        user_experience = user_preferences.get('experience', '')
-        
-        # Check if all preferences match defaults
-        interests_match = set(user_interests) == set(default_interests)
-        career_match = user_career_level == default_career_level
-        goal_match = user_goal == default_goal
-        industry_match = user_industry == default_industry
-        location_match = user_location == default_location
-        experience_match = user_experience == default_experience
-        
-        if interests_match and career_match and goal_match and industry_match and location_match and experience_match:
+        # For non-LinkedIn users, only use predefined responses if every key preference is the default
+        if preferences_key(user_preferences).is_default:
             return True, question_type
         
-        return False, None
+        return self._pinned_answer(user_message, user_preferences)
+
+    def _pinned_answer(self, user_message: str, user_preferences: Dict) -> Tuple[bool, Optional[str]]:
+        """Answers promoted from frequent free-form questions, checked before falling through to the LLM"""
+        if not len(pinned_answers):
+            return False, None
+        question_type = pinned_answers.lookup(user_message, user_preferences)
+        return (True, question_type) if question_type else (False, None)
 
     def get_response(self, user_message: str, user_preferences: Dict) -> str:
         """Get appropriate response (predefined or LLM-generated)"""
@@ -438,12 +474,7 @@ What specific aspect would you like to dive deeper into? I'm here to provide per
     def _get_linkedin_personalized_response(self, question_type: str, user_preferences: Dict, profile_data: Dict) -> str:
         """Generate LinkedIn-specific personalized responses"""
         
-        name = profile_data.get('name', 'User')
-        title = profile_data.get('title', 'Professional')
-        company = profile_data.get('company', 'Company')
-        skills = profile_data.get('skills', [])
-        experience_level = profile_data.get('experience_level', 'Entry Level')
-        industry = profile_data.get('industry', 'Technology')
+        name, title, company, skills, experience_level, industry = ProfileRecord.coerce(profile_data).render_fields()
         
         if question_type == 'advancement':
             return self._get_linkedin_advancement_response(name, title, company, skills, experience_level, industry)
@@ -690,4 +721,4 @@ Your background at <strong>{company}</strong> and expertise in <strong>{', '.joi
 I've updated your "Recommended for You" section with {industry} workshops and LinkedIn Learning resources tailored to your profile. Check out the recommendations below! 🔗"""
 
 # Global instance for easy access
-predefined_manager = PredefinedResponseManager()
+predefined_manager = LazySingleton(PredefinedResponseManager)
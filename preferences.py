@@ -0,0 +1,159 @@
+"""
+Preferences Module for LinkedIn Future Career Planning Platform
+
+This module gives user preferences one canonical form. A request's preference
+dict is normalized once, at the request boundary, into a Preferences dict that
+carries a PreferenceKey:
+- careerLevel / linkedinConnected (frontend) and career_level /
+  linkedin_connected (backend) map to the same fields
+- the key holds interests as a sorted, de-duplicated tuple; the dict keeps the
+  user's order, which answers and prompts show
+- strings are interned, and equal keys are the same object
+- the hash, a stable digest and the default-preferences checks are computed
+  once per distinct key
+
+Caches, the default-preferences check and the predefined renderers read the
+key instead of comparing dict fields (and interest sets) on every request.
+"""
+
+import sys
+import hashlib
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+DEFAULT_PREFERENCES = {
+    'interests': ['Technology', 'Leadership'],
+    'career_level': 'Entry Level',
+    'goal': 'advancement',
+    'industry': 'All Industries',
+    'location': 'Remote',
+    'experience': '3-5 years'
+}
+
+FIELDS = ('interests', 'career_level', 'goal', 'industry', 'location', 'experience', 'linkedin_connected')
+
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    return sys.intern(value if isinstance(value, str) else str(value))
+
+
+def _interests(value) -> Optional[Tuple[str, ...]]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = [value]
+    return tuple(sorted({_text(interest) for interest in value if interest is not None}))
+
+
+class PreferenceKey:
+    """Immutable, interned summary of the preference fields that shape an answer
+
+    A field is None when the preferences did not set it, so renderers can still
+    apply their own defaults through get().
+    """
+
+    __slots__ = FIELDS + ('digest', 'is_default', 'is_default_or_unset', '_hash', '__weakref__')
+
+    _interned = weakref.WeakValueDictionary()
+    _intern_lock = threading.Lock()
+
+    def __init__(self, values: Tuple):
+        for field, value in zip(FIELDS, values):
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, '_hash', hash(values))
+        object.__setattr__(self, 'digest', hashlib.blake2b(repr(values).encode('utf-8'), digest_size=8).hexdigest())
+
+        # Every default set (what should_use_predefined_response requires), or each field default or unset
+        matches = [values[FIELDS.index(field)] == _DEFAULT_VALUES[field] for field in DEFAULT_PREFERENCES]
+        unset = [values[FIELDS.index(field)] is None for field in DEFAULT_PREFERENCES]
+        object.__setattr__(self, 'is_default', all(matches))
+        object.__setattr__(self, 'is_default_or_unset', all(match or none for match, none in zip(matches, unset)))
+
+    @classmethod
+    def intern(cls, values: Tuple) -> 'PreferenceKey':
+        key = cls._interned.get(values)
+        if key is None:
+            with cls._intern_lock:
+                key = cls._interned.get(values)
+                if key is None:
+                    key = cls._interned[values] = cls(values)
+        return key
+
+    @classmethod
+    def from_preferences(cls, user_preferences: Dict) -> 'PreferenceKey':
+        return cls.intern((
+            _interests(user_preferences.get('interests')),
+            # Handle both career_level and careerLevel (frontend vs backend)
+            _text(user_preferences.get('career_level', user_preferences.get('careerLevel'))),
+            _text(user_preferences.get('goal')),
+            _text(user_preferences.get('industry')),
+            _text(user_preferences.get('location')),
+            _text(user_preferences.get('experience')),
+            bool(user_preferences.get('linkedin_connected', user_preferences.get('linkedinConnected', False)))
+        ))
+
+    def values(self) -> Tuple:
+        return tuple(getattr(self, field) for field in FIELDS)
+
+    def get(self, field: str, default=None):
+        """Field value, or default when the preferences left it unset (like dict.get)"""
+        value = getattr(self, field)
+        return default if value is None else value
+
+    def as_dict(self) -> Dict:
+        return {field: list(value) if field == 'interests' and value is not None else value
+                for field, value in zip(FIELDS, self.values())}
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PreferenceKey is immutable")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, PreferenceKey):
+            return NotImplemented
+        return self._hash == other._hash and self.values() == other.values()
+
+    def __reduce__(self):
+        # Unpickled keys are interned in the receiving process too
+        return PreferenceKey.intern, (self.values(),)
+
+    def __repr__(self) -> str:
+        return f"PreferenceKey({self.digest}: {', '.join(f'{f}={getattr(self, f)!r}' for f in FIELDS)})"
+
+
+class Preferences(dict):
+    """Preference dict normalized at the request boundary; treat it as read-only"""
+
+    __slots__ = ('key',)
+
+
+def normalize_preferences(user_preferences: Dict) -> Preferences:
+    """Canonical preferences for a request: backend field names plus the PreferenceKey"""
+    if isinstance(user_preferences, Preferences):
+        return user_preferences
+
+    preferences = Preferences(user_preferences)
+    if 'careerLevel' in preferences:
+        preferences.setdefault('career_level', preferences.pop('careerLevel'))
+    preferences.key = PreferenceKey.from_preferences(user_preferences)
+    return preferences
+
+
+def preferences_key(user_preferences: Dict) -> PreferenceKey:
+    """The canonical key of a preference dict; O(1) for normalized preferences"""
+    key = getattr(user_preferences, 'key', None)
+    return key if key is not None else PreferenceKey.from_preferences(user_preferences)
+
+
+_DEFAULT_VALUES = {
+    'interests': _interests(DEFAULT_PREFERENCES['interests']),
+    **{field: _text(value) for field, value in DEFAULT_PREFERENCES.items() if field != 'interests'}
+}
+DEFAULT_PREFERENCE_KEY = PreferenceKey.from_preferences(DEFAULT_PREFERENCES)
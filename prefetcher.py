@@ -0,0 +1,143 @@
+"""
+Speculative Prefetch Module for LinkedIn Future Career Planning Platform
+
+After a LinkedIn profile connects, the UI lists a few recommended questions and
+the user usually clicks one next. This module generates answers to those
+questions in the background, with the user's new preferences, and leaves them
+in the LLM response cache so the click is answered from the cache.
+
+Prefetching is low priority and capped:
+- one background worker and a short queue; when it is full, new work is dropped
+- a question is skipped while every foreground LLM worker is busy or the
+  latency controller is degrading traffic
+- a global token bucket limits speculative Gemini calls per minute
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import metrics
+from degradation_controller import degradation_controller
+from llm_integration import llm_generator
+from predefined_responses import predefined_manager
+from rate_limiter import TokenBucketRateLimiter
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class SpeculativePrefetcher:
+    """Generates likely next answers into the response cache when the LLM is idle"""
+
+    def __init__(self, max_per_minute: float = 10.0, burst: int = 3, max_queue: int = 32,
+                 max_questions: int = 3, max_tracked: int = 4096):
+        self.max_per_minute = max_per_minute
+        self.max_queue = max_queue
+        self.max_questions = max_questions
+        self.max_tracked = max_tracked
+        self.budget = TokenBucketRateLimiter(rate_per_minute=max_per_minute, burst=burst, shards=1)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+        self._queued = 0
+        self._in_flight = set()
+        # Cache keys filled speculatively, to count how many were later used
+        self._prefetched = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_per_minute > 0
+
+    def submit(self, questions: List[str], user_preferences: Dict) -> int:
+        """Queue answers for the given questions; returns how many were queued"""
+        if not self.enabled or not llm_generator.is_available:
+            return 0
+
+        queued = 0
+        for question in questions[:self.max_questions]:
+            key = llm_generator._cache_key(question, user_preferences)
+            with self._lock:
+                if key in self._in_flight:
+                    continue
+                if self._queued >= self.max_queue:
+                    metrics.speculative_prefetches.inc('dropped_queue_full')
+                    continue
+                self._in_flight.add(key)
+                self._queued += 1
+            self._executor.submit(self._prefetch, question, user_preferences, key)
+            metrics.speculative_prefetches.inc('queued')
+            queued += 1
+        return queued
+
+    def _prefetch(self, question: str, user_preferences: Dict, key) -> None:
+        try:
+            outcome = self._generate(question, user_preferences, key)
+        except Exception as e:
+            logger.error("Speculative prefetch failed: %s", e)
+            outcome = 'failed'
+        finally:
+            with self._lock:
+                self._queued -= 1
+                self._in_flight.discard(key)
+        metrics.speculative_prefetches.inc(outcome)
+
+    def _generate(self, question: str, user_preferences: Dict, key) -> str:
+        if key in llm_generator.response_cache:
+            return 'skipped_cached'
+        if predefined_manager.should_use_predefined_response(question, user_preferences)[0]:
+            return 'skipped_predefined'
+        if self._foreground_busy():
+            return 'skipped_busy'
+        if not self.budget.acquire('speculative')[0]:
+            return 'skipped_budget'
+
+        llm_generator.generate_response(question, user_preferences)
+        if key not in llm_generator.response_cache:
+            # generate_response only caches real answers, not its error fallback
+            return 'failed'
+
+        with self._lock:
+            self._prefetched[key] = False
+            while len(self._prefetched) > self.max_tracked:
+                self._prefetched.popitem(last=False)
+        return 'generated'
+
+    def _foreground_busy(self) -> bool:
+        # Imported here: the scheduler itself imports this module
+        from request_scheduler import request_scheduler
+
+        stats = request_scheduler.get_stats()
+        return (stats['llm_pending'] >= stats['max_workers']
+                or degradation_controller.get_state()['degraded_fraction'] > 0)
+
+    def record_cache_hit(self, user_message: str, user_preferences: Dict) -> None:
+        """Count the first cache hit on a speculatively filled entry"""
+        if not self._prefetched:
+            return
+        key = llm_generator._cache_key(user_message, user_preferences)
+        with self._lock:
+            if self._prefetched.get(key) is False:
+                self._prefetched[key] = True
+                metrics.speculative_prefetches.inc('used')
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            used = sum(1 for hit in self._prefetched.values() if hit)
+            return {
+                'enabled': self.enabled,
+                'max_per_minute': self.max_per_minute,
+                'queued': self._queued,
+                'tracked_entries': len(self._prefetched),
+                'used_entries': used
+            }
+
+
+# Global instance for easy access
+speculative_prefetcher = SpeculativePrefetcher(
+    max_per_minute=float(os.getenv('SPECULATIVE_PREFETCH_PER_MINUTE', '10')),
+    burst=int(os.getenv('SPECULATIVE_PREFETCH_BURST', '3')),
+    max_queue=int(os.getenv('SPECULATIVE_PREFETCH_QUEUE', '32'))
+)
@@ -0,0 +1,117 @@
+"""
+Profile Record Module for LinkedIn Future Career Planning Platform
+
+This module holds analyzed LinkedIn profiles as compact, immutable records
+instead of per-request dict copies:
+- one __slots__ object per profile, with no per-instance dict
+- low-cardinality strings (industry, experience level, locations, goals) and
+  skill / interest names are interned, so millions of profiles share them
+- skills and interests are tuples
+- read-only Mapping access (record['name'], record.get(...)) for code that
+  treats a profile as a dict, and to_dict() for the original JSON shape
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Dict, Tuple
+
+PROFILE_FIELDS = (
+    'name', 'title', 'company', 'location', 'skills', 'experience_level', 'education', 'interests',
+    'career_goal', 'preferred_location', 'years_experience', 'industry', 'summary', 'profile_id', 'linkedin_url'
+)
+
+INTERNED_FIELDS = frozenset({
+    'location', 'experience_level', 'education', 'career_goal', 'preferred_location', 'years_experience', 'industry'
+})
+LIST_FIELDS = frozenset({'skills', 'interests'})
+
+_FIELD_SET = frozenset(PROFILE_FIELDS)
+
+
+def _normalize(field: str, value):
+    if value is None:
+        return None
+    if field in LIST_FIELDS:
+        return tuple(sys.intern(str(item)) for item in value)
+    if field in INTERNED_FIELDS:
+        return sys.intern(str(value))
+    return value
+
+
+class ProfileRecord(Mapping):
+    """Immutable analyzed profile; fields that were never set are None"""
+
+    __slots__ = PROFILE_FIELDS
+
+    def __init__(self, *values, **fields):
+        values = values + (None,) * (len(PROFILE_FIELDS) - len(values))
+        for field, value in zip(PROFILE_FIELDS, values):
+            object.__setattr__(self, field, _normalize(field, fields.pop(field, value)))
+        if fields:
+            raise TypeError(f"Unknown profile fields: {', '.join(sorted(fields))}")
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ProfileRecord':
+        return cls(**{field: data[field] for field in PROFILE_FIELDS if field in data})
+
+    @classmethod
+    def coerce(cls, profile_data) -> 'ProfileRecord':
+        """Records pass through; dicts (e.g. from older callers) are converted"""
+        return profile_data if isinstance(profile_data, cls) else cls.from_dict(profile_data or {})
+
+    def with_identity(self, profile_id: str, linkedin_url: str) -> 'ProfileRecord':
+        """A copy of this template for one analyzed URL; every other field is shared"""
+        record = object.__new__(ProfileRecord)
+        for field in PROFILE_FIELDS[:-2]:
+            object.__setattr__(record, field, getattr(self, field))
+        object.__setattr__(record, 'profile_id', profile_id)
+        object.__setattr__(record, 'linkedin_url', linkedin_url)
+        return record
+
+    def render_fields(self) -> Tuple[str, str, str, Tuple[str, ...], str, str]:
+        """(name, title, company, skills, experience_level, industry) with the renderers' defaults"""
+        return (
+            'User' if self.name is None else self.name,
+            'Professional' if self.title is None else self.title,
+            'Company' if self.company is None else self.company,
+            () if self.skills is None else self.skills,
+            'Entry Level' if self.experience_level is None else self.experience_level,
+            'Technology' if self.industry is None else self.industry
+        )
+
+    def to_dict(self) -> Dict:
+        """The JSON shape analyze_profile has always returned"""
+        return {field: list(value) if field in LIST_FIELDS else value for field, value in self.items()}
+
+    def __getitem__(self, field: str):
+        value = getattr(self, field, None) if field in _FIELD_SET else None
+        if value is None:
+            raise KeyError(field)
+        return value
+
+    def get(self, field: str, default=None):
+        # Mapping.get goes through __getitem__ and a KeyError for every missing field
+        value = getattr(self, field, None) if field in _FIELD_SET else None
+        return default if value is None else value
+
+    def __iter__(self):
+        return (field for field in PROFILE_FIELDS if getattr(self, field) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for field in PROFILE_FIELDS if getattr(self, field) is not None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ProfileRecord is immutable")
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ProfileRecord):
+            return all(getattr(self, field) == getattr(other, field) for field in PROFILE_FIELDS)
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return ProfileRecord, tuple(getattr(self, field) for field in PROFILE_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"ProfileRecord(profile_id={self.profile_id!r}, name={self.name!r}, industry={self.industry!r})"
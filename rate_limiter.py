@@ -0,0 +1,183 @@
+"""
+Rate Limiter Module for LinkedIn Future Career Planning Platform
+
+This module provides per-client token buckets for chat requests that will reach
+the LLM. Buckets are keyed by session or IP address. The in-process limiter
+shards its state across independently locked partitions so it does not become a
+contention point; the SQLite-backed limiter shares buckets between worker
+processes on the same machine.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class RateLimited(Exception):
+    """Raised when a client has used up its LLM token bucket"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limit exceeded, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucketRateLimiter:
+    """In-process token buckets, sharded by key hash"""
+
+    def __init__(self, rate_per_minute: float = 20.0, burst: int = 5, shards: int = 32,
+                 max_keys_per_shard: int = 4096):
+        self.rate = rate_per_minute / 60.0
+        self.burst = float(burst)
+        self.max_keys_per_shard = max_keys_per_shard
+        self._shards = [(threading.Lock(), {}) for _ in range(shards)]
+        self._rejected = 0
+
+    def acquire(self, key: str, cost: float = 1.0) -> Tuple[bool, float]:
+        """Take tokens from the key's bucket; returns (allowed, retry_after_seconds)"""
+        lock, buckets = self._shards[hash(key) % len(self._shards)]
+        now = time.monotonic()
+
+        with lock:
+            bucket = buckets.get(key)
+            if bucket is None:
+                if len(buckets) >= self.max_keys_per_shard:
+                    self._evict_idle(buckets, now)
+                bucket = buckets[key] = [self.burst, now]
+
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens >= cost:
+                bucket[0] = tokens - cost
+                return True, 0.0
+
+            bucket[0] = tokens
+
+        self._rejected += 1
+        return False, (cost - tokens) / self.rate if self.rate else float('inf')
+
+    def _evict_idle(self, buckets: Dict, now: float) -> None:
+        """Drop buckets that have refilled completely; they carry no state"""
+        refill_time = self.burst / self.rate if self.rate else float('inf')
+        idle = [k for k, (_, updated) in buckets.items() if now - updated >= refill_time]
+        for k in idle:
+            del buckets[k]
+        if len(buckets) >= self.max_keys_per_shard:
+            # Everyone is active: forget the least recently seen half
+            for k, _ in sorted(buckets.items(), key=lambda item: item[1][1])[:len(buckets) // 2]:
+                del buckets[k]
+
+    def get_stats(self) -> Dict:
+        """Return limiter configuration and counters"""
+        return {
+            'mode': 'memory',
+            'rate_per_minute': self.rate * 60.0,
+            'burst': self.burst,
+            'tracked_keys': sum(len(buckets) for _, buckets in self._shards),
+            'rejected': self._rejected
+        }
+
+
+class SQLiteTokenBucketRateLimiter:
+    """Token buckets stored in SQLite so several worker processes share one budget"""
+
+    def __init__(self, db_path: str, rate_per_minute: float = 20.0, burst: int = 5,
+                 purge_interval: float = 300.0):
+        self.db_path = db_path
+        self.rate = rate_per_minute / 60.0
+        self.burst = float(burst)
+        # A bucket untouched for this long has refilled completely and carries no state
+        self.refill_time = self.burst / self.rate if self.rate else float('inf')
+        self.purge_interval = purge_interval
+        self._next_purge = time.time() + purge_interval
+        self._local = threading.local()
+        self._rejected = 0
+        self._purged = 0
+
+        conn = self._connection()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS token_buckets ('
+                     'key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)')
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=1.0, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def acquire(self, key: str, cost: float = 1.0) -> Tuple[bool, float]:
+        """Take tokens from the shared bucket; returns (allowed, retry_after_seconds)"""
+        conn = self._connection()
+        now = time.time()
+
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT tokens, updated FROM token_buckets WHERE key = ?', (key,)).fetchone()
+            tokens = self.burst if row is None else min(self.burst, row[0] + (now - row[1]) * self.rate)
+
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            conn.execute('INSERT OR REPLACE INTO token_buckets (key, tokens, updated) VALUES (?, ?, ?)',
+                         (key, tokens, now))
+            conn.execute('COMMIT')
+            if now >= self._next_purge:
+                self._purge_idle(conn, now)
+        except sqlite3.Error as e:
+            # Never turn a limiter failure into a user-facing error
+            logger.error("Rate limiter database error: %s", e)
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            return True, 0.0
+
+        if allowed:
+            return True, 0.0
+
+        self._rejected += 1
+        return False, (cost - tokens) / self.rate if self.rate else float('inf')
+
+    def _purge_idle(self, conn: sqlite3.Connection, now: float) -> None:
+        """Delete buckets idle past their refill horizon so the table does not grow with every client"""
+        self._next_purge = now + self.purge_interval
+        if self.refill_time == float('inf'):
+            return
+        deleted = conn.execute('DELETE FROM token_buckets WHERE updated <= ?', (now - self.refill_time,)).rowcount
+        self._purged += deleted
+        if deleted:
+            logger.debug("Purged %d idle rate-limit buckets", deleted)
+
+    def get_stats(self) -> Dict:
+        """Return limiter configuration and counters"""
+        return {
+            'mode': 'sqlite',
+            'db_path': self.db_path,
+            'rate_per_minute': self.rate * 60.0,
+            'burst': self.burst,
+            'rejected': self._rejected,
+            'purged': self._purged
+        }
+
+
+def create_rate_limiter() -> Optional[object]:
+    """Build the configured limiter, or None when rate limiting is disabled"""
+    rate = float(os.getenv('LLM_RATE_LIMIT_PER_MINUTE', '20'))
+    burst = int(os.getenv('LLM_RATE_LIMIT_BURST', '5'))
+    db_path = os.getenv('LLM_RATE_LIMIT_DB')
+
+    if rate <= 0:
+        return None
+    if db_path:
+        return SQLiteTokenBucketRateLimiter(db_path, rate_per_minute=rate, burst=burst,
+                                            purge_interval=float(os.getenv('LLM_RATE_LIMIT_PURGE_SECONDS', '300')))
+    return TokenBucketRateLimiter(rate_per_minute=rate, burst=burst)
+
+
+# Global instance for easy access
+llm_rate_limiter = create_rate_limiter()
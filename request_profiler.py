@@ -0,0 +1,238 @@
+"""
+Request Profiler Module for LinkedIn Future Career Planning Platform
+
+This module captures per-request profiles, either on demand (PROFILE_ON_DEMAND
+is on and an admin sends the X-Profile header with the admin token) or for a
+random sample of requests. Two modes are available:
+
+- 'sample': a single background thread takes stack samples of the profiled
+  request threads every few milliseconds and aggregates them as collapsed
+  stacks, ready for flamegraph.pl or speedscope.
+- 'cprofile': the request runs under cProfile and the results are merged into
+  one pstats table.
+
+When neither a sample rate nor on-demand profiling is configured, the app does
+not install any profiling hooks; setting ADMIN_TOKEN alone does not enable them.
+"""
+
+import io
+import os
+import sys
+import time
+import hmac
+import random
+import marshal
+import pstats
+import cProfile
+import logging
+import threading
+import contextvars
+from collections import Counter
+from typing import Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Route of the request being profiled, copied into LLM worker threads
+_profiled_route = contextvars.ContextVar('profiled_route', default=None)
+
+
+class StackSampler:
+    """Samples the stacks of registered threads on one background thread"""
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 64):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks = Counter()
+        self._targets = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def add_target(self, thread_id: int, root: str) -> None:
+        with self._lock:
+            self._targets[thread_id] = root
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def remove_target(self, thread_id: int) -> None:
+        with self._lock:
+            self._targets.pop(thread_id, None)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                targets = dict(self._targets)
+            if not targets:
+                self._wakeup.clear()
+                self._wakeup.wait()
+                continue
+
+            frames = sys._current_frames()
+            for thread_id, root in targets.items():
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self._record(root, frame)
+            time.sleep(self.interval)
+
+    def _record(self, root: str, frame) -> None:
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            module = os.path.splitext(os.path.basename(code.co_filename))[0]
+            names.append(f'{module}:{code.co_name}')
+            frame = frame.f_back
+        names.append(root)
+        stack = ';'.join(reversed(names))
+        with self._lock:
+            self.stacks[stack] += 1
+
+    def collapsed(self) -> str:
+        with self._lock:
+            return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stacks.clear()
+
+
+class RequestProfiler:
+    """Decides which requests to profile and aggregates their profiles"""
+
+    MODES = ('sample', 'cprofile')
+
+    def __init__(self, sample_rate: float = 0.0, admin_token: Optional[str] = None, mode: str = 'sample',
+                 sample_interval: float = 0.005, on_demand: bool = False):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiling mode: {mode}")
+
+        self.sample_rate = sample_rate
+        # X-Profile is only honoured when on-demand profiling is switched on
+        self.admin_token = admin_token if on_demand else None
+        self.mode = mode
+        self.sampler = StackSampler(interval=sample_interval)
+        self.profiled_requests = 0
+        self.skipped_profiles = 0
+        self._stats = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or bool(self.admin_token)
+
+    def is_admin(self, token: Optional[str]) -> bool:
+        return bool(self.admin_token) and token is not None and hmac.compare_digest(token, self.admin_token)
+
+    def should_profile(self, profile_header: Optional[str]) -> bool:
+        if profile_header is not None and self.is_admin(profile_header):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self, route: str):
+        """Begin profiling the current request; returns a handle for stop()"""
+        token = _profiled_route.set(route)
+        return self._begin(route), token
+
+    def stop(self, handle) -> None:
+        profile_handle, token = handle
+        _profiled_route.reset(token)
+        if profile_handle is None:
+            return
+        self._end(profile_handle)
+        with self._lock:
+            self.profiled_requests += 1
+
+    def run_in_worker(self, func, *args, **kwargs):
+        """Run func on a worker thread, profiled when the submitting request is
+
+        Submit it through contextvars.copy_context().run so the request's
+        profiling state reaches the worker.
+        """
+        route = _profiled_route.get()
+        if route is None:
+            return func(*args, **kwargs)
+
+        handle = self._begin(f'{route} [worker]')
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if handle is not None:
+                self._end(handle)
+
+    def _begin(self, root: str):
+        """Start profiling the current thread; None when it cannot be profiled right now"""
+        if self.mode == 'cprofile':
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12+ allows one active cProfile per process, so concurrent
+                # requests (or a request and its LLM worker) skip profiling instead of failing
+                with self._lock:
+                    self.skipped_profiles += 1
+                return None
+            return profile
+
+        thread_id = threading.get_ident()
+        self.sampler.add_target(thread_id, f'route:{root}')
+        return thread_id
+
+    def _end(self, handle) -> None:
+        if isinstance(handle, cProfile.Profile):
+            handle.disable()
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(handle)
+                else:
+                    self._stats.add(handle)
+        else:
+            self.sampler.remove_target(handle)
+
+    def export(self, fmt: str) -> bytes:
+        """Return the aggregated profile as 'collapsed', 'pstats' or 'text'"""
+        if fmt == 'collapsed':
+            return self.sampler.collapsed().encode('utf-8')
+
+        with self._lock:
+            stats = self._stats
+            if fmt == 'pstats':
+                # Same payload pstats.Stats.dump_stats() writes; load with pstats.Stats(path)
+                return marshal.dumps(stats.stats) if stats else marshal.dumps({})
+            if fmt == 'text':
+                if stats is None:
+                    return b'No cProfile data collected yet.\n'
+                buffer = io.StringIO()
+                stats.stream = buffer
+                stats.sort_stats('cumulative').print_stats(60)
+                return buffer.getvalue().encode('utf-8')
+
+        raise ValueError(f"Unknown profile format: {fmt}")
+
+    def reset(self) -> None:
+        self.sampler.reset()
+        with self._lock:
+            self._stats = None
+            self.profiled_requests = 0
+            self.skipped_profiles = 0
+
+    def get_stats(self) -> Dict:
+        return {
+            'enabled': self.enabled,
+            'mode': self.mode,
+            'sample_rate': self.sample_rate,
+            'profiled_requests': self.profiled_requests,
+            'skipped_profiles': self.skipped_profiles,
+            'distinct_stacks': len(self.sampler.stacks)
+        }
+
+
+# Global instance for easy access
+request_profiler = RequestProfiler(
+    sample_rate=float(os.getenv('PROFILE_SAMPLE_RATE', '0')),
+    admin_token=os.getenv('ADMIN_TOKEN') or None,
+    mode=os.getenv('PROFILE_MODE', 'sample'),
+    sample_interval=float(os.getenv('PROFILE_SAMPLE_INTERVAL', '0.005')),
+    on_demand=os.getenv('PROFILE_ON_DEMAND', 'off').lower() == 'on'
+)
@@ -0,0 +1,215 @@
+"""
+Request Scheduler Module for LinkedIn Future Career Planning Platform
+
+This module provides priority admission control for chat requests. Predefined
+and fallback answers are rendered inline on the request thread (the fast lane),
+while LLM-bound work is handed to a bounded worker pool with a queue-depth
+limit, so a Gemini backlog cannot delay the cheap path.
+"""
+
+import os
+import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Optional, Tuple
+
+import metrics
+from llm_integration import llm_generator
+from degradation_controller import degradation_controller
+from predefined_responses import predefined_manager
+from rate_limiter import llm_rate_limiter, RateLimited
+from request_profiler import request_profiler
+from prefetcher import speculative_prefetcher
+from heavy_hitters import PINNED_PREFIX, question_tracker
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class SchedulerOverloaded(Exception):
+    """Raised when the LLM queue is full and the overload policy is 'reject'"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"LLM queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class RequestScheduler:
+    """Routes chat requests to the fast lane or to the bounded LLM worker pool"""
+
+    OVERLOAD_POLICIES = ('fallback', 'reject')
+
+    def __init__(self, max_workers: int = 4, max_queue_depth: int = 16,
+                 wait_timeout: Optional[float] = 30.0, overload_policy: str = 'fallback',
+                 retry_after: int = 2):
+        if overload_policy not in self.OVERLOAD_POLICIES:
+            raise ValueError(f"Unknown overload policy: {overload_policy}")
+
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.wait_timeout = wait_timeout
+        self.overload_policy = overload_policy
+        self.retry_after = retry_after
+
+        # One slot per running or queued LLM call; acquiring never blocks
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue_depth)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm-worker')
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {
+            'fast_lane': 0,
+            'degraded': 0,
+            'rate_limited': 0,
+            'llm_admitted': 0,
+            'llm_rejected': 0,
+            'llm_timeouts': 0
+        }
+
+    def get_response(self, user_message: str, user_preferences: Dict, client_key: Optional[str] = None,
+                     latency_target: Optional[float] = None, history=None) -> str:
+        """Return a chat response, serving cheap answers without touching the LLM pool
+
+        history is the session's ConversationContext; with one, cached LLM answers are skipped.
+        """
+
+        response, lane = self._get_fast_lane_response(user_message, user_preferences, history)
+        if response is not None:
+            self._increment('fast_lane')
+            metrics.chat_lane_responses.inc(lane)
+            return response
+
+        if degradation_controller.should_degrade():
+            self._increment('degraded')
+            metrics.chat_lane_responses.inc('degraded')
+            return self._get_degraded_response(user_message, user_preferences)
+
+        # Only requests that would reach the LLM spend rate-limit tokens
+        if client_key and llm_rate_limiter is not None:
+            allowed, retry_after = llm_rate_limiter.acquire(client_key)
+            if not allowed:
+                self._increment('rate_limited')
+                metrics.chat_lane_responses.inc('rate_limited')
+                raise RateLimited(retry_after)
+
+        if not self._slots.acquire(blocking=False):
+            self._increment('llm_rejected')
+            logger.warning("LLM queue full (%d pending), applying '%s' policy", self._pending, self.overload_policy)
+            if self.overload_policy == 'reject':
+                metrics.chat_lane_responses.inc('rejected')
+                raise SchedulerOverloaded(self.retry_after)
+            metrics.chat_lane_responses.inc('overload_fallback')
+            return predefined_manager._get_fallback_response(user_message, user_preferences)
+
+        if latency_target is not None and self.wait_timeout is not None:
+            # A model tier expected to outlast the wait timeout would only produce a fallback
+            latency_target = min(latency_target, self.wait_timeout)
+
+        try:
+            # Carry the request context over so a profiled request is profiled in the worker too
+            context = contextvars.copy_context()
+            future = self._executor.submit(context.run, request_profiler.run_in_worker,
+                                           llm_generator.generate_response, user_message, user_preferences,
+                                           latency_target, history)
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._pending += 1
+            self._stats['llm_admitted'] += 1
+        future.add_done_callback(self._release_slot)
+
+        try:
+            response = future.result(timeout=self.wait_timeout)
+            metrics.chat_lane_responses.inc('llm')
+            return response
+        except FutureTimeoutError:
+            # The call keeps its slot until Gemini answers, so the queue limit stays honest
+            self._increment('llm_timeouts')
+            metrics.chat_lane_responses.inc('llm_timeout')
+            logger.warning("LLM response exceeded %ss, serving fallback", self.wait_timeout)
+            return predefined_manager._get_fallback_response(user_message, user_preferences)
+
+    def _get_fast_lane_response(self, user_message: str, user_preferences: Dict,
+                                history=None) -> Tuple[Optional[str], Optional[str]]:
+        """Return (answer, lane) for predefined, cached or fallback answers, or (None, None) when the LLM is needed"""
+
+        should_use, question_type = predefined_manager.should_use_predefined_response(user_message, user_preferences)
+        metrics.predefined_decisions.inc('predefined' if should_use else 'llm')
+        if should_use and question_type:
+            lane = 'pinned' if question_type.startswith(PINNED_PREFIX) else 'predefined'
+            return predefined_manager.get_personality_aware_response(question_type, user_preferences), lane
+
+        if not llm_generator.is_available:
+            return llm_generator._get_fallback_response(user_message, user_preferences), 'fallback'
+
+        question_tracker.record(user_message, user_preferences)
+        if history:
+            # A follow-up depends on the conversation, so a cached answer does not apply
+            return None, None
+
+        cached = llm_generator.get_cached_response(user_message, user_preferences)
+        if cached is not None:
+            speculative_prefetcher.record_cache_hit(user_message, user_preferences)
+            return cached, 'cache'
+
+        return None, None
+
+    def _get_degraded_response(self, user_message: str, user_preferences: Dict) -> str:
+        """Answer without the LLM: closest predefined intent if one is near, else fallback"""
+
+        question_type = predefined_manager.find_closest_question(user_message)
+        if question_type:
+            return predefined_manager.get_personality_aware_response(question_type, user_preferences)
+        return predefined_manager._get_fallback_response(user_message, user_preferences)
+
+    def _release_slot(self, future) -> None:
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def _increment(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def get_stats(self) -> Dict:
+        """Return a snapshot of the scheduler counters and limits"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['llm_pending'] = self._pending
+        stats['max_workers'] = self.max_workers
+        stats['max_queue_depth'] = self.max_queue_depth
+        stats['overload_policy'] = self.overload_policy
+        return stats
+
+
+def _scheduler_gauges():
+    stats = request_scheduler.get_stats()
+    yield 'llm_pending_requests', 'LLM requests running or queued', {}, stats['llm_pending']
+    yield 'llm_max_workers', 'Configured LLM worker pool size', {}, stats['max_workers']
+    yield 'llm_max_queue_depth', 'Configured LLM queue-depth limit', {}, stats['max_queue_depth']
+
+    state = degradation_controller.get_state()
+    yield 'llm_degraded_fraction', 'Share of LLM-bound requests currently degraded', {}, state['degraded_fraction']
+    yield 'llm_latency_p95_seconds', 'Rolling p95 of Gemini call latency', {}, state['p95_seconds']
+    yield 'llm_slo_p95_seconds', 'Configured Gemini p95 latency SLO', {}, state['slo_p95_seconds']
+    yield 'llm_slo_recovery_threshold_seconds', 'p95 below which degradation is reduced', {}, state['recovery_threshold_seconds']
+    for mode in ('normal', 'degrading', 'recovering'):
+        yield 'llm_degradation_mode', 'Current degradation controller mode', {'mode': mode}, 1 if state['mode'] == mode else 0
+
+    if llm_rate_limiter is not None:
+        yield 'llm_rate_limiter_rejections', 'Requests refused by the LLM rate limiter in this process', {}, llm_rate_limiter.get_stats()['rejected']
+
+
+# Global instance for easy access
+request_scheduler = RequestScheduler(
+    max_workers=int(os.getenv('LLM_MAX_WORKERS', '4')),
+    max_queue_depth=int(os.getenv('LLM_MAX_QUEUE_DEPTH', '16')),
+    wait_timeout=float(os.getenv('LLM_WAIT_TIMEOUT', '30')),
+    overload_policy=os.getenv('LLM_OVERLOAD_POLICY', 'fallback'),
+    retry_after=int(os.getenv('LLM_RETRY_AFTER', '2'))
+)
+
+metrics.registry.register_gauges(_scheduler_gauges)
@@ -0,0 +1,131 @@
+"""
+Request Schemas Module for LinkedIn Future Career Planning Platform
+
+This module decodes and validates the JSON bodies of /api/chat and
+/api/connect-linkedin in one pass with msgspec's compiled decoders:
+- typed schemas with length limits on every string and list
+- bodies larger than MAX_JSON_BODY_BYTES, malformed JSON and wrongly typed
+  fields raise RequestValidationError, which the app answers with a 400
+  before any handler code runs
+- decoded preferences come out as the canonical Preferences dict (with its
+  PreferenceKey), and a nested profile as a ProfileRecord
+
+It also holds the msgspec encoder the app's JSON provider uses for responses.
+"""
+
+import os
+from typing import Annotated, List, Optional
+
+import msgspec
+from msgspec import Meta, Struct
+
+from preferences import DEFAULT_PREFERENCES, Preferences, normalize_preferences
+from profile_record import PROFILE_FIELDS, ProfileRecord
+
+MAX_BODY_BYTES = int(os.getenv('MAX_JSON_BODY_BYTES', '16384'))
+MAX_MESSAGE_CHARS = int(os.getenv('MAX_CHAT_MESSAGE_CHARS', '4000'))
+
+Label = Annotated[str, Meta(max_length=100)]
+Labels = Annotated[List[Label], Meta(max_length=32)]
+Text = Annotated[str, Meta(max_length=2000)]
+
+
+class RequestValidationError(ValueError):
+    """Raised when a request body cannot be decoded into its schema"""
+
+
+class ProfileBody(Struct, omit_defaults=True):
+    """A profile as returned by /api/connect-linkedin and sent back inside preferences"""
+
+    name: Optional[Label] = None
+    title: Optional[Label] = None
+    company: Optional[Label] = None
+    location: Optional[Label] = None
+    skills: Optional[Labels] = None
+    experience_level: Optional[Label] = None
+    education: Optional[Label] = None
+    interests: Optional[Labels] = None
+    career_goal: Optional[Label] = None
+    preferred_location: Optional[Label] = None
+    years_experience: Optional[Label] = None
+    industry: Optional[Label] = None
+    summary: Optional[Text] = None
+    profile_id: Optional[Label] = None
+    linkedin_url: Optional[Annotated[str, Meta(max_length=512)]] = None
+
+    def to_record(self) -> ProfileRecord:
+        return ProfileRecord(*(getattr(self, field) for field in PROFILE_FIELDS))
+
+
+class PreferencesBody(Struct, omit_defaults=True):
+    """User preferences; accepts the frontend (careerLevel) and backend (career_level) names"""
+
+    interests: Optional[Labels] = None
+    career_level: Optional[Label] = None
+    careerLevel: Optional[Label] = None
+    goal: Optional[Label] = None
+    industry: Optional[Label] = None
+    location: Optional[Label] = None
+    experience: Optional[Label] = None
+    linkedin_connected: Optional[bool] = None
+    linkedinConnected: Optional[bool] = None
+    profile_data: Optional[ProfileBody] = None
+
+    def to_preferences(self) -> Preferences:
+        fields = {name: value for name, value in msgspec.structs.asdict(self).items() if value is not None}
+        if self.profile_data is not None:
+            fields['profile_data'] = self.profile_data.to_record()
+        return normalize_preferences(fields)
+
+
+class ChatRequest(Struct):
+    message: Annotated[str, Meta(max_length=MAX_MESSAGE_CHARS)] = ''
+    preferences: Optional[PreferencesBody] = None
+    latency_target_ms: Optional[Annotated[float, Meta(gt=0, le=600000)]] = None
+
+    def user_preferences(self) -> Preferences:
+        """The request's canonical preferences, or the defaults when it sent none"""
+        if self.preferences is None:
+            return normalize_preferences(DEFAULT_PREFERENCES)
+        return self.preferences.to_preferences()
+
+
+class ConnectLinkedInRequest(Struct):
+    linkedin_url: Annotated[str, Meta(max_length=512)] = ''
+
+
+_decoders = {schema: msgspec.json.Decoder(schema) for schema in (ChatRequest, ConnectLinkedInRequest)}
+
+
+def decode_request(flask_request, schema):
+    """Decode the JSON body of flask_request into schema, or raise RequestValidationError"""
+    if not flask_request.is_json:
+        raise RequestValidationError("Expected an application/json body")
+    if flask_request.content_length is not None and flask_request.content_length > MAX_BODY_BYTES:
+        raise RequestValidationError(f"Request body is larger than {MAX_BODY_BYTES} bytes")
+
+    return decode_body(flask_request.get_data(), schema)
+
+
+def decode_body(body: bytes, schema):
+    """Decode raw JSON bytes into schema, or raise RequestValidationError"""
+    if len(body) > MAX_BODY_BYTES:
+        raise RequestValidationError(f"Request body is larger than {MAX_BODY_BYTES} bytes")
+    try:
+        return _decoders[schema].decode(body)
+    except msgspec.ValidationError as e:
+        raise RequestValidationError(f"Invalid request body: {e}") from None
+    except msgspec.DecodeError:
+        raise RequestValidationError("Request body is not valid JSON") from None
+
+
+def create_json_encoder(enc_hook) -> msgspec.json.Encoder:
+    """Response encoder; sorted keys keep the output identical in content to Flask's default"""
+    return msgspec.json.Encoder(enc_hook=enc_hook, order='sorted')
+
+
+def decode_json(data) -> object:
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from None
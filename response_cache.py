@@ -0,0 +1,67 @@
+"""
+Response Cache Module for LinkedIn Future Career Planning Platform
+
+This module provides a small thread-safe LRU cache with per-entry expiry, used
+to remember generated answers so repeated questions with the same preferences
+skip the LLM.
+"""
+
+import re
+import time
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import metrics
+
+
+def normalize_message(user_message: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation"""
+    return re.sub(r'\s+', ' ', user_message.lower()).strip().rstrip('?!. ')
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with a time-to-live per entry"""
+
+    def __init__(self, name: str, max_entries: int = 1024, ttl_seconds: Optional[float] = 3600.0):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, record: bool = True) -> Optional[str]:
+        """Return the cached value, or None on a miss or an expired entry; record=False skips the hit/miss metric"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    if record:
+                        metrics.record_cache_lookup(self.name, True)
+                    return value
+                del self._entries[key]
+
+        if record:
+            metrics.record_cache_lookup(self.name, False)
+        return None
+
+    def put(self, key: Hashable, value: str) -> None:
+        expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,209 @@
+"""
+Semantic Cache Module for LinkedIn Future Career Planning Platform
+
+This module finds near-duplicate questions so a cached LLM answer can be
+reused when a question is worded differently from one answered before, e.g.
+"what jobs should I apply to" and "which jobs should I enroll in":
+- messages are embedded locally as signed, hashed word, bigram and character
+  trigram features, after light stemming and a small career-vocabulary
+  synonym map; no model or network call is involved
+- embeddings are rows of a NumPy matrix per preference bucket, so an answer
+  is only reused for the same preferences
+- random-projection LSH tables narrow large buckets to a few candidates, which
+  are then scored by exact cosine similarity against a tunable threshold
+"""
+
+import re
+import zlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+import metrics
+from response_cache import normalize_message
+from preferences import preferences_key
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+STOPWORDS = frozenset({
+    'a', 'an', 'the', 'i', 'me', 'my', 'to', 'in', 'of', 'for', 'on', 'at', 'is', 'are', 'be',
+    'do', 'does', 'what', 'which', 'how', 'should', 'can', 'could', 'would', 'will', 'some', 'any'
+})
+
+# Career vocabulary that users swap freely; each word maps to one canonical form
+SYNONYMS = {
+    'enroll': 'apply', 'register': 'apply', 'class': 'course', 'program': 'course', 'study': 'learn',
+    'pay': 'salary', 'compensation': 'salary', 'position': 'job', 'role': 'job', 'opening': 'job'
+}
+
+WORD_PATTERN = re.compile(r"[a-z0-9+#']+")
+
+
+def _canonical(word: str) -> str:
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if len(word) > 4 and word.endswith(suffix):
+            word = word[:-len(suffix)]
+            break
+    return SYNONYMS.get(word, word)
+
+
+def message_features(user_message: str) -> List[Tuple[str, float]]:
+    """Weighted features: content words, word bigrams and character trigrams of content words"""
+    words = [_canonical(word) for word in WORD_PATTERN.findall(user_message.lower())]
+    content = [word for word in words if word not in STOPWORDS]
+
+    features = [('w:' + word, 1.0) for word in content]
+    features.extend(('b:' + first + ' ' + second, 0.5) for first, second in zip(words, words[1:]))
+    for word in content:
+        padded = '<' + word + '>'
+        features.extend(('c:' + padded[i:i + 3], 0.25) for i in range(len(padded) - 2))
+    return features
+
+
+def embed(user_message: str, dim: int) -> np.ndarray:
+    """Unit-length feature-hashed vector; the hash's top bit picks the sign"""
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature, weight in message_features(user_message):
+        hashed = zlib.crc32(feature.encode('utf-8'))
+        vector[hashed % dim] += weight if hashed & 0x80000000 else -weight
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+class _Bucket:
+    """Embeddings for one preference bucket; a full bucket overwrites its oldest row"""
+
+    def __init__(self, dim: int, capacity: int, tables: int):
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.keys = [None] * capacity
+        self.signatures = [None] * capacity
+        self.tables = [{} for _ in range(tables)]
+        self.rows = {}
+        self.size = 0
+        self._next = 0
+
+    def add(self, key: Hashable, vector: np.ndarray, signatures: Tuple[int, ...]) -> None:
+        if key in self.rows:
+            return
+
+        row = self._next
+        self._next = (row + 1) % len(self.keys)
+        if self.keys[row] is not None:
+            del self.rows[self.keys[row]]
+            for table, signature in zip(self.tables, self.signatures[row]):
+                table[signature].discard(row)
+        else:
+            self.size += 1
+
+        self.vectors[row] = vector
+        self.keys[row] = key
+        self.signatures[row] = signatures
+        self.rows[key] = row
+        for table, signature in zip(self.tables, signatures):
+            table.setdefault(signature, set()).add(row)
+
+    def candidates(self, signatures: Tuple[int, ...]) -> List[int]:
+        rows = set()
+        for table, signature in zip(self.tables, signatures):
+            rows.update(table.get(signature, ()))
+        return sorted(rows)
+
+
+class SemanticIndex:
+    """Approximate nearest-neighbour lookup of cached questions within a preference bucket"""
+
+    def __init__(self, threshold: float = 0.85, dim: int = 1024, bits: int = 12, tables: int = 4,
+                 max_per_bucket: int = 256, max_buckets: int = 512, exhaustive_below: int = 64, seed: int = 7):
+        self.threshold = threshold
+        self.dim = dim
+        self.max_per_bucket = max_per_bucket
+        self.max_buckets = max_buckets
+        # Small buckets are cheaper to score in full than to probe
+        self.exhaustive_below = exhaustive_below
+        self.planes = np.random.default_rng(seed).standard_normal((tables, bits, dim)).astype(np.float32)
+        self._powers = 1 << np.arange(bits, dtype=np.int64)
+        self._buckets = OrderedDict()
+        self._stats = {'lookups': 0, 'hits': 0, 'below_threshold': 0, 'stale': 0}
+        self._hit_similarity = 0.0
+        self._lock = threading.Lock()
+
+    def _signatures(self, vector: np.ndarray) -> Tuple[int, ...]:
+        return tuple(int(code) for code in ((self.planes @ vector) > 0) @ self._powers)
+
+    def add(self, user_message: str, user_preferences: Dict) -> None:
+        """Index a question whose answer was just cached under its exact key"""
+        message = normalize_message(user_message)
+        bucket_key = preferences_key(user_preferences)
+        vector = embed(message, self.dim)
+        signatures = self._signatures(vector)
+
+        with self._lock:
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                bucket = _Bucket(self.dim, self.max_per_bucket, len(self.planes))
+                self._buckets[bucket_key] = bucket
+                while len(self._buckets) > self.max_buckets:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(bucket_key)
+            bucket.add((message, bucket_key), vector, signatures)
+
+    def lookup(self, user_message: str, user_preferences: Dict,
+               fetch: Callable[[Hashable], Optional[str]]) -> Optional[str]:
+        """Return fetch(key) for the most similar indexed question above the threshold, or None"""
+        message = normalize_message(user_message)
+        bucket_key = preferences_key(user_preferences)
+        match = None
+
+        bucket = self._buckets.get(bucket_key)
+        if bucket is not None and bucket.size:
+            vector = embed(message, self.dim)
+            with self._lock:
+                if bucket.size <= self.exhaustive_below:
+                    rows = list(range(bucket.size))
+                else:
+                    rows = bucket.candidates(self._signatures(vector))
+                if rows:
+                    similarities = bucket.vectors[rows] @ vector
+                    best = int(np.argmax(similarities))
+                    match = (bucket.keys[rows[best]], float(similarities[best]))
+
+        value = None
+        outcome = 'miss'
+        if match is not None:
+            key, similarity = match
+            if similarity < self.threshold:
+                outcome = 'below_threshold'
+            else:
+                # The answer may have expired from the response cache since it was indexed
+                value = fetch(key)
+                outcome = 'hits' if value is not None else 'stale'
+
+        with self._lock:
+            self._stats['lookups'] += 1
+            if outcome != 'miss':
+                self._stats[outcome] += 1
+            if value is not None:
+                self._hit_similarity += match[1]
+        metrics.record_cache_lookup('llm_semantic', value is not None)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups, hits = self._stats['lookups'], self._stats['hits']
+            return dict(
+                self._stats,
+                threshold=self.threshold,
+                hit_rate=round(hits / lookups, 4) if lookups else 0.0,
+                mean_hit_similarity=round(self._hit_similarity / hits, 4) if hits else None,
+                buckets=len(self._buckets),
+                entries=sum(bucket.size for bucket in self._buckets.values())
+            )
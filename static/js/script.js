@@ -18,10 +18,29 @@ document.addEventListener('DOMContentLoaded', function() {
 function initializeApp() {
     setupEventListeners();
     updateActiveFilters();
-    loadRecommendations();
     
     // Show default recommendations for users with default preferences
     showDefaultRecommendations();
+    
+    // The page ships with the default filters' recommendations; fetch only when they are missing
+    const initialRecommendations = readInitialRecommendations();
+    if (initialRecommendations) {
+        cacheRecommendations(recommendationsQuery(currentFilters), initialRecommendations);
+        updateRecommendationsFromBackend(initialRecommendations);
+    } else {
+        loadRecommendations();
+    }
+}
+
+function readInitialRecommendations() {
+    const blob = document.getElementById('initialRecommendations');
+    if (!blob || !blob.textContent.trim()) return null;
+    try {
+        return JSON.parse(blob.textContent);
+    } catch (error) {
+        console.error('Error reading inline recommendations:', error);
+        return null;
+    }
 }
 
 // Event Listeners Setup
@@ -237,6 +256,18 @@ function addAssistantMessage(message, isTyping = false) {
     return messageDiv;
 }
 
+// One ID per browser tab, so the backend can keep this conversation's earlier turns
+function getChatSessionId() {
+    let sessionId = sessionStorage.getItem('chatSessionId');
+    if (!sessionId) {
+        sessionId = window.crypto && crypto.randomUUID
+            ? crypto.randomUUID()
+            : Date.now().toString(36) + Math.random().toString(36).slice(2);
+        sessionStorage.setItem('chatSessionId', sessionId);
+    }
+    return sessionId;
+}
+
 function processQuestionWithBackend(question) {
     // Show typing indicator
     const typingMessage = addAssistantMessage('', true);
@@ -246,6 +277,7 @@ function processQuestionWithBackend(question) {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json',
+            'X-Session-ID': getChatSessionId(),
         },
         body: JSON.stringify({
             message: question,
@@ -274,25 +306,96 @@ function processQuestionWithBackend(question) {
 }
 
 // Recommendations Management with Flask Backend
-function loadRecommendations() {
-    // Build query parameters from current filters
+const RECOMMENDATIONS_DEBOUNCE_MS = 250;
+const RECOMMENDATIONS_CACHE_SIZE = 20;
+
+// Client data layer: debounced loads, one request in flight, and an LRU of responses
+const recommendationsClient = {
+    cache: new Map(),       // query string -> recommendations, least recently used first
+    timer: null,
+    controller: null,
+    inFlightQuery: null
+};
+
+function recommendationsQuery(filters) {
+    // Stable parameter order, so equivalent filters share one cache entry
     const params = new URLSearchParams();
-    params.append('career_level', currentFilters.careerLevel);
-    params.append('goal', currentFilters.goal);
-    currentFilters.interests.forEach(interest => {
+    params.append('career_level', filters.careerLevel);
+    params.append('goal', filters.goal);
+    [...new Set(filters.interests)].sort().forEach(interest => {
         params.append('interests', interest);
     });
+    return params.toString();
+}
 
-    // Fetch recommendations from Flask backend
-    fetch(`/api/recommendations?${params.toString()}`)
+function getCachedRecommendations(query) {
+    const cache = recommendationsClient.cache;
+    if (!cache.has(query)) return null;
+    const recommendations = cache.get(query);
+    cache.delete(query);
+    cache.set(query, recommendations);
+    return recommendations;
+}
+
+function cacheRecommendations(query, recommendations) {
+    const cache = recommendationsClient.cache;
+    cache.delete(query);
+    cache.set(query, recommendations);
+    if (cache.size > RECOMMENDATIONS_CACHE_SIZE) {
+        cache.delete(cache.keys().next().value);
+    }
+}
+
+function loadRecommendations() {
+    // Filter handlers call this on every change; fetch once the changes settle
+    clearTimeout(recommendationsClient.timer);
+    recommendationsClient.timer = setTimeout(fetchRecommendations, RECOMMENDATIONS_DEBOUNCE_MS);
+}
+
+function fetchRecommendations() {
+    const query = recommendationsQuery(currentFilters);
+    if (query === recommendationsClient.inFlightQuery) {
+        // The same request is already on its way
+        return;
+    }
+
+    // Whatever is in flight is for filters the user has since changed
+    if (recommendationsClient.controller) {
+        recommendationsClient.controller.abort();
+        recommendationsClient.controller = null;
+        recommendationsClient.inFlightQuery = null;
+    }
+
+    const cached = getCachedRecommendations(query);
+    if (cached) {
+        updateRecommendationsFromBackend(cached);
+        return;
+    }
+
+    const controller = new AbortController();
+    recommendationsClient.controller = controller;
+    recommendationsClient.inFlightQuery = query;
+
+    fetch(`/api/recommendations?${query}`, { signal: controller.signal })
         .then(response => response.json())
         .then(data => {
             if (data.status === 'success') {
-                updateRecommendationsFromBackend(data.recommendations);
+                cacheRecommendations(query, data.recommendations);
+                if (!controller.signal.aborted) {
+                    updateRecommendationsFromBackend(data.recommendations);
+                }
             }
         })
         .catch(error => {
-            console.error('Error loading recommendations:', error);
+            if (error.name !== 'AbortError') {
+                console.error('Error loading recommendations:', error);
+            }
+        })
+        .finally(() => {
+            if (recommendationsClient.controller === controller) {
+                recommendationsClient.controller = null;
+                recommendationsClient.inFlightQuery = null;
+            }
         });
 }
 
@@ -357,180 +460,25 @@ function updateRecommendationsFromBackend(recommendations) {
 }
 
 function updateRecommendationsBasedOnQuestion(question) {
-    const lowerQuestion = question.toLowerCase();
-    const cards = document.querySelectorAll('.card');
-    
-    // Career Advancement - Focus on skill development and leadership training
-    if (lowerQuestion.includes('advance') || lowerQuestion.includes('lead')) {
-        updateCard(cards[0], {
-            title: 'LinkedIn Learning: Becoming a Tech Lead',
-            description: 'Comprehensive course series for advancing to Tech Lead position',
-            type: 'COURSE',
-            icon: 'fas fa-graduation-cap',
-            details: ['12 hours', 'Free with LinkedIn Premium', 'Online'],
-            button: 'Learn More on LinkedIn',
-            link: 'https://www.linkedin.com/learning/paths/becoming-a-tech-lead'
-        });
-        
-        updateCard(cards[1], {
-            title: 'Senior Trainee Program - Tech Leadership',
-            description: 'Structured program for senior developers transitioning to leadership',
-            type: 'JOB',
-            icon: 'fas fa-briefcase',
-            details: ['Remote', 'Training + Salary', 'TechCorp'],
-            button: 'Apply on LinkedIn',
-            link: 'https://www.linkedin.com/jobs/search/?keywords=senior%20trainee%20tech%20lead'
-        });
-        
-        updateCard(cards[2], {
-            title: 'Tech Leadership Practice Group',
-            description: 'Join a community of aspiring tech leaders for practice and mentorship',
-            type: 'EVENT',
-            icon: 'fas fa-calendar',
-            details: ['Weekly', 'Virtual Practice Sessions', 'Free'],
-            button: 'Join on LinkedIn',
-            link: 'https://www.linkedin.com/groups/tech-leadership-practice'
-        });
-        
-        updateCard(cards[3], {
-            title: 'LinkedIn Learning: Executive Leadership Program',
-            description: 'Advanced leadership skills for senior professionals',
-            type: 'WORKSHOP',
-            icon: 'fas fa-tools',
-            details: ['16 weeks', 'Free with LinkedIn Premium', 'Online'],
-            button: 'Join on LinkedIn',
-            link: 'https://www.linkedin.com/learning/paths/executive-leadership-program'
-        });
-    }
-    
-    // Director Skills - Focus on executive development and strategic training
-    if (lowerQuestion.includes('director') || lowerQuestion.includes('executive')) {
-        updateCard(cards[0], {
-            title: 'LinkedIn Learning: Executive Leadership Program',
-            description: 'Advanced leadership skills for senior professionals',
-            type: 'COURSE',
-            icon: 'fas fa-graduation-cap',
-            details: ['16 weeks', 'Free with LinkedIn Premium', 'Online'],
-            button: 'Learn More on LinkedIn',
-            link: 'https://www.linkedin.com/learning/paths/executive-leadership-program'
-        });
-        
-        updateCard(cards[1], {
-            title: 'Executive Trainee Program',
-            description: 'Structured program for mid-level managers transitioning to executive roles',
-            type: 'JOB',
-            icon: 'fas fa-briefcase',
-            details: ['Hybrid', 'Executive Training', 'Fortune 500'],
-            button: 'Apply on LinkedIn',
-            link: 'https://www.linkedin.com/jobs/search/?keywords=executive%20trainee%20program'
-        });
-        
-        updateCard(cards[2], {
-            title: 'Executive Leadership Practice Forum',
-            description: 'Monthly practice sessions with current executives and board members',
-            type: 'EVENT',
-            icon: 'fas fa-calendar',
-            details: ['Monthly', 'Virtual Executive Sessions', 'Premium'],
-            button: 'Register on LinkedIn',
-            link: 'https://www.linkedin.com/events/executive-leadership-forum'
-        });
-        
-        updateCard(cards[3], {
-            title: 'Strategic Leadership Workshop',
-            description: 'Intensive workshop for developing strategic thinking and executive presence',
-            type: 'WORKSHOP',
-            icon: 'fas fa-tools',
-            details: ['3 days', 'Executive Coaching', 'In-Person'],
-            button: 'Join on LinkedIn',
-            link: 'https://www.linkedin.com/learning/courses/strategic-leadership-workshop'
-        });
-    }
-    
-    // Job Search - Focus on actual job opportunities and networking events
-    if (lowerQuestion.includes('job') || lowerQuestion.includes('opportunity') || lowerQuestion.includes('remote')) {
-        updateCard(cards[0], {
-            title: 'LinkedIn Job Search Mastery Course',
-            description: 'Learn effective job search strategies and LinkedIn optimization',
-            type: 'COURSE',
-            icon: 'fas fa-graduation-cap',
-            details: ['4 hours', 'Free with LinkedIn Premium', 'Online'],
-            button: 'Learn More on LinkedIn',
-            link: 'https://www.linkedin.com/learning/courses/job-search-mastery'
-        });
-        
-        updateCard(cards[1], {
-            title: 'Senior Tech Lead - Remote',
-            description: 'Leading development team in innovative tech company',
-            type: 'JOB',
-            icon: 'fas fa-briefcase',
-            details: ['Remote', '$140k-180k', 'TechCorp'],
-            button: 'Apply on LinkedIn',
-            link: 'https://www.linkedin.com/jobs/search/?keywords=tech%20lead%20remote'
-        });
-        
-        updateCard(cards[2], {
-            title: 'Tech Jobs Fair 2025',
-            description: 'Virtual job fair with top tech companies hiring remote positions',
-            type: 'EVENT',
-            icon: 'fas fa-calendar',
-            details: ['Dec 20, 2025', 'Virtual Job Fair', 'Free'],
-            button: 'Register on LinkedIn',
-            link: 'https://www.linkedin.com/company/tech-jobs-fair/'
-        });
-        
-        updateCard(cards[3], {
-            title: 'LinkedIn Networking Workshop',
-            description: 'Learn how to network effectively on LinkedIn for job opportunities',
-            type: 'WORKSHOP',
-            icon: 'fas fa-tools',
-            details: ['2 hours', 'Networking Skills', 'Virtual'],
-            button: 'Join on LinkedIn',
-            link: 'https://www.linkedin.com/learning/courses/linkedin-networking-workshop'
-        });
-    }
-    
-    // Leadership Workshops - Focus on learning events and skill development
-    if (lowerQuestion.includes('workshop') || lowerQuestion.includes('leadership') || lowerQuestion.includes('skill')) {
-        updateCard(cards[0], {
-            title: 'LinkedIn Learning: Tech Leadership Course Series',
-            description: 'Comprehensive leadership development for tech professionals',
-            type: 'COURSE',
-            icon: 'fas fa-graduation-cap',
-            details: ['20 hours', 'Free with LinkedIn Premium', 'Online'],
-            button: 'Learn More on LinkedIn',
-            link: 'https://www.linkedin.com/learning/paths/tech-leadership-course-series'
-        });
-        
-        updateCard(cards[1], {
-            title: 'Leadership Practice Group',
-            description: 'Join a community for practicing leadership skills and scenarios',
-            type: 'JOB',
-            icon: 'fas fa-briefcase',
-            details: ['Virtual', 'Practice Sessions', 'Community'],
-            button: 'Join on LinkedIn',
-            link: 'https://www.linkedin.com/groups/leadership-practice-group'
-        });
-        
-        updateCard(cards[2], {
-            title: 'Leadership Learning Events Series',
-            description: 'Monthly events featuring leadership experts and interactive workshops',
-            type: 'EVENT',
-            icon: 'fas fa-calendar',
-            details: ['Monthly', 'Virtual Learning Events', 'Free'],
-            button: 'Register on LinkedIn',
-            link: 'https://www.linkedin.com/events/leadership-learning-series'
-        });
-        
-        updateCard(cards[3], {
-            title: 'LinkedIn Leadership Development Workshop',
-            description: 'Interactive workshop for developing leadership skills',
-            type: 'WORKSHOP',
-            icon: 'fas fa-tools',
-            details: ['8 hours', 'Free with LinkedIn Premium', 'Unlimited'],
-            button: 'Join on LinkedIn',
-            link: 'https://www.linkedin.com/learning/courses/leadership-development-workshop'
+    // The server picks the cards for the question's intent
+    const params = new URLSearchParams();
+    params.append('question', question);
+    params.append('career_level', currentFilters.careerLevel);
+    params.append('goal', currentFilters.goal);
+    currentFilters.interests.forEach(interest => {
+        params.append('interests', interest);
+    });
+
+    fetch(`/api/recommendations/for-question?${params.toString()}`)
+        .then(response => response.json())
+        .then(data => {
+            if (data.status === 'success') {
+                updateRecommendationsFromBackend(data.recommendations);
+            }
+        })
+        .catch(error => {
+            console.error('Error loading question recommendations:', error);
         });
-    }
 }
 
 function updateCard(card, data) {
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test script for per-session conversation memory
+"""
+
+import time
+
+from conversation_memory import ConversationMemory, estimate_tokens
+from llm_integration import llm_generator
+from model_router import FAST, QUALITY, FakeBackend, ModelRouter
+
+PREFERENCES = {'interests': ['Technology'], 'career_level': 'Senior', 'goal': 'job'}
+
+
+def test_window_and_summary_stay_bounded():
+    """Old turns fold into a capped summary; the window keeps within its turn and token budgets"""
+
+    print("🧪 Testing conversation window bounds")
+    print("=" * 50)
+
+    memory = ConversationMemory(max_turns=6, token_budget=120, summary_tokens=40)
+    for i in range(50):
+        memory.record('s1', f'Question {i} about data science roles?',
+                      f'<p>Answer {i}. It goes on with more detail about the role.</p>')
+        context = memory.context('s1')
+        assert len(context.turns) <= 6
+        assert sum(estimate_tokens(text) for _, text in context.turns) <= 120
+        assert len(context.summary) <= 40 * 4
+
+    assert context.turns[-2] == ('user', 'Question 49 about data science roles?')
+    assert context.turns[-1] == ('assistant', 'Answer 49. It goes on with more detail about the role.')
+    assert 'Question 0 ' not in context.summary and 'Answer 4' in context.summary
+    print("   ✅ newest exchange kept, oldest turns summarized, summary capped")
+
+    memory.record('s2', 'x' * 5000, 'y' * 5000)
+    context = memory.context('s2')
+    assert len(context.turns) == 2, "the newest exchange is kept even over budget"
+    assert all(len(text) <= 600 for _, text in context.turns)
+    print("   ✅ oversized turns are truncated")
+
+
+def test_sessions_are_evicted():
+    """Sessions are capped in LRU order and expire after the idle timeout"""
+
+    print("🧪 Testing conversation session eviction")
+    print("=" * 50)
+
+    memory = ConversationMemory(max_sessions=3)
+    for session_id in ('a', 'b', 'c'):
+        memory.record(session_id, 'hello', 'hi')
+    memory.record('a', 'again', 'hi again')
+    memory.record('d', 'hello', 'hi')
+    assert not memory.context('b') and memory.context('a') and len(memory) == 3
+    assert memory.get_stats()['evicted_sessions'] == 1
+    print("   ✅ least recently used session dropped first")
+
+    memory = ConversationMemory(idle_seconds=0.05)
+    memory.record('a', 'hello', 'hi')
+    time.sleep(0.1)
+    assert not memory.context('a')
+    memory.record('a', 'new topic', 'ok')
+    assert memory.context('a').turns == (('user', 'new topic'), ('assistant', 'ok'))
+    assert not memory.context(None)
+    print("   ✅ idle sessions start over")
+
+
+def test_prompt_includes_history():
+    """The LLM prompt carries the conversation so far, and only when there is one"""
+
+    print("🧪 Testing prompt history")
+    print("=" * 50)
+
+    memory = ConversationMemory()
+    memory.record('s', 'Which jobs suit a data engineer?', '<p>Analytics engineer roles.</p>')
+    prompt = llm_generator._create_prompt('And remote ones?', PREFERENCES, memory.context('s'))
+    assert 'Conversation so far' in prompt
+    assert 'User: Which jobs suit a data engineer?' in prompt
+    assert 'Assistant: Analytics engineer roles.' in prompt
+    assert 'Conversation so far' not in llm_generator._create_prompt('And remote ones?', PREFERENCES)
+    print("   ✅ follow-up prompt includes the earlier exchange")
+
+
+def test_follow_ups_skip_the_response_cache():
+    """/api/chat sends history only with questions that refer back, and never caches answers that depend on it"""
+
+    print("🧪 Testing follow-ups through /api/chat")
+    print("=" * 50)
+
+    from app import app
+    from conversation_memory import conversation_memory, refers_back
+    from heavy_hitters import question_tracker
+
+    assert refers_back('And what about remote ones?') and refers_back('Is it well paid?')
+    assert refers_back('Remote ones?')
+    assert not refers_back('Which niche roles suit a former zookeeper?')
+    print("   ✅ follow-ups told apart from standalone questions")
+
+    saved = llm_generator.router, llm_generator.is_available
+    backend = FakeBackend('stub', 'A **stub** answer.')
+    llm_generator.router = ModelRouter({FAST: backend, QUALITY: backend})
+    llm_generator.is_available = True
+    llm_generator.response_cache.clear()
+    try:
+        client = app.test_client()
+        headers = {'X-Session-ID': 'test-follow-ups'}
+        first = {'message': 'Which niche roles suit a former zookeeper?'}
+        unrelated = {'message': 'How should a museum curator prepare for interviews?'}
+
+        # Another visitor already asked the unrelated question, so its answer is cached
+        assert client.post('/api/chat', json=unrelated).status_code == 200
+        assert backend.calls == 1
+
+        assert client.post('/api/chat', json=first, headers=headers).status_code == 200
+        assert backend.calls == 2
+        assert conversation_memory.context('test-follow-ups').turns[0] == ('user', first['message'])
+
+        # A second, unrelated question in the same session is still a cache hit
+        assert client.post('/api/chat', json=unrelated, headers=headers).status_code == 200
+        assert backend.calls == 2
+
+        # A real follow-up reaches the model with the history, leaves the cache alone and is still counted
+        cached = len(llm_generator.response_cache)
+        follow_up = {'message': 'And what about remote ones?'}
+        assert client.post('/api/chat', json=follow_up, headers=headers).status_code == 200
+        assert backend.calls == 3 and len(llm_generator.response_cache) == cached
+        assert 'and what about remote ones' in [entry['message'] for entry in question_tracker.top(100)]
+    finally:
+        llm_generator.router, llm_generator.is_available = saved
+        llm_generator.response_cache.clear()
+        conversation_memory.clear('test-follow-ups')
+    print("   ✅ standalone questions in a session stay cached; follow-ups reach the model uncached")
+
+
+if __name__ == "__main__":
+    test_window_and_summary_stay_bounded()
+    test_sessions_are_evicted()
+    test_prompt_includes_history()
+    test_follow_ups_skip_the_response_cache()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for heavy-hitter question tracking and pinned answers
+"""
+
+import random
+from collections import Counter
+
+from heavy_hitters import CountMinSketch, HeavyHitterTracker, pinned_answers
+from predefined_responses import predefined_manager
+
+PREFERENCES = {
+    'interests': ['Marketing', 'Leadership'],
+    'career_level': 'Senior',
+    'goal': 'skill',
+    'industry': 'Marketing',
+    'location': 'Hybrid',
+    'experience': '6-10 years'
+}
+
+
+def test_count_min_sketch():
+    """The sketch never undercounts, even when it is far smaller than the key space"""
+
+    print("🧪 Testing CountMinSketch")
+    print("=" * 50)
+
+    rng = random.Random(1)
+    sketch = CountMinSketch(width=256, depth=4)
+    truth = Counter()
+    for _ in range(20000):
+        key = f'question {int(rng.paretovariate(1.1)) % 3000}'
+        count = rng.randint(1, 3)
+        truth[key] += count
+        sketch.add(key, count)
+
+    assert all(sketch.estimate(key) >= count for key, count in truth.items())
+    most_common, count = truth.most_common(1)[0]
+    assert sketch.estimate(most_common) <= count * 1.1, "a heavy key's estimate stays close"
+    print(f"   ✅ {len(truth)} keys, none undercounted")
+
+
+def test_top_k_under_churn():
+    """Heavy hitters stay in the top-k table while thousands of one-off questions churn through it"""
+
+    print("🧪 Testing HeavyHitterTracker top-k")
+    print("=" * 50)
+
+    rng = random.Random(2)
+    heavy = {f'how do i become a {role}': 400 - 30 * i
+             for i, role in enumerate(['data scientist', 'product manager', 'tech lead', 'designer',
+                                       'cto', 'analyst', 'architect', 'recruiter'])}
+    stream = [message for message, count in heavy.items() for _ in range(count)]
+    stream += [f'one-off question number {i}' for i in range(6000)]
+    rng.shuffle(stream)
+
+    tracker = HeavyHitterTracker(width=4096, depth=4, k=20)
+    for message in stream:
+        tracker.record(message, PREFERENCES)
+
+    top = tracker.top(len(heavy))
+    assert [entry['message'] for entry in top] == list(heavy)
+    assert all(entry['count'] >= heavy[entry['message']] for entry in top)
+    assert tracker.total == len(stream)
+    assert len(tracker._heap) <= 4 * tracker.k
+    print(f"   ✅ the {len(heavy)} heavy hitters survive {len(stream)} records, in order")
+
+
+def test_same_question_from_two_buckets():
+    """One question asked under two preference sets ties on count and message without breaking /api/chat"""
+
+    print("🧪 Testing heavy-hitter ties across preference buckets")
+    print("=" * 50)
+
+    tracker = HeavyHitterTracker(k=1)
+    for interests in (['Marketing'], ['Sales'], ['Marketing'], ['Sales'], ['Finance']):
+        tracker.record('How do I negotiate salary', dict(PREFERENCES, interests=interests))
+    assert [entry['count'] for entry in tracker.top()] == [2]
+    print("   ✅ tied entries ordered without comparing preference keys")
+
+    from app import app
+    from llm_integration import llm_generator
+    from model_router import FAST, QUALITY, FakeBackend, ModelRouter
+
+    saved = llm_generator.router, llm_generator.is_available
+    backend = FakeBackend('stub', 'A stub answer.')
+    llm_generator.router = ModelRouter({FAST: backend, QUALITY: backend})
+    llm_generator.is_available = True
+    try:
+        client = app.test_client()
+        for interests in (['Marketing'], ['Sales']):
+            response = client.post('/api/chat', json={'message': 'How do I negotiate salary',
+                                                      'preferences': dict(PREFERENCES, interests=interests)})
+            assert response.status_code == 200
+    finally:
+        llm_generator.router, llm_generator.is_available = saved
+        llm_generator.response_cache.clear()
+    print("   ✅ /api/chat answers the same question for both buckets")
+
+
+def test_pinned_answer_served_and_cleared():
+    """A pinned answer is served by should_use_predefined_response and dropped by clear()"""
+
+    print("🧪 Testing pinned answers")
+    print("=" * 50)
+
+    question = 'How do I become a data scientist?'
+    answer = '<p>Pinned data science answer</p>'
+    pinned_answers.clear()
+    assert predefined_manager.should_use_predefined_response(question, PREFERENCES) == (False, None)
+
+    try:
+        assert pinned_answers.pin(question, PREFERENCES, answer, count=42)
+        use_predefined, question_type = predefined_manager.should_use_predefined_response(
+            '  how do I become a data scientist ', PREFERENCES)
+        assert use_predefined and question_type.startswith('pinned:')
+        assert predefined_manager.get_personality_aware_response(question_type, PREFERENCES) == answer
+
+        other_preferences = dict(PREFERENCES, career_level='Entry Level')
+        assert predefined_manager.should_use_predefined_response(question, other_preferences) == (False, None)
+        print("   ✅ pinned answer served for its own preference bucket only")
+    finally:
+        pinned_answers.clear()
+
+    assert predefined_manager.should_use_predefined_response(question, PREFERENCES) == (False, None)
+    # A request that looked the answer up just before clear() can still render it
+    assert predefined_manager.get_personality_aware_response(question_type, PREFERENCES) == answer
+    print("   ✅ clear() stops serving the answer")
+
+
+if __name__ == "__main__":
+    test_count_min_sketch()
+    test_top_k_under_churn()
+    test_same_question_from_two_buckets()
+    test_pinned_answer_served_and_cleared()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for canonical preference keys
+"""
+
+from preferences import DEFAULT_PREFERENCES, normalize_preferences, preferences_key
+
+
+def legacy_should_use_defaults(user_preferences):
+    """Field-by-field default check should_use_predefined_response made before PreferenceKey"""
+    user_interests = user_preferences.get('interests', [])
+    user_career_level = user_preferences.get('career_level', user_preferences.get('careerLevel', ''))
+    return (set(user_interests) == set(DEFAULT_PREFERENCES['interests'])
+            and user_career_level == DEFAULT_PREFERENCES['career_level']
+            and user_preferences.get('goal', '') == DEFAULT_PREFERENCES['goal']
+            and user_preferences.get('industry', '') == DEFAULT_PREFERENCES['industry']
+            and user_preferences.get('location', '') == DEFAULT_PREFERENCES['location']
+            and user_preferences.get('experience', '') == DEFAULT_PREFERENCES['experience'])
+
+
+def legacy_is_default_preferences(user_preferences):
+    """The old is_default_preferences: only fields that are present must match"""
+    for key, value in DEFAULT_PREFERENCES.items():
+        if key in user_preferences:
+            if isinstance(value, list):
+                if set(user_preferences[key]) != set(value):
+                    return False
+            elif user_preferences[key] != value:
+                return False
+    return True
+
+
+CASES = [
+    dict(DEFAULT_PREFERENCES),
+    dict(DEFAULT_PREFERENCES, interests=['Leadership', 'Technology']),
+    dict(DEFAULT_PREFERENCES, interests=['Technology', 'Leadership', 'Technology']),
+    dict(DEFAULT_PREFERENCES, interests=['Technology']),
+    dict(DEFAULT_PREFERENCES, interests=[]),
+    dict(DEFAULT_PREFERENCES, goal='skill'),
+    {**{k: v for k, v in DEFAULT_PREFERENCES.items() if k != 'career_level'}, 'careerLevel': 'Entry Level'},
+    {**{k: v for k, v in DEFAULT_PREFERENCES.items() if k != 'career_level'}, 'careerLevel': 'Senior'},
+    dict(DEFAULT_PREFERENCES, careerLevel='Senior'),
+    {k: v for k, v in DEFAULT_PREFERENCES.items() if k != 'location'},
+    {'interests': ['Technology', 'Leadership']},
+    {'careerLevel': 'Entry Level', 'goal': 'advancement'},
+    {'careerLevel': 'Executive'},
+    {},
+]
+
+
+def test_default_checks_match_legacy_logic():
+    """is_default / is_default_or_unset agree with the old field-by-field checks"""
+
+    print("🧪 Testing PreferenceKey default checks")
+    print("=" * 50)
+
+    for preferences in CASES:
+        key = preferences_key(preferences)
+        assert key.is_default == legacy_should_use_defaults(preferences), preferences
+        # careerLevel and career_level are one field now; the old check compared after the same mapping
+        assert key.is_default_or_unset == legacy_is_default_preferences(normalize_preferences(preferences)), preferences
+        assert normalize_preferences(preferences).key is key
+    print(f"   ✅ {len(CASES)} preference sets agree")
+
+
+def test_normalize_keeps_interest_order():
+    """The key is order-insensitive; the normalized dict keeps what the user sent"""
+
+    print("🧪 Testing normalize_preferences")
+    print("=" * 50)
+
+    first = normalize_preferences({'interests': ['Engineering', 'Technology', 'Leadership'], 'careerLevel': 'Senior'})
+    second = normalize_preferences({'interests': ['Leadership', 'Engineering', 'Technology', 'Leadership'],
+                                    'career_level': 'Senior'})
+    assert first['interests'] == ['Engineering', 'Technology', 'Leadership']
+    assert first['career_level'] == 'Senior' and 'careerLevel' not in first
+    assert first.key is second.key
+    assert first.key.interests == ('Engineering', 'Leadership', 'Technology')
+    print("   ✅ interests keep their order; equal keys are the same object")
+
+
+if __name__ == "__main__":
+    test_default_checks_match_legacy_logic()
+    test_normalize_keeps_interest_order()
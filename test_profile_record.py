@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for compact profile records
+"""
+
+import json
+import pickle
+
+from linkedin_profile_analyzer import linkedin_analyzer
+from profile_record import ProfileRecord
+
+
+def legacy_profile(profile_id, linkedin_url):
+    """The dict analyze_profile returned before profiles became records"""
+    if profile_id in linkedin_analyzer.sample_profiles:
+        profile_data = linkedin_analyzer.sample_profiles[profile_id].copy()
+    else:
+        profile_data = {
+            "name": "LinkedIn User",
+            "title": "Professional",
+            "company": "Company",
+            "location": "Location",
+            "skills": ["Technology", "Leadership"],
+            "experience_level": "Entry Level",
+            "education": "Bachelor's Degree",
+            "interests": ["Technology", "Leadership"],
+            "career_goal": "advancement",
+            "preferred_location": "Remote",
+            "years_experience": "3-5 years",
+            "industry": "Technology",
+            "summary": "Professional seeking career advancement opportunities."
+        }
+    profile_data['profile_id'] = profile_id
+    profile_data['linkedin_url'] = linkedin_url
+    return profile_data
+
+
+def test_profile_record_round_trip():
+    """to_dict() and JSON output match the legacy analyze_profile shape"""
+
+    print("🧪 Testing ProfileRecord round trip")
+    print("=" * 50)
+
+    for profile_id in list(linkedin_analyzer.sample_profiles) + ['someone-new']:
+        linkedin_url = f"https://www.linkedin.com/in/{profile_id}/"
+        record = linkedin_analyzer.analyze_profile(linkedin_url)
+        expected = legacy_profile(profile_id, linkedin_url)
+
+        assert isinstance(record, ProfileRecord)
+        assert record.to_dict() == expected
+        assert list(record.to_dict()) == list(expected), "field order changed"
+        assert json.dumps(record.to_dict()) == json.dumps(expected)
+        assert dict(record) == {k: tuple(v) if isinstance(v, list) else v for k, v in expected.items()}
+        assert pickle.loads(pickle.dumps(record)) == record
+        print(f"   ✅ {profile_id}")
+
+    partial = ProfileRecord.from_dict({'name': 'Ada', 'skills': ['Python']})
+    assert partial.to_dict() == {'name': 'Ada', 'skills': ['Python']}
+    assert partial.get('industry', 'Technology') == 'Technology'
+    assert partial.render_fields() == ('Ada', 'Professional', 'Company', ('Python',), 'Entry Level', 'Technology')
+    print("   ✅ partial profile keeps only the fields it was given")
+
+
+if __name__ == "__main__":
+    test_profile_record_round_trip()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the LLM token-bucket rate limiters
+"""
+
+import os
+import time
+import sqlite3
+import tempfile
+import threading
+
+from rate_limiter import TokenBucketRateLimiter, SQLiteTokenBucketRateLimiter
+
+
+def test_token_bucket_rate_limiter():
+    """Burst, refill, per-key isolation, concurrency and eviction of the in-process limiter"""
+
+    print("🧪 Testing TokenBucketRateLimiter")
+    print("=" * 50)
+
+    limiter = TokenBucketRateLimiter(rate_per_minute=60, burst=3, shards=4)
+    assert [limiter.acquire('client-a')[0] for _ in range(3)] == [True, True, True]
+    allowed, retry_after = limiter.acquire('client-a')
+    assert not allowed and 0 < retry_after <= 1.0
+    assert limiter.acquire('client-b')[0], "another client has its own bucket"
+    print("   ✅ burst allowed, then rejected with retry_after")
+
+    fast = TokenBucketRateLimiter(rate_per_minute=6000, burst=1)
+    assert fast.acquire('client')[0]
+    assert not fast.acquire('client')[0]
+    time.sleep(0.05)
+    assert fast.acquire('client')[0], "bucket refills over time"
+    print("   ✅ bucket refills")
+
+    # Many threads on one key still get exactly the burst
+    shared = TokenBucketRateLimiter(rate_per_minute=0.001, burst=10)
+    results = []
+    threads = [threading.Thread(target=lambda: results.extend(shared.acquire('hot')[0] for _ in range(20)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results.count(True) == 10
+    print("   ✅ concurrent acquires never exceed the burst")
+
+    bounded = TokenBucketRateLimiter(rate_per_minute=60, burst=2, shards=2, max_keys_per_shard=8)
+    for i in range(100):
+        bounded.acquire(f'client-{i}')
+    assert bounded.get_stats()['tracked_keys'] <= 2 * 8
+    print("   ✅ tracked keys stay bounded per shard")
+
+
+def test_sqlite_rate_limiter():
+    """Two limiters on one database (as two worker processes) share each client's budget"""
+
+    print("🧪 Testing SQLiteTokenBucketRateLimiter")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, 'buckets.db')
+        worker_a = SQLiteTokenBucketRateLimiter(db_path, rate_per_minute=60, burst=3)
+        worker_b = SQLiteTokenBucketRateLimiter(db_path, rate_per_minute=60, burst=3)
+
+        outcomes = [worker_a.acquire('client')[0], worker_b.acquire('client')[0],
+                    worker_a.acquire('client')[0], worker_b.acquire('client')[0]]
+        assert outcomes == [True, True, True, False]
+        allowed, retry_after = worker_a.acquire('client')
+        assert not allowed and 0 < retry_after <= 1.0
+        assert worker_b.acquire('other-client')[0]
+        assert worker_a.get_stats()['rejected'] == 1 and worker_b.get_stats()['rejected'] == 1
+        print("   ✅ budget shared across limiter instances")
+
+        # Fast refill (burst 1 at 600/min refills in 0.1s) and purge on every call
+        purging = SQLiteTokenBucketRateLimiter(db_path, rate_per_minute=600, burst=1, purge_interval=0)
+        for i in range(50):
+            purging.acquire(f'tab-{i}')
+        time.sleep(0.15)
+        purging.acquire('active')
+        conn = sqlite3.connect(db_path)
+        keys = [row[0] for row in conn.execute('SELECT key FROM token_buckets')]
+        conn.close()
+        assert keys == ['active'], keys
+        assert purging.get_stats()['purged'] >= 50
+        print("   ✅ idle, refilled buckets purged from the table")
+
+
+if __name__ == "__main__":
+    test_token_bucket_rate_limiter()
+    test_sqlite_rate_limiter()
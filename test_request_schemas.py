@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for typed request bodies on /api/chat and /api/connect-linkedin
+"""
+
+import json
+
+from app import app
+from profile_record import ProfileRecord
+from request_schemas import ChatRequest, RequestValidationError, decode_body
+
+PREDEFINED_QUESTION = 'How can I advance from Senior Developer to Tech Lead?'
+
+
+def test_malformed_bodies_fail_fast():
+    """Bodies that used to raise deep inside the handlers are rejected with a 400"""
+
+    print("🧪 Testing request body validation")
+    print("=" * 50)
+
+    client = app.test_client()
+    bad_bodies = [
+        dict(data='null', content_type='application/json'),
+        dict(data='{not json', content_type='application/json'),
+        dict(data='message=hello'),
+        dict(json={'message': 42}),
+        dict(json={'message': 'x' * 5000}),
+        dict(json={'message': 'hi', 'preferences': {'interests': 'Technology'}}),
+        dict(json={'message': 'hi', 'latency_target_ms': -5}),
+        dict(data=json.dumps({'message': 'a' * 20000}), content_type='application/json'),
+    ]
+    for body in bad_bodies:
+        response = client.post('/api/chat', **body)
+        assert response.status_code == 400, body
+        assert response.get_json()['status'] == 'invalid_request'
+
+    response = client.post('/api/connect-linkedin', data='null', content_type='application/json')
+    assert response.status_code == 400
+    assert client.post('/api/connect-linkedin', json={}).get_json()['error'] == 'No LinkedIn URL provided'
+    print(f"   ✅ {len(bad_bodies) + 2} malformed bodies rejected with 400")
+
+    response = client.post('/api/chat', json={'message': PREDEFINED_QUESTION})
+    assert response.status_code == 200 and response.get_json()['status'] == 'success'
+    print("   ✅ a valid body is still answered")
+
+
+def test_canonical_structures():
+    """Decoded preferences are the canonical Preferences dict, with profile_data as a record"""
+
+    print("🧪 Testing canonical decoding")
+    print("=" * 50)
+
+    body = decode_body(json.dumps({
+        'message': PREDEFINED_QUESTION,
+        'preferences': {'interests': ['Leadership', 'Technology'], 'careerLevel': 'Senior',
+                        'linkedin_connected': True,
+                        'profile_data': {'name': 'Ada', 'skills': ['Python'], 'industry': 'Technology'}},
+        'unknown_field': 'ignored'
+    }).encode(), ChatRequest)
+    preferences = body.user_preferences()
+
+    assert preferences['career_level'] == 'Senior' and 'careerLevel' not in preferences
+    assert preferences['interests'] == ['Leadership', 'Technology']
+    assert preferences.key.linkedin_connected is True
+    assert isinstance(preferences['profile_data'], ProfileRecord)
+    assert preferences['profile_data'].to_dict() == {'name': 'Ada', 'skills': ['Python'], 'industry': 'Technology'}
+
+    try:
+        decode_body(b'[]', ChatRequest)
+    except RequestValidationError:
+        pass
+    else:
+        raise AssertionError("an array body must not decode")
+    print("   ✅ preferences and profile come out canonical")
+
+
+if __name__ == "__main__":
+    test_malformed_bodies_fail_fast()
+    test_canonical_structures()
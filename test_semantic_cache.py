@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script for the semantic near-duplicate question index
+"""
+
+from semantic_cache import SemanticIndex
+
+PREFERENCES = {'interests': ['Technology'], 'career_level': 'Senior', 'goal': 'job'}
+
+
+def test_semantic_index_lookup():
+    """Paraphrases hit, unrelated questions and other preference buckets miss"""
+
+    print("🧪 Testing SemanticIndex")
+    print("=" * 50)
+
+    index = SemanticIndex(threshold=0.85)
+    # Stands in for the response cache; keys are (normalized message, preference key)
+    answers = {'what jobs should i apply to': 'jobs answer'}
+    fetch = lambda key: answers.get(key[0])
+
+    index.add('What jobs should I apply to?', PREFERENCES)
+
+    assert index.lookup('Which jobs should I enroll in?', PREFERENCES, fetch) == 'jobs answer'
+    assert index.lookup('How do I negotiate a salary raise?', PREFERENCES, fetch) is None
+    assert index.lookup('Which jobs should I enroll in?', dict(PREFERENCES, goal='skill'), fetch) is None
+    print("   ✅ paraphrase hit, unrelated question and other bucket miss")
+
+    answers.clear()
+    assert index.lookup('Which jobs should I enroll in?', PREFERENCES, fetch) is None
+    stats = index.get_stats()
+    assert stats['hits'] == 1 and stats['stale'] == 1 and stats['lookups'] == 4
+    print("   ✅ expired answers count as stale")
+
+
+def test_semantic_index_lsh_buckets():
+    """Large buckets go through the LSH tables and still find the near-duplicate"""
+
+    print("🧪 Testing SemanticIndex LSH candidates")
+    print("=" * 50)
+
+    index = SemanticIndex(threshold=0.85, exhaustive_below=8, max_per_bucket=64)
+    topics = ['data science', 'product management', 'ux design', 'cloud security', 'sales', 'finance',
+              'nursing', 'teaching', 'marketing analytics', 'devops', 'copywriting', 'law']
+    for i in range(100):
+        index.add(f'Which {topics[i % len(topics)]} certificate number {i} is worth it', PREFERENCES)
+    index.add('How do I become a data scientist', PREFERENCES)
+
+    bucket = next(iter(index._buckets.values()))
+    assert bucket.size == 64, "a full bucket overwrites its oldest rows"
+    assert sum(len(rows) for rows in bucket.tables[0].values()) == 64
+    assert bucket.size > index.exhaustive_below
+
+    found = index.lookup('How can I become a data scientist', PREFERENCES, lambda key: key[0])
+    assert found == 'how do i become a data scientist'
+    print("   ✅ near-duplicate found through LSH candidates in a full bucket")
+
+
+if __name__ == "__main__":
+    test_semantic_index_lookup()
+    test_semantic_index_lsh_buckets()
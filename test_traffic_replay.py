@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for traffic recording, recorded LLM backends and replay reports
+"""
+
+import io
+import os
+import tempfile
+
+from app import app
+from load_test import load_traffic_file
+from model_router import FakeBackend, RecordingBackend
+from traffic_recorder import TrafficRecorder, load_recorded_backends
+from traffic_replay import diff_reports, schedule
+
+
+def test_recorded_requests_replay_identically():
+    """Captured JSON, query and multipart requests load back as the same requests"""
+
+    print("🧪 Testing traffic capture")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = TrafficRecorder(os.path.join(directory, 'traffic.jsonl'))
+        requests = [
+            dict(path='/api/chat', method='POST', json={'message': 'What jobs should I apply to?'},
+                 headers={'X-Session-ID': 'abc'}),
+            dict(path='/api/recommendations?career_level=Senior&interests=Technology&interests=Leadership'),
+            dict(path='/api/upload-cv', method='POST', data={'cv_file': (io.BytesIO(b'%PDF-1.4 cv'), 'cv.pdf')}),
+            dict(path='/api/chat', method='POST', data='{not json', content_type='application/json'),
+        ]
+        for kwargs in requests:
+            with app.test_request_context(**kwargs) as ctx:
+                capture = recorder.capture(ctx.request)
+                if ctx.request.path == '/api/upload-cv':
+                    assert ctx.request.files['cv_file'].read() == b'%PDF-1.4 cv', "the handler still sees the upload"
+                recorder.finish(capture, 200)
+        recorder.close()
+
+        items = load_traffic_file(recorder.path)
+        chat, recommendations, upload, malformed = items
+        assert chat.body == {'message': 'What jobs should I apply to?'} and chat.headers['X-Session-ID'] == 'abc'
+        assert chat.offset == 0 and all(item.offset >= 0 for item in items)
+        assert recommendations.method == 'GET' and recommendations.path.endswith('interests=Leadership')
+        assert recommendations.label == 'GET /api/recommendations'
+        assert b'%PDF-1.4 cv' in upload.data and upload.headers['Content-Type'].startswith('multipart/form-data')
+        assert malformed.body is None and malformed.data == b'{not json'
+        print(f"   ✅ {len(items)} requests round-trip through the recording")
+
+        client = app.test_client()
+        response = client.post(upload.path, data=upload.data, headers=upload.headers)
+        assert response.status_code == 200, "the recorded multipart body is a valid upload"
+        print("   ✅ recorded upload replays against the app")
+
+
+def test_llm_answers_replay_from_the_recording():
+    """RecordingBackend output feeds RecordedBackend; unknown prompts still get a recorded answer"""
+
+    print("🧪 Testing recorded LLM backends")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = TrafficRecorder(os.path.join(directory, 'traffic.jsonl'),
+                                   llm_path=os.path.join(directory, 'traffic.llm.jsonl'))
+        recording = RecordingBackend(FakeBackend('live', 'first answer'), 'fast', recorder.record_llm)
+        assert recording.generate('prompt one') == 'first answer'
+        recording.backend.text = 'second answer'
+        recording.generate('prompt two')
+        recorder.close()
+
+        backends = load_recorded_backends(recorder.llm_path, latency_scale=0)
+        assert backends['fast'].generate('prompt one') == 'first answer'
+        assert backends['fast'].generate('prompt two') == 'second answer'
+        assert backends['quality'].generate('a changed prompt') in ('first answer', 'second answer')
+        assert backends['fast'].hits == 2 and backends['quality'].misses == 1
+        print("   ✅ recorded prompts answered verbatim, misses counted")
+
+
+def test_schedule_and_diff():
+    """Offsets scale with the replay speed; slowdowns beyond both thresholds are regressions"""
+
+    print("🧪 Testing replay schedule and diff")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'traffic.jsonl')
+        with open(path, 'w') as f:
+            f.write('{"title": "GET /api/recommendations", "offset_ms": 1500}\n')
+            f.write('{"title": "GET /api/recommendations", "offset_ms": 500}\n')
+            f.write('{"title": "GET /api/recommendations"}\n')
+        items = schedule(load_traffic_file(path), speed=2)
+        assert [item.offset for item in items] == [0.0, 0.0, 0.5]
+        for empty, speed in (([], 1.0), (load_traffic_file(path), 0.0)):
+            try:
+                schedule(empty, speed)
+                assert False, "an empty schedule or zero speed must be rejected"
+            except ValueError:
+                pass
+
+    def report(chat_p95, recommendations_p95):
+        endpoint = lambda p95: {'p50_ms': 1.0, 'p95_ms': p95, 'p99_ms': p95, 'error_rate': 0.0}
+        return dict(endpoint(max(chat_p95, recommendations_p95)),
+                    endpoints={'POST /api/chat': endpoint(chat_p95),
+                               'GET /api/recommendations': endpoint(recommendations_p95)})
+
+    diff = diff_reports(report(100.0, 1.0), report(150.0, 1.5), threshold=10, min_delta_ms=2)
+    assert 'POST /api/chat p95_ms' in diff['regressions']
+    assert not any(r.startswith('GET /api/recommendations') for r in diff['regressions']), "0.5 ms is noise"
+    assert diff['endpoints']['POST /api/chat']['p95_ms']['percent'] == 50.0
+    assert not diff_reports(report(100.0, 1.0), report(90.0, 1.0), threshold=10)['regressions']
+    print("   ✅ offsets scaled, empty traffic and zero speed rejected, regressions flagged")
+
+
+if __name__ == "__main__":
+    test_recorded_requests_replay_identically()
+    test_llm_answers_replay_from_the_recording()
+    test_schedule_and_diff()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the append-only chat transcript log
+"""
+
+import os
+import tempfile
+
+from transcript_log import TranscriptLog, TranscriptReader
+
+
+def test_segments_rotate_and_sessions_are_indexed():
+    """Batches land in size-rotated segments; session lookups and scans return every record"""
+
+    print("🧪 Testing transcript segments and session index")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = TranscriptLog(directory, segment_bytes=4096, flush_interval=0.01)
+        for i in range(300):
+            assert log.append(f'session-{i % 7}', f'Question {i}', f'<p>Answer {i}</p>', duration_ms=1.5)
+        log.close()
+
+        reader = TranscriptReader(directory)
+        assert len(reader.segments()) > 1 and log.segments_rotated == len(reader.segments()) - 1
+        records = list(reader.scan())
+        assert [record['message'] for record in records] == [f'Question {i}' for i in range(300)]
+        print(f"   ✅ 300 records across {len(reader.segments())} segments, in order")
+
+        session = reader.session('session-3')
+        assert [record['message'] for record in session] == [f'Question {i}' for i in range(3, 300, 7)]
+        assert session[0]['response'] == '<p>Answer 3</p>' and session[0]['duration_ms'] == 1.5
+        assert reader.session('unknown') == []
+        print("   ✅ session lookup through the indexes")
+
+        # A batch the writer has not finished yet is left out of scans and lookups
+        last = reader.segments()[-1]
+        with open(last, 'ab') as f:
+            f.write(b'{"ts": 1, "session": "session-3", "mess')
+        with open(last[:-len('.ndjson')] + '.idx', 'ab') as f:
+            f.write(b'["session-3",%d,500]\n' % os.path.getsize(last))
+        assert len(list(reader.scan())) == 300 and len(reader.session('session-3')) == len(session)
+        print("   ✅ partial writes are ignored")
+
+        restarted = TranscriptLog(directory, flush_interval=0.01)
+        restarted.append('session-3', 'After restart', 'ok')
+        restarted.close()
+        assert reader.session('session-3')[-1]['message'] == 'After restart'
+        print("   ✅ a restarted writer continues in a new segment")
+
+
+def test_append_never_blocks():
+    """A full queue drops and counts records instead of waiting for the writer"""
+
+    print("🧪 Testing non-blocking appends")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = TranscriptLog(directory, max_queue=10, flush_interval=0.01)
+        accepted = sum(log.append('s', 'q', 'a') for _ in range(5000))
+        log.close()
+        assert accepted + log.dropped == 5000 and log.dropped > 0
+        assert log.written == accepted == len(list(TranscriptReader(directory).scan()))
+        print(f"   ✅ {log.dropped} records dropped, {accepted} written")
+
+
+if __name__ == "__main__":
+    test_segments_rotate_and_sessions_are_indexed()
+    test_append_never_blocks()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the weekly digest batch generator
+"""
+
+import os
+import json
+import glob
+import zlib
+import sqlite3
+import tempfile
+
+from weekly_digest import generate, read_ndjson, read_sqlite
+
+PROFILES = [
+    {'user_id': 'u1', 'email': 'ada@example.com', 'name': 'Ada', 'skills': ['Python', 'SQL', 'Go', 'Rust'],
+     'experience_level': 'Senior', 'industry': 'Technology', 'career_goal': 'job', 'interests': ['Technology']},
+    {'user_id': 'u2', 'name': 'Grace', 'skills': ['COBOL'], 'experience_level': 'Senior', 'industry': 'Technology',
+     'career_goal': 'job', 'interests': ['Technology']},
+    {'user_id': 'u3', 'name': 'Linus', 'skills': ['C'], 'experience_level': 'Mid-Level', 'industry': 'Finance',
+     'career_goal': 'skill', 'interests': ['Leadership', 'Technology']},
+    {'user_id': 'u4', 'name': 'Barbara'},
+]
+
+
+def read_digests(directory):
+    digests = {}
+    for path in sorted(glob.glob(os.path.join(directory, 'digest-*.ndjson'))):
+        shard = int(path[-len('0000.ndjson'):-len('.ndjson')])
+        with open(path) as f:
+            for line in f:
+                digest = json.loads(line)
+                assert digest['user_id'] not in digests
+                digests[digest['user_id']] = (shard, digest)
+    return digests
+
+
+def test_digests_from_ndjson():
+    """One digest per valid profile, in its hash shard, with each bucket rendered once"""
+
+    print("🧪 Testing weekly digests from NDJSON")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'profiles.ndjson')
+        with open(source, 'w') as f:
+            for profile in PROFILES:
+                f.write(json.dumps(profile) + '\n')
+            f.write('{"name": "broken"\n\n')
+
+        out = os.path.join(directory, 'out')
+        totals = generate(read_ndjson(source), out, shards=3, workers=0, chunk_size=2)
+        assert totals['profiles'] == 4 and totals['invalid'] == 1
+        assert totals['rendered'] == 3, "u1 and u2 share a preference bucket"
+
+        digests = read_digests(out)
+        assert sorted(digests) == ['u1', 'u2', 'u3', 'u4']
+        for user_id, (shard, _) in digests.items():
+            assert shard == zlib.crc32(user_id.encode('utf-8')) % 3
+
+        ada, grace = digests['u1'][1], digests['u2'][1]
+        assert ada['email'] == 'ada@example.com' and grace['email'] is None
+        assert ada['welcome_message'].startswith('Welcome, Ada!') and 'Python, SQL, Go.' in ada['profile_summary']
+        assert ada['bucket'] == grace['bucket'] and ada['answer'] == grace['answer']
+        assert ada['answer']['question_type'] == 'remote_jobs' and ada['answer']['html']
+        assert [item['type'] for item in ada['recommendations']] == ['COURSE', 'JOB', 'EVENT', 'WORKSHOP']
+        assert digests['u3'][1]['answer']['question_type'] == 'leadership_workshops'
+        assert digests['u4'][1]['career_path'] and digests['u4'][1]['answer']['question_type'] == 'advancement'
+        print("   ✅ 4 digests, 3 bucket renders, invalid line skipped")
+
+
+def test_digests_from_sqlite_in_worker_processes():
+    """SQLite rows (JSON profile column or one column per field) go through the process pool"""
+
+    print("🧪 Testing weekly digests from SQLite")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'users.db')
+        connection = sqlite3.connect(database)
+        connection.execute('CREATE TABLE profiles (user_id TEXT, email TEXT, profile TEXT, skills TEXT)')
+        connection.execute('INSERT INTO profiles VALUES (?, ?, ?, NULL)', ('u1', 'ada@example.com', json.dumps(PROFILES[0])))
+        connection.execute('INSERT INTO profiles VALUES (?, NULL, NULL, ?)', ('u9', json.dumps(['Kotlin', 'Swift'])))
+        connection.commit()
+        connection.close()
+
+        out = os.path.join(directory, 'out')
+        rows = read_sqlite(database, 'SELECT user_id, email, profile, skills FROM profiles')
+        totals = generate(rows, out, shards=2, workers=1, chunk_size=1)
+        assert totals['profiles'] == 2
+
+        digests = read_digests(out)
+        assert digests['u1'][1]['welcome_message'].startswith('Welcome, Ada!')
+        assert 'Kotlin, Swift.' in digests['u9'][1]['profile_summary']
+        print("   ✅ SQLite rows rendered in a worker process")
+
+
+if __name__ == "__main__":
+    test_digests_from_ndjson()
+    test_digests_from_sqlite_in_worker_processes()
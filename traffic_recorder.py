@@ -0,0 +1,212 @@
+"""
+Traffic Recorder Module for LinkedIn Future Career Planning Platform
+
+This module records production-shaped traffic so it can be replayed against
+another build with traffic_replay.py:
+- every request to a recorded route is written as one JSON line in the
+  requests.jsonl layout load_test.py reads ("title": "POST /api/chat",
+  "body": {...}), plus its headers, offset from the start of the recording,
+  duration and status; non-JSON bodies such as CV uploads are kept as base64
+- every LLM generation is written to a second file, keyed by a digest of the
+  prompt together with its text and latency, so a replay can answer the same
+  prompts without calling Gemini
+- records go through an in-memory queue to a background writer; requests
+  never wait on the files, and records are dropped and counted when the
+  queue is full
+
+    TRAFFIC_RECORD_FILE=traffic.jsonl python app.py          # also writes traffic.llm.jsonl
+    LLM_REPLAY_FILE=traffic.llm.jsonl python app.py           # build under test
+    python traffic_replay.py run traffic.jsonl --report after.json
+"""
+
+import os
+import json
+import time
+import queue
+import base64
+import atexit
+import logging
+import threading
+from typing import Dict, Optional
+
+from model_router import FAST, QUALITY, RecordedBackend
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+RECORDED_ROUTES = frozenset({'/api/chat', '/api/recommendations', '/api/connect-linkedin', '/api/upload-cv'})
+RECORDED_HEADERS = ('Content-Type', 'X-Session-ID')
+
+
+def _encode(record: Dict) -> bytes:
+    # Stdlib json: the write rate is bounded by request traffic, and it keeps llm_integration cheap to import
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+class TrafficRecorder:
+    """Captures requests and LLM generations as JSON lines through a background writer"""
+
+    def __init__(self, path: str, llm_path: Optional[str] = None, max_body_bytes: int = 1024 * 1024,
+                 max_queue: int = 10000):
+        self.path = path
+        self.llm_path = llm_path
+        self.max_body_bytes = max_body_bytes
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._origin = None
+        self._sequence = 0
+        self._sequence_lock = threading.Lock()
+        self.recorded = 0
+        self.llm_recorded = 0
+        self.dropped = 0
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    def capture(self, flask_request) -> Dict:
+        """Snapshot a request's shape and body; call before the handler reads the body"""
+        now = time.perf_counter()
+        with self._sequence_lock:
+            if self._origin is None:
+                self._origin = now
+            self._sequence += 1
+            sequence = self._sequence
+
+        path = flask_request.full_path.rstrip('?')
+        record = {
+            'request_id': f'rec-{sequence:06d}',
+            'title': f'{flask_request.method} {path}',
+            'offset_ms': round((now - self._origin) * 1000, 3),
+            'headers': {name: flask_request.headers[name] for name in RECORDED_HEADERS if name in flask_request.headers}
+        }
+
+        length = flask_request.content_length
+        if length and length > self.max_body_bytes:
+            record['body_omitted'] = length
+        elif length or flask_request.method == 'POST':
+            # Cached, so the handler (and form parsing for uploads) still sees the body
+            data = flask_request.get_data()
+            if data:
+                body = _json_body(data) if flask_request.is_json else None
+                # Scalars stay as bytes: load_test.py reads a string body as JSON text
+                if isinstance(body, (dict, list)):
+                    record['body'] = body
+                else:
+                    record['body_base64'] = base64.b64encode(data).decode('ascii')
+
+        record['_started'] = now
+        return record
+
+    def finish(self, record: Dict, status: int) -> None:
+        """Queue a captured request with the response status and handling time"""
+        record['duration_ms'] = round((time.perf_counter() - record.pop('_started')) * 1000, 3)
+        record['status'] = status
+        if self._put(self.path, record):
+            self.recorded += 1
+
+    def record_llm(self, entry: Dict) -> None:
+        """RecordingBackend sink: queue one prompt's answer and latency"""
+        if self.llm_path and self._put(self.llm_path, entry):
+            self.llm_recorded += 1
+
+    def _put(self, path: str, record: Dict) -> bool:
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((path, record))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='traffic-recorder', daemon=True)
+                self._writer.start()
+                atexit.register(self.close)
+
+    def _write_loop(self) -> None:
+        files = {}
+        try:
+            while not self._stopping.is_set() or not self._queue.empty():
+                try:
+                    items = [self._queue.get(timeout=0.5)]
+                except queue.Empty:
+                    continue
+                while len(items) < 512:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                for path, record in items:
+                    try:
+                        if path not in files:
+                            files[path] = open(path, 'ab')
+                        files[path].write(_encode(record))
+                    except (OSError, TypeError, ValueError) as e:
+                        self.dropped += 1
+                        logger.error("Could not record traffic to %s: %s", path, e)
+                for f in files.values():
+                    f.flush()
+        finally:
+            for f in files.values():
+                f.close()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write everything still queued and stop the writer"""
+        self._stopping.set()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout)
+
+    def get_stats(self) -> Dict:
+        return {
+            'path': self.path,
+            'llm_path': self.llm_path,
+            'recorded': self.recorded,
+            'llm_recorded': self.llm_recorded,
+            'dropped': self.dropped,
+            'queued': self._queue.qsize()
+        }
+
+
+def _json_body(data: bytes):
+    try:
+        return json.loads(data)
+    except ValueError:
+        # Malformed JSON is replayed byte for byte instead
+        return None
+
+
+def load_recorded_backends(path: str, latency_scale: float = 1.0) -> Dict[str, RecordedBackend]:
+    """One RecordedBackend per tier from an LLM recording; a tier with no recordings uses all of them"""
+    by_tier = {}
+    everything = {}
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            by_tier.setdefault(entry.get('tier', FAST), {})[entry['prompt_key']] = entry
+            everything[entry['prompt_key']] = entry
+    return {tier: RecordedBackend(f'recorded-{tier}', by_tier.get(tier) or everything, latency_scale)
+            for tier in (FAST, QUALITY)}
+
+
+def create_traffic_recorder() -> Optional[TrafficRecorder]:
+    """Build the configured recorder, or None when TRAFFIC_RECORD_FILE is not set"""
+    path = os.getenv('TRAFFIC_RECORD_FILE')
+    if not path:
+        return None
+    root, _ = os.path.splitext(path)
+    return TrafficRecorder(
+        path,
+        llm_path=os.getenv('TRAFFIC_RECORD_LLM_FILE', root + '.llm.jsonl'),
+        max_body_bytes=int(os.getenv('TRAFFIC_RECORD_MAX_BODY_BYTES', str(1024 * 1024))),
+        max_queue=int(os.getenv('TRAFFIC_RECORD_QUEUE_SIZE', '10000'))
+    )
+
+
+# Global instance for easy access
+traffic_recorder = create_traffic_recorder()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Traffic replayer for the LinkedIn Future platform
+
+Plays a file written by traffic_recorder.py back against a running instance,
+keeping the recorded pacing (or scaling it with --speed), and compares the
+latency reports of two runs. Start the build under test with
+LLM_REPLAY_FILE pointing at the recording's .llm.jsonl file so LLM calls are
+answered from the recording instead of Gemini.
+
+    LLM_REPLAY_FILE=traffic.llm.jsonl python app.py
+    python traffic_replay.py run traffic.jsonl --report before.json
+    python traffic_replay.py run traffic.jsonl --speed 4 --report after.json
+    python traffic_replay.py diff before.json after.json --threshold 10 --min-delta-ms 2
+
+Reports use the load_test.py layout, with latency measured from each request's
+scheduled send time.
+"""
+
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from load_test import Results, TrafficItem, load_traffic_file, print_report, send, summarize
+
+PERCENTILES = ('p50_ms', 'p95_ms', 'p99_ms')
+
+
+def positive_float(value: str) -> float:
+    """argparse type for rates that must be above zero"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a number")
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def schedule(items: List[TrafficItem], speed: float) -> List[TrafficItem]:
+    """Items in send order; ones without a recorded offset follow the previous one immediately"""
+    if not items:
+        raise ValueError("No requests to replay")
+    if not speed > 0:
+        raise ValueError(f"Replay speed must be greater than 0, got {speed}")
+    offset = 0.0
+    for item in items:
+        if item.offset is None:
+            item.offset = offset
+        offset = item.offset
+    items = sorted(items, key=lambda item: item.offset)
+    start = items[0].offset
+    for item in items:
+        item.offset = (item.offset - start) / speed
+    return items
+
+
+def replay(base_url: str, items: List[TrafficItem], concurrency: int, timeout: float) -> Dict:
+    """Send every item at its offset and collect latencies"""
+    results = Results()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def worker(item: TrafficItem, scheduled: float) -> None:
+        status = send(base_url, item, timeout)
+        results.add(item.label, time.perf_counter() - scheduled, status)
+
+    start = time.perf_counter()
+    for item in items:
+        scheduled = start + item.offset
+        now = time.perf_counter()
+        if scheduled > now:
+            time.sleep(scheduled - now)
+        executor.submit(worker, item, scheduled)
+
+    executor.shutdown(wait=True)
+    elapsed = time.perf_counter() - start
+    span = items[-1].offset
+    return summarize(results, len(items), elapsed, round(len(items) / span, 2) if span else float(len(items)))
+
+
+def diff_reports(before: Dict, after: Dict, threshold: float, min_delta_ms: float = 2.0) -> Dict:
+    """Per-endpoint percentile changes; a slowdown above threshold percent and min_delta_ms is a regression"""
+    endpoints = {}
+    regressions = []
+    rows = [('all', before, after)] + [
+        (label, before['endpoints'].get(label), after['endpoints'].get(label))
+        for label in sorted(set(before['endpoints']) | set(after['endpoints']))
+    ]
+    for label, old, new in rows:
+        if old is None or new is None:
+            endpoints[label] = {'only_in': 'after' if old is None else 'before'}
+            continue
+        changes = {}
+        for key in PERCENTILES:
+            delta = new[key] - old[key]
+            percent = round(delta / old[key] * 100, 1) if old[key] else 0.0
+            changes[key] = {'before': old[key], 'after': new[key], 'delta': round(delta, 2), 'percent': percent}
+            if percent > threshold and delta > min_delta_ms:
+                regressions.append(f'{label} {key}')
+        changes['error_rate'] = {'before': old['error_rate'], 'after': new['error_rate']}
+        endpoints[label] = changes
+    return {'threshold_percent': threshold, 'min_delta_ms': min_delta_ms, 'regressions': regressions,
+            'endpoints': endpoints}
+
+
+def print_diff(diff: Dict) -> None:
+    print(f"\n📊 Latency diff (regression threshold {diff['threshold_percent']}% and {diff['min_delta_ms']} ms)")
+    print("-" * 112)
+    print(f"{'endpoint':<40}" + ''.join(f"{key + ' before → after':>24}" for key in PERCENTILES) + f"{'err% Δ':>8}")
+    for label, changes in diff['endpoints'].items():
+        if 'only_in' in changes:
+            print(f"{label:<40}only in the {changes['only_in']} run")
+            continue
+        cells = ''.join(f"{changes[key]['before']:>9} → {changes[key]['after']:<8}{changes[key]['percent']:>+5.0f}%"
+                        for key in PERCENTILES)
+        errors = (changes['error_rate']['after'] - changes['error_rate']['before']) * 100
+        print(f"{label:<40}{cells}{errors:>+7.2f}%")
+    print("-" * 112)
+    if diff['regressions']:
+        print(f"❌ Regressions: {', '.join(diff['regressions'])}")
+    else:
+        print("✅ No percentile regressed beyond the threshold")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Replay recorded traffic and compare latency reports')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='replay a recording against a running instance')
+    run.add_argument('traffic', help='file written by traffic_recorder.py (TRAFFIC_RECORD_FILE)')
+    run.add_argument('--url', default='http://127.0.0.1:5000', help='base URL of the app under test')
+    run.add_argument('--speed', type=positive_float, default=1.0, help='replay rate relative to the recording (2 = twice as fast)')
+    run.add_argument('--concurrency', type=int, default=256, help='maximum requests in flight')
+    run.add_argument('--timeout', type=float, default=30.0, help='per-request timeout in seconds')
+    run.add_argument('--report', help='write the JSON report to this file')
+
+    diff = commands.add_parser('diff', help='compare two replay (or load_test.py) reports')
+    diff.add_argument('before')
+    diff.add_argument('after')
+    diff.add_argument('--threshold', type=float, default=10.0, help='percent slowdown counted as a regression')
+    diff.add_argument('--min-delta-ms', type=float, default=2.0, help='ignore slowdowns smaller than this')
+    diff.add_argument('--report', help='write the JSON diff to this file')
+    diff.add_argument('--fail-on-regression', action='store_true', help='exit with status 1 on any regression')
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        try:
+            items = schedule(load_traffic_file(args.traffic), args.speed)
+        except ValueError as e:
+            # Empty or fully filtered recordings
+            run.error(str(e))
+        print(f"🚀 Replaying {len(items)} requests from {args.traffic} against {args.url} "
+              f"at {args.speed}x ({items[-1].offset:.1f}s)")
+        report = replay(args.url.rstrip('/'), items, args.concurrency, args.timeout)
+        report['source'] = args.traffic
+        report['speed'] = args.speed
+        print_report(report)
+    else:
+        with open(args.before) as f:
+            before = json.load(f)
+        with open(args.after) as f:
+            after = json.load(f)
+        report = diff_reports(before, after, args.threshold, args.min_delta_ms)
+        print_diff(report)
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to {args.report}")
+
+    if args.command == 'diff' and args.fail_on_regression and report['regressions']:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
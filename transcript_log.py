@@ -0,0 +1,346 @@
+"""
+Transcript Log Module for LinkedIn Future Career Planning Platform
+
+This module keeps an append-only log of chat exchanges for analytics and
+replay without adding latency to /api/chat:
+- request threads only put a record on an in-memory queue; when the queue is
+  full the record is dropped and counted, never waited on
+- one background writer drains the queue in batches and appends them as JSON
+  lines to the current segment, rotating to a new segment by size and age
+- every segment has a sidecar index of (session, offset, length) entries, so
+  one session's exchanges are read without scanning the segment
+- TranscriptReader maps segments with mmap, so scans of gigabytes of history
+  go through the page cache instead of Python file buffers
+
+    TRANSCRIPT_DIR=/var/lib/career-transcripts python app.py
+    python transcript_log.py /var/lib/career-transcripts --session 6f1c...
+"""
+
+import os
+import re
+import mmap
+import time
+import queue
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import msgspec
+
+import metrics
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+SEGMENT_PATTERN = re.compile(r'^transcripts-(\d{8})\.ndjson$')
+
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder()
+
+
+def segment_path(directory: str, sequence: int) -> str:
+    return os.path.join(directory, f'transcripts-{sequence:08d}.ndjson')
+
+
+def index_path(segment: str) -> str:
+    return segment[:-len('.ndjson')] + '.idx'
+
+
+def list_segments(directory: str) -> List[Tuple[int, str]]:
+    """(sequence, path) of every segment in directory, oldest first"""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    segments = []
+    for name in names:
+        match = SEGMENT_PATTERN.match(name)
+        if match:
+            segments.append((int(match.group(1)), os.path.join(directory, name)))
+    return sorted(segments)
+
+
+class TranscriptLog:
+    """Non-blocking appender with a background batch writer and segment rotation"""
+
+    def __init__(self, directory: str, segment_bytes: int = 64 * 1024 * 1024, segment_seconds: float = 3600.0,
+                 batch_size: int = 512, flush_interval: float = 0.5, max_queue: int = 10000):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.written = 0
+        self.segments_rotated = 0
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self._stopping = threading.Event()
+        # Only the writer thread touches the open segment
+        self._segment = None
+        self._index = None
+        self._segment_sequence = 0
+        self._segment_opened = 0.0
+
+    def append(self, session_id: Optional[str], user_message: str, response: str, **fields) -> bool:
+        """Queue one exchange for writing; returns False when it was dropped"""
+        self._ensure_writer()
+        record = {'ts': time.time(), 'session': session_id or '', 'message': user_message,
+                  'response': str(response)}
+        record.update(fields)
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._writer = threading.Thread(target=self._write_loop, name='transcript-writer', daemon=True)
+                self._writer.start()
+                atexit.register(self.close)
+
+    def _write_loop(self) -> None:
+        while not self._stopping.is_set() or not self._queue.empty():
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                batch = []
+            while batch and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._maybe_rotate()
+                if batch:
+                    self._write_batch(batch)
+            except (OSError, TypeError, msgspec.EncodeError) as e:
+                self.dropped += len(batch)
+                logger.error("Could not write %d transcript records: %s", len(batch), e)
+        self._close_segment()
+
+    def _write_batch(self, batch: List[Dict]) -> None:
+        """Append a batch, splitting it where the segment fills up"""
+        offset = self._segment.tell()
+        lines = []
+        index_lines = []
+        for record in batch:
+            line = _encoder.encode(record) + b'\n'
+            lines.append(line)
+            index_lines.append(_encoder.encode([record['session'], offset, len(line)]) + b'\n')
+            offset += len(line)
+            if offset >= self.segment_bytes:
+                self._flush(lines, index_lines)
+                lines, index_lines = [], []
+                self._rotate()
+                offset = 0
+        if lines:
+            self._flush(lines, index_lines)
+
+    def _flush(self, lines: List[bytes], index_lines: List[bytes]) -> None:
+        # Data first, then the index pointing at it, one write per file
+        self._segment.write(b''.join(lines))
+        self._segment.flush()
+        self._index.write(b''.join(index_lines))
+        self._index.flush()
+        self.written += len(lines)
+
+    def _maybe_rotate(self) -> None:
+        if self._segment is None:
+            self._open_segment(self._next_sequence())
+        elif self._segment.tell() and time.monotonic() - self._segment_opened >= self.segment_seconds:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._close_segment()
+        self._open_segment(self._segment_sequence + 1)
+        self.segments_rotated += 1
+
+    def _next_sequence(self) -> int:
+        # A restarted writer starts a fresh segment rather than appending to one a reader may have indexed
+        segments = list_segments(self.directory)
+        return segments[-1][0] + 1 if segments else 1
+
+    def _open_segment(self, sequence: int) -> None:
+        path = segment_path(self.directory, sequence)
+        self._segment = open(path, 'ab')
+        self._index = open(index_path(path), 'ab')
+        self._segment_sequence = sequence
+        self._segment_opened = time.monotonic()
+
+    def _close_segment(self) -> None:
+        for f in (self._segment, self._index):
+            if f is not None:
+                f.close()
+        self._segment = self._index = None
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write everything still queued and stop the writer"""
+        self._stopping.set()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout)
+
+    def get_stats(self) -> Dict:
+        return {
+            'directory': self.directory,
+            'written': self.written,
+            'dropped': self.dropped,
+            'queued': self._queue.qsize(),
+            'segment': self._segment_sequence,
+            'segments_rotated': self.segments_rotated,
+            'segment_bytes': self.segment_bytes,
+            'segment_seconds': self.segment_seconds
+        }
+
+
+class TranscriptReader:
+    """Reads transcript segments through mmap; safe to run while the app is writing"""
+
+    def __init__(self, directory: str, cached_indexes: int = 64):
+        self.directory = directory
+        self.cached_indexes = cached_indexes
+        # segment path -> (index file size, {session: [(offset, length), ...]})
+        self._indexes = OrderedDict()
+
+    def segments(self) -> List[str]:
+        return [path for _, path in list_segments(self.directory)]
+
+    def scan(self, since: Optional[float] = None) -> Iterator[Dict]:
+        """Every complete record, oldest first; since skips records older than that timestamp"""
+        for path in self.segments():
+            for line in self._lines(path):
+                record = _decoder.decode(line)
+                if since is None or record.get('ts', 0) >= since:
+                    yield record
+
+    def session(self, session_id: str) -> List[Dict]:
+        """Every recorded exchange of one session, oldest first, read through the segment indexes"""
+        records = []
+        for path in self.segments():
+            entries = self._index(path).get(session_id)
+            if not entries:
+                continue
+            with _mapped(path) as data:
+                for offset, length in entries:
+                    # Index entries are written after their data, but never trust them past the end of the file
+                    if data is not None and offset + length <= len(data):
+                        records.append(_decoder.decode(data[offset:offset + length]))
+        return records
+
+    def _lines(self, path: str) -> Iterator[bytes]:
+        with _mapped(path) as data:
+            if data is None:
+                return
+            start = 0
+            while True:
+                end = data.find(b'\n', start)
+                # A missing newline is a batch the writer has not finished; leave it for the next scan
+                if end < 0:
+                    return
+                yield data[start:end]
+                start = end + 1
+
+    def _index(self, path: str) -> Dict[str, List[Tuple[int, int]]]:
+        idx = index_path(path)
+        try:
+            size = os.path.getsize(idx)
+        except OSError:
+            return {}
+        cached = self._indexes.get(path)
+        if cached is not None and cached[0] == size:
+            self._indexes.move_to_end(path)
+            return cached[1]
+
+        sessions = {}
+        with _mapped(idx) as data:
+            if data is not None:
+                start = 0
+                while True:
+                    end = data.find(b'\n', start)
+                    if end < 0:
+                        break
+                    session_id, offset, length = _decoder.decode(data[start:end])
+                    sessions.setdefault(session_id, []).append((offset, length))
+                    start = end + 1
+        self._indexes[path] = (size, sessions)
+        while len(self._indexes) > self.cached_indexes:
+            self._indexes.popitem(last=False)
+        return sessions
+
+
+@contextmanager
+def _mapped(path: str) -> Iterator[Optional[mmap.mmap]]:
+    """Map a whole file read-only; yields None for a missing or empty file"""
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        yield None
+        return
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            yield None
+            return
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def _transcript_gauges():
+    yield 'transcript_records_dropped', 'Chat transcript records dropped because the write queue was full', {}, transcript_log.dropped
+    yield 'transcript_queue_depth', 'Chat transcript records waiting for the background writer', {}, transcript_log._queue.qsize()
+
+
+def create_transcript_log() -> Optional[TranscriptLog]:
+    """Build the configured log, or None when TRANSCRIPT_DIR is not set"""
+    directory = os.getenv('TRANSCRIPT_DIR')
+    if not directory:
+        return None
+    return TranscriptLog(
+        directory,
+        segment_bytes=int(os.getenv('TRANSCRIPT_SEGMENT_MB', '64')) * 1024 * 1024,
+        segment_seconds=float(os.getenv('TRANSCRIPT_SEGMENT_SECONDS', '3600')),
+        max_queue=int(os.getenv('TRANSCRIPT_QUEUE_SIZE', '10000'))
+    )
+
+
+# Global instance for easy access
+transcript_log = create_transcript_log()
+if transcript_log is not None:
+    metrics.registry.register_gauges(_transcript_gauges)
+
+
+if __name__ == "__main__":
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scan or look up recorded chat transcripts")
+    parser.add_argument('directory')
+    parser.add_argument('--session', help="print one session's exchanges instead of scanning")
+    parser.add_argument('--since', type=float, help="only records at or after this Unix timestamp")
+    args = parser.parse_args()
+
+    reader = TranscriptReader(args.directory)
+    if args.session:
+        for record in reader.session(args.session):
+            sys.stdout.buffer.write(_encoder.encode(record) + b'\n')
+    else:
+        started = time.perf_counter()
+        records = 0
+        sessions = set()
+        for record in reader.scan(args.since):
+            records += 1
+            sessions.add(record.get('session'))
+        elapsed = time.perf_counter() - started
+        print(f"{records} records, {len(sessions)} sessions, {len(reader.segments())} segments "
+              f"scanned in {elapsed:.2f}s")
@@ -0,0 +1,121 @@
+"""
+Warm-up Module for LinkedIn Future Career Planning Platform
+
+This module runs a list of warm-up steps before a worker takes traffic, so the
+first real requests do not pay for cold caches and template compilation. It
+also tracks readiness for the /readyz endpoint: the worker reports not-ready
+until every step has run.
+
+The built-in steps render every predefined answer for the default preferences
+and for each sample LinkedIn profile, which fills the predefined render cache,
+and load the Gemini SDK that module imports leave for first use.
+The app registers its own steps (templates, recommendation index).
+"""
+
+import time
+import logging
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from predefined_responses import predefined_manager
+from linkedin_profile_analyzer import linkedin_analyzer
+from llm_integration import llm_generator
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def warm_predefined_responses() -> int:
+    """Render every main question for the default preferences and each sample profile"""
+    preference_sets = [dict(predefined_manager.default_preferences)]
+    for profile_id in linkedin_analyzer.sample_profiles:
+        profile_data = linkedin_analyzer.analyze_profile(f'https://www.linkedin.com/in/{profile_id}/')
+        if profile_data:
+            preference_sets.append(linkedin_analyzer.update_user_preferences(profile_data))
+
+    rendered = 0
+    for preferences in preference_sets:
+        for question_type, variations in predefined_manager.main_questions.items():
+            # Go through the same decision path a chat request takes
+            predefined_manager.should_use_predefined_response(variations[0], preferences)
+            predefined_manager.get_personality_aware_response(question_type, preferences)
+            rendered += 1
+    return rendered
+
+
+def warm_llm_client() -> bool:
+    """Import and configure the Gemini SDK, which is otherwise deferred to the first LLM call"""
+    if not llm_generator.is_available:
+        return False
+    llm_generator.router.warm()
+    return True
+
+
+class Warmup:
+    """Runs registered warm-up steps once and reports readiness"""
+
+    def __init__(self):
+        self.steps: List[Tuple[str, Callable[[], object]]] = [
+            ('predefined_responses', warm_predefined_responses),
+            ('llm_client', warm_llm_client)
+        ]
+        self.results = {}
+        self.ready = False
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add_step(self, name: str, func: Callable[[], object]) -> None:
+        self.steps.append((name, func))
+
+    def run(self) -> None:
+        """Run every step in order; a failing step is logged and does not block readiness"""
+        if self._claim():
+            self._run_steps()
+
+    def run_in_background(self) -> None:
+        """Start the steps on a daemon thread; /readyz stays 503 until they finish"""
+        if self._claim():
+            self._thread = threading.Thread(target=self._run_steps, name='warmup', daemon=True)
+            self._thread.start()
+
+    def skip(self) -> None:
+        """Report ready without running any step"""
+        if self._claim():
+            self.finished_at = self.started_at
+            self.ready = True
+
+    def _claim(self) -> bool:
+        with self._lock:
+            if self.started_at is not None:
+                return False
+            self.started_at = time.time()
+            return True
+
+    def _run_steps(self) -> None:
+        for name, func in self.steps:
+            started = time.perf_counter()
+            try:
+                result = func()
+                self.results[name] = {'seconds': round(time.perf_counter() - started, 4), 'result': result}
+            except Exception as e:
+                logger.error("Warm-up step %s failed: %s", name, e)
+                self.results[name] = {'seconds': round(time.perf_counter() - started, 4), 'error': str(e)}
+
+        self.finished_at = time.time()
+        self.ready = True
+        logger.info("Warm-up finished in %.3fs", self.finished_at - self.started_at)
+
+    def get_state(self) -> Dict:
+        return {
+            'ready': self.ready,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'seconds': round(self.finished_at - self.started_at, 4) if self.finished_at else None,
+            'steps': dict(self.results)
+        }
+
+
+# Global instance for easy access
+warmup = Warmup()
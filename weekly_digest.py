@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Weekly digest generator for the LinkedIn Future platform
+
+Builds one personalized career digest per user offline. Each digest holds the
+profile suggestions, the top recommendations and a predefined-style answer for
+the user's goal.
+- profiles stream from an NDJSON file or a SQLite query in fixed-size chunks;
+  only a bounded number of chunks is in flight, so memory does not grow with
+  the input
+- worker processes group each chunk by canonical preference bucket
+  (PreferenceKey) and render the bucket-level parts once, keeping recent
+  buckets across chunks; only the name and skills are filled in per user
+- digests are written as NDJSON to shards picked by a hash of the user ID,
+  so a user always lands in the same shard
+
+    python weekly_digest.py profiles.ndjson --out digests/ --shards 16
+    python weekly_digest.py users.db --query "SELECT user_id, email, profile FROM profiles" --out digests/
+    python weekly_digest.py --generate 200000 profiles.ndjson     # synthetic input for benchmarking
+
+An NDJSON line is a profile in the /api/connect-linkedin shape, plus optional
+`user_id` and `email`. A SQLite row may hold the profile as a JSON `profile`
+column, as one column per field (`skills` and `interests` as JSON arrays),
+or both.
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import sqlite3
+import argparse
+import itertools
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import msgspec
+
+from preferences import normalize_preferences
+from profile_record import ProfileRecord
+
+DIGEST_TITLE = 'Your weekly career digest'
+DEFAULT_QUESTION_TYPE = 'advancement'
+
+_encoder = msgspec.json.Encoder()
+
+# Per worker process: modules imported by _init_worker and the bucket renders it keeps across chunks
+_worker = {}
+
+
+def read_ndjson(path: str) -> Iterator[bytes]:
+    """Raw profile lines; workers decode them, so the parent only splits lines"""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield line
+
+
+def read_sqlite(path: str, query: str) -> Iterator[Dict]:
+    connection = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    connection.row_factory = sqlite3.Row
+    try:
+        for row in connection.execute(query):
+            yield dict(row)
+    finally:
+        connection.close()
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _init_worker(cache_size: int, top: int) -> None:
+    # Per-profile INFO lines would dominate a batch run; warnings still show
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+    from app import QUESTION_INTENT_GOALS, lookup_recommendations
+    from predefined_responses import predefined_manager
+    from linkedin_profile_analyzer import linkedin_analyzer
+
+    _worker.update(
+        analyzer=linkedin_analyzer,
+        predefined=predefined_manager,
+        recommendations=lookup_recommendations,
+        question_types={goal: question_type for question_type, goal in QUESTION_INTENT_GOALS.items()},
+        buckets=OrderedDict(),
+        cache_size=cache_size,
+        top=top
+    )
+
+
+def _profile_fields(item) -> Dict:
+    """One input item (raw NDJSON line or SQLite row) as a profile dict"""
+    if isinstance(item, bytes):
+        return msgspec.json.decode(item)
+    data = dict(item)
+    nested = data.pop('profile', None)
+    if nested:
+        data.update(json.loads(nested))
+    for field in ('skills', 'interests'):
+        if isinstance(data.get(field), str):
+            data[field] = json.loads(data[field])
+    return data
+
+
+def _render_bucket(preferences: Dict, suggestions: Dict) -> Dict:
+    """Everything in a digest that depends only on the preference bucket"""
+    key = preferences.key
+    goal = key.get('goal', 'advancement')
+    question_type = _worker['question_types'].get(goal, DEFAULT_QUESTION_TYPE)
+
+    recommendations = _worker['recommendations'](key.get('career_level', ''), list(key.get('interests', ())), goal)
+    top = [item for items in recommendations.values() for item in items[:_worker['top']]]
+
+    # The default (not LinkedIn-personalized) rendering reads only bucket fields
+    answer_preferences = normalize_preferences({field: value for field, value in preferences.items()
+                                                if field not in ('linkedin_connected', 'profile_data')})
+    answer = _worker['predefined'].get_personality_aware_response(question_type, answer_preferences)
+
+    return {
+        'bucket': key.digest,
+        'recommended_questions': suggestions['recommended_questions'],
+        'skill_gaps': suggestions['skill_gaps'],
+        'career_path': suggestions['career_path'],
+        'recommendations': top,
+        'answer': {'question_type': question_type, 'html': str(answer)}
+    }
+
+
+def _bucket_for(preferences: Dict, suggestions: Dict) -> Tuple[Dict, bool]:
+    buckets = _worker['buckets']
+    key = preferences.key
+    bucket = buckets.get(key)
+    if bucket is not None:
+        buckets.move_to_end(key)
+        return bucket, False
+    bucket = buckets[key] = _render_bucket(preferences, suggestions)
+    if len(buckets) > _worker['cache_size']:
+        buckets.popitem(last=False)
+    return bucket, True
+
+
+def render_chunk(items: List, shards: int) -> Tuple[Dict[str, int], List[bytes]]:
+    """Digests for one chunk as NDJSON bytes per shard, with counts"""
+    analyzer = _worker['analyzer']
+    # Group first, so each bucket's parts are looked up or rendered once per chunk
+    groups = {}
+    invalid = 0
+    for item in items:
+        try:
+            data = _profile_fields(item)
+            record = ProfileRecord.from_dict(data)
+        except (ValueError, TypeError, msgspec.DecodeError):
+            invalid += 1
+            continue
+        preferences = normalize_preferences(analyzer.update_user_preferences(record))
+        groups.setdefault(preferences.key, []).append((data, record, preferences))
+
+    output = [[] for _ in range(shards)]
+    rendered = 0
+    for members in groups.values():
+        bucket = None
+        for data, record, preferences in members:
+            # Cheap string formatting; its name and skills parts are the only per-user content
+            suggestions = analyzer.get_personalized_suggestions(record)
+            if bucket is None:
+                bucket, fresh = _bucket_for(preferences, suggestions)
+                rendered += fresh
+            user_id = str(data.get('user_id') or record.profile_id or record.render_fields()[0])
+            digest = {
+                'user_id': user_id,
+                'email': data.get('email'),
+                'title': DIGEST_TITLE,
+                'welcome_message': suggestions['welcome_message'],
+                'profile_summary': suggestions['profile_summary']
+            }
+            digest.update(bucket)
+            output[zlib.crc32(user_id.encode('utf-8')) % shards].append(_encoder.encode(digest) + b'\n')
+
+    counts = {'profiles': len(items) - invalid, 'invalid': invalid, 'buckets': len(groups), 'rendered': rendered}
+    return counts, [b''.join(lines) for lines in output]
+
+
+def generate(items: Iterable, out_dir: str, shards: int = 8, workers: Optional[int] = None,
+             chunk_size: int = 2000, cache_size: int = 16384, top: int = 1) -> Dict[str, int]:
+    """Write digest shards for every profile in items; workers=0 runs in this process"""
+    os.makedirs(out_dir, exist_ok=True)
+    files = [open(os.path.join(out_dir, f'digest-{shard:04d}.ndjson'), 'wb') for shard in range(shards)]
+    totals = {'profiles': 0, 'invalid': 0, 'buckets': 0, 'rendered': 0}
+
+    def write(result) -> None:
+        counts, blobs = result
+        for name, value in counts.items():
+            totals[name] += value
+        for f, blob in zip(files, blobs):
+            if blob:
+                f.write(blob)
+
+    try:
+        if workers == 0:
+            _init_worker(cache_size, top)
+            for chunk in chunked(items, chunk_size):
+                write(render_chunk(chunk, shards))
+        else:
+            workers = workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(cache_size, top)) as pool:
+                pending = deque()
+                for chunk in chunked(items, chunk_size):
+                    # Bounded read-ahead: the input is never loaded much faster than it is rendered
+                    if len(pending) >= workers * 2:
+                        write(pending.popleft().result())
+                    pending.append(pool.submit(render_chunk, chunk, shards))
+                while pending:
+                    write(pending.popleft().result())
+    finally:
+        for f in files:
+            f.close()
+    return totals
+
+
+def write_synthetic_profiles(path: str, count: int, seed: int = 0) -> None:
+    from benchmark_profile_memory import synthetic_profiles
+
+    with open(path, 'w') as f:
+        for i, document in enumerate(synthetic_profiles(count, seed)):
+            profile = json.loads(document)
+            profile['user_id'] = f'u{i}'
+            profile['email'] = f'user{i}@example.com'
+            f.write(json.dumps(profile) + '\n')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Generate weekly career digests for many users')
+    parser.add_argument('source', help='NDJSON profile file, or a SQLite database with --query')
+    parser.add_argument('--query', help='SQLite query returning one profile per row')
+    parser.add_argument('--out', default='digests', help='output directory for the digest shards')
+    parser.add_argument('--shards', type=int, default=8, help='number of output NDJSON files')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count, 0 = in-process)')
+    parser.add_argument('--chunk-size', type=int, default=2000, help='profiles per unit of work')
+    parser.add_argument('--cache-size', type=int, default=16384, help='preference buckets each worker keeps rendered')
+    parser.add_argument('--top', type=int, default=1, help='recommendations per category in each digest')
+    parser.add_argument('--generate', type=int, metavar='N', help='write N synthetic profiles to SOURCE and exit')
+    args = parser.parse_args()
+
+    if args.generate:
+        write_synthetic_profiles(args.source, args.generate)
+        print(f"💾 Wrote {args.generate} synthetic profiles to {args.source}")
+        return 0
+
+    items = read_sqlite(args.source, args.query) if args.query else read_ndjson(args.source)
+    started = time.perf_counter()
+    totals = generate(items, args.out, args.shards, args.workers, args.chunk_size, args.cache_size, args.top)
+    elapsed = time.perf_counter() - started
+
+    rate = totals['profiles'] / elapsed * 60 if elapsed else 0.0
+    print(f"📬 {totals['profiles']} digests in {elapsed:.1f}s ({rate:,.0f} profiles/min) "
+          f"to {args.shards} shards in {args.out}")
+    print(f"   {totals['rendered']} bucket renders for {totals['buckets']} chunk buckets, "
+          f"{totals['invalid']} invalid profiles skipped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
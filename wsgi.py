@@ -0,0 +1,12 @@
+"""
+WSGI entry point for LinkedIn Future Career Planning Platform
+
+    gunicorn wsgi:app
+
+Importing app has no background side effects; this module starts the warm-up
+so /readyz turns 200 once the worker is warm.
+"""
+
+from app import app, start_warmup
+
+start_warmup()